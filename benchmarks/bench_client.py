@@ -0,0 +1,36 @@
+"""
+End-to-end benchmarks of `Shlink` against the local stand-in server.
+
+Run with `python -m benchmarks.bench_client`.
+"""
+import itertools
+from typing import Dict
+
+from benchmarks.server import Config, StandInServer
+from benchmarks.timing import measure, report
+from shlink.client.client import Shlink
+
+
+def run(scale: float = 1.0, latency: float = 0.0) -> Dict[str, Dict[str, float]]:
+    per_page = max(1, int(1000 * scale))
+    visits = max(1, int(5000 * scale))
+    config = Config(short_urls=per_page * 10, visits=visits * 4, tags=per_page, latency=latency)
+    counter = itertools.count()
+
+    with StandInServer(config) as server, Shlink(server.url, "bench-key") as client:
+        return {
+            "get_short_urls": measure(lambda: client.get_short_urls(itemsPerPage=per_page), items=per_page),
+            "create_short_url": measure(
+                lambda: client.create_short_url(f"https://example.com/{next(counter)}"), number=200, warmup=10
+            ),
+            "get_code_visits": measure(lambda: client.get_code_visits("abc", itemsPerPage=visits), items=visits),
+            "get_code_visits stream": measure(
+                lambda: sum(1 for _ in client.get_code_visits("abc", itemsPerPage=visits, stream=True)),
+                items=visits,
+            ),
+            "tag_stats": measure(lambda: client.tag_stats(itemsPerPage=per_page), items=per_page),
+        }
+
+
+if __name__ == "__main__":
+    report(run())
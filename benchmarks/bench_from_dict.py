@@ -0,0 +1,54 @@
+"""
+Compare the compiled `from_dict` decoders against the generic `__init__` path.
+
+Run with `python -m benchmarks.bench_from_dict`.
+"""
+import timeit
+from contextlib import contextmanager
+
+from benchmarks.payloads import short_urls_page, visits_page
+from shlink.client.utils.mixins import DictSerializationMixin
+from shlink.models.short import ShortUrlsView
+from shlink.models.visits import VisitsView
+
+
+def _subclasses(cls):
+    for sub in cls.__subclasses__():
+        yield sub
+        yield from _subclasses(sub)
+
+
+@contextmanager
+def generic_decoders():
+    """Route every model through the generic `__init__` path, as before compiled decoders."""
+    compiled = {cls: cls._get_decoder() for cls in _subclasses(DictSerializationMixin)}
+    for cls in compiled:
+        cls._decoder = cls._from_dict_generic
+    try:
+        yield
+    finally:
+        for cls, decoder in compiled.items():
+            cls._decoder = decoder
+
+
+def bench(name, decode, payload, items, number=5):
+    # `_process_dict` pops the wrapper key, so hand every run a fresh outer dict
+    key, inner = next(iter(payload.items()))
+    seconds = min(timeit.repeat(lambda: decode({key: inner}), number=number, repeat=3)) / number
+    print(f"{name:<28} {seconds * 1000:8.2f} ms/page {items / seconds:12,.0f} items/s")
+    return seconds
+
+
+def main():
+    for view, payload, items in [
+        (VisitsView, visits_page(5000), 5000),
+        (ShortUrlsView, short_urls_page(1000), 1000),
+    ]:
+        with generic_decoders():
+            generic = bench(f"{view.__name__} generic", view.from_dict, payload, items)
+        compiled = bench(f"{view.__name__} compiled", view.from_dict, payload, items)
+        print(f"{'speedup':<28} {generic / compiled:8.2f}x\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Time taken to import the client, as reported by `python -X importtime` in fresh interpreters.
+
+Run with `python -m benchmarks.bench_import`.
+"""
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict
+
+from benchmarks.timing import report
+
+MODULES = ("shlink.client.client", "shlink.models.visits")
+
+
+def import_time(module: str) -> float:
+    """Seconds a fresh interpreter spends importing `module` and everything it imports."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True, check=True
+    ).stderr
+    match = re.search(rf"^import time:\s+\d+ \|\s+(\d+) \|\s*{re.escape(module)}$", stderr, re.M)
+    return int(match.group(1)) / 1e6
+
+
+def run(scale: float = 1.0) -> Dict[str, Dict[str, float]]:
+    number = max(3, int(20 * scale))
+    results = {}
+    for module in MODULES:
+        samples = sorted(import_time(module) for _ in range(number))
+        results[f"import {module}"] = {
+            "ops": number / sum(samples),
+            "p50_ms": statistics.median(samples) * 1000,
+            "p95_ms": samples[min(len(samples) - 1, int(len(samples) * 0.95))] * 1000,
+        }
+    return results
+
+
+if __name__ == "__main__":
+    report(run())
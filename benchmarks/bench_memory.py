@@ -0,0 +1,50 @@
+"""
+Memory held by decoded listings, per item, measured with `tracemalloc`.
+
+Run with `python -m benchmarks.bench_memory`.
+"""
+import gc
+import json
+import tracemalloc
+from typing import Callable, Dict
+
+from benchmarks.payloads import short_urls_page, visits_page
+from shlink.models.columnar import ColumnarVisitsView
+from shlink.models.short import ShortUrlsView
+from shlink.models.visits import VisitsView
+
+
+def retained(build: Callable[[], object], items: int) -> Dict[str, float]:
+    """Bytes still allocated once `build` returns, while its result is alive."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        size, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return {"bytes": size, "per_item": size / items, "peak_per_item": peak / items}
+
+
+def run(scale: float = 1.0) -> Dict[str, Dict[str, float]]:
+    visits = max(1, int(20000 * scale))
+    short_urls = max(1, int(5000 * scale))
+    visits_body = json.dumps(visits_page(visits)).encode()
+    short_urls_body = json.dumps(short_urls_page(short_urls)).encode()
+    return {
+        "json.loads visits": retained(lambda: json.loads(visits_body), visits),
+        "VisitsView": retained(lambda: VisitsView.from_dict(json.loads(visits_body)), visits),
+        "ColumnarVisitsView": retained(lambda: ColumnarVisitsView.from_dict(json.loads(visits_body)), visits),
+        "json.loads short URLs": retained(lambda: json.loads(short_urls_body), short_urls),
+        "ShortUrlsView": retained(lambda: ShortUrlsView.from_dict(json.loads(short_urls_body)), short_urls),
+    }
+
+
+def report(results: Dict[str, Dict[str, float]]) -> None:
+    for name, result in results.items():
+        print(f"{name:<36} {result['per_item']:10,.0f} B/item  peak {result['peak_per_item']:10,.0f} B/item")
+
+
+if __name__ == "__main__":
+    report(run())
@@ -0,0 +1,61 @@
+"""
+Microbenchmarks of the decoding and serialization hot paths, without any network.
+
+Run with `python -m benchmarks.bench_micro`.
+"""
+import io
+import pickle
+from typing import Dict
+
+from benchmarks.payloads import short_urls_page, visits_page
+from benchmarks.timing import measure, report
+from shlink.client.aggregate import VisitAggregate
+from shlink.client.export import export_visits
+from shlink.client.utils import serializer
+from shlink.client.utils.converters import timestamp_converter
+from shlink.client.utils.packing import get_packer
+from shlink.models.short import ShortUrlsView
+from shlink.models.visits import VisitsView
+
+
+def _from_dict(view, payload):
+    # `_process_dict` pops the wrapper key, so hand every run a fresh outer dict
+    key, inner = next(iter(payload.items()))
+    return lambda: view.from_dict({key: inner})
+
+
+def run(scale: float = 1.0) -> Dict[str, Dict[str, float]]:
+    visits = max(1, int(5000 * scale))
+    short_urls = max(1, int(1000 * scale))
+    visits_payload = visits_page(visits)
+    short_urls_payload = short_urls_page(short_urls)
+    dates = [item["date"] for item in visits_payload["visits"]["data"]]
+    view = ShortUrlsView.from_dict(dict(short_urls_payload))
+    visits_view = VisitsView.from_dict(dict(visits_payload))
+    visit_models = visits_view.data
+    # What a `DecodePool` worker sends back, and the fetching process turns into models
+    pack, unpack = get_packer(VisitsView)
+    packed_visits = pickle.dumps(pack(visits_view), protocol=pickle.HIGHEST_PROTOCOL)
+
+    def convert_dates():
+        for date in dates:
+            timestamp_converter(date)
+
+    return {
+        "from_dict VisitsView": measure(_from_dict(VisitsView, visits_payload), items=visits),
+        "from_dict ShortUrlsView": measure(_from_dict(ShortUrlsView, short_urls_payload), items=short_urls),
+        "DecodePool receive VisitsView": measure(lambda: unpack(pickle.loads(packed_visits)), items=visits),
+        "timestamp_converter": measure(convert_dates, items=len(dates)),
+        "serializer.to_dict ShortUrlsView": measure(lambda: serializer.to_dict(view), items=short_urls),
+        "VisitAggregate.update": measure(lambda: VisitAggregate().update(visit_models), items=visits),
+        "export_visits csv dicts": measure(
+            lambda: export_visits(visits_payload["visits"]["data"], io.BytesIO(), format="csv"), items=visits
+        ),
+        "export_visits csv models": measure(
+            lambda: export_visits(visit_models, io.BytesIO(), format="csv"), items=visits
+        ),
+    }
+
+
+if __name__ == "__main__":
+    report(run())
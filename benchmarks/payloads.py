@@ -0,0 +1,82 @@
+"""Synthetic Shlink API payloads shaped like real responses."""
+import random
+from datetime import datetime, timedelta, timezone
+
+# Shlink geolocates visits to a city, so every visit from one gets the same coordinates
+COUNTRIES = [
+    ("US", "United States", "New York", "America/New_York", 40.7128, -74.006),
+    ("DE", "Germany", "Berlin", "Europe/Berlin", 52.52, 13.405),
+    ("ES", "Spain", "Madrid", "Europe/Madrid", 40.4168, -3.7038),
+    ("JP", "Japan", "Tokyo", "Asia/Tokyo", 35.6762, 139.6503),
+    ("BR", "Brazil", "Sao Paulo", "America/Sao_Paulo", -23.5505, -46.6333),
+]
+REFERERS = ["", "https://www.google.com/", "https://t.co/", "https://news.ycombinator.com/"]
+USER_AGENTS = [
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/99.0 Safari/537.36",
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 15_3 like Mac OS X) AppleWebKit/605.1.15 Mobile/15E148",
+    "Mozilla/5.0 (compatible; Googlebot/2.1; +http://www.google.com/bot.html)",
+]
+START = datetime(2022, 3, 1, tzinfo=timezone.utc)
+
+
+def pagination(page: int, pages: int, per_page: int, items: int) -> dict:
+    return {
+        "currentPage": page,
+        "pagesCount": pages,
+        "itemsPerPage": per_page,
+        "itemsInCurrentPage": items,
+        "totalItems": pages * per_page,
+    }
+
+
+def visit(rng: random.Random) -> dict:
+    code, country, city, tz, latitude, longitude = rng.choice(COUNTRIES)
+    return {
+        "referer": rng.choice(REFERERS),
+        "date": (START + timedelta(seconds=rng.randrange(86400 * 30))).isoformat(),
+        "userAgent": rng.choice(USER_AGENTS),
+        "visitLocation": {
+            "cityName": city,
+            "countryCode": code,
+            "countryName": country,
+            "latitude": latitude,
+            "longitude": longitude,
+            "regionName": city,
+            "timezone": tz,
+        },
+        "potentialBot": rng.random() < 0.1,
+        "visitedUrl": None,
+    }
+
+
+def visits_page(items: int = 5000, page: int = 1, pages: int = 1, seed: int = 0) -> dict:
+    rng = random.Random(seed + page)
+    return {"visits": {"data": [visit(rng) for _ in range(items)], "pagination": pagination(page, pages, items, items)}}
+
+
+def short_url(rng: random.Random, index: int) -> dict:
+    code = f"c{index:06d}"
+    return {
+        "shortCode": code,
+        "shortUrl": f"https://s.test/{code}",
+        "longUrl": f"https://example.com/articles/{index}?utm_source=bench",
+        "dateCreated": (START + timedelta(minutes=index)).isoformat(),
+        "visitsCount": rng.randrange(10000),
+        "tags": rng.sample(["news", "promo", "spring", "social", "mail"], 2),
+        "meta": {"validSince": None, "validUntil": None, "maxVisits": None},
+        "domain": None,
+        "title": f"Article {index}",
+        "crawlable": False,
+        "forwardQuery": True,
+    }
+
+
+def short_urls_page(items: int = 1000, page: int = 1, pages: int = 1, seed: int = 0) -> dict:
+    rng = random.Random(seed + page)
+    offset = (page - 1) * items
+    return {
+        "shortUrls": {
+            "data": [short_url(rng, offset + i) for i in range(items)],
+            "pagination": pagination(page, pages, items, items),
+        }
+    }
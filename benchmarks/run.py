@@ -0,0 +1,109 @@
+"""
+Run the benchmark suites, append the results to a history file and flag regressions.
+
+Every run is compared against the median of the last few runs on the same machine,
+Python version and scale. A benchmark regresses when its throughput drops by more than
+`--tolerance`.
+
+Run with `python -m benchmarks.run`, or `python -m benchmarks.run micro` for a subset.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+from benchmarks.timing import report
+
+SUITES = ("micro", "client", "import")
+DEFAULT_HISTORY = os.path.join(os.path.dirname(__file__), "history.jsonl")
+
+
+def _commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _environment() -> Dict[str, str]:
+    return {"machine": platform.node(), "python": platform.python_version()}
+
+
+def load_history(path: str) -> List[dict]:
+    try:
+        with open(path) as f:
+            return [json.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
+
+
+def regressions(
+    history: List[dict], results: Dict[str, dict], scale: float, tolerance: float, window: int = 5
+) -> List[str]:
+    """The benchmarks slower than the median of the last `window` comparable runs."""
+    environment = _environment()
+    previous = [run for run in history if run.get("environment") == environment and run.get("scale") == scale]
+    previous = previous[-window:]
+    slower = []
+    for name, result in results.items():
+        baseline = [run["results"][name]["ops"] for run in previous if name in run["results"]]
+        if baseline and result["ops"] < statistics.median(baseline) * (1 - tolerance):
+            slower.append(f"{name}: {result['ops']:,.0f} ops/s vs {statistics.median(baseline):,.0f} ops/s")
+    return slower
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("suites", nargs="*", help=f"Suites to run out of {', '.join(SUITES)}, all by default")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplier on payload sizes")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds of latency the stand-in server adds")
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help="JSON lines file to append results to")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="Allowed throughput drop, as a fraction")
+    parser.add_argument("--no-save", action="store_true", help="Don't append this run to the history")
+    args = parser.parse_args()
+    if unknown := set(args.suites) - set(SUITES):
+        parser.error(f"unknown suites: {', '.join(sorted(unknown))}")
+
+    results = {}
+    for suite in args.suites or SUITES:
+        if suite == "micro":
+            from benchmarks import bench_micro
+
+            results.update(bench_micro.run(args.scale))
+        elif suite == "import":
+            from benchmarks import bench_import
+
+            results.update(bench_import.run(args.scale))
+        else:
+            from benchmarks import bench_client
+
+            results.update(bench_client.run(args.scale, args.latency))
+    report(results)
+
+    history = load_history(args.history)
+    slower = regressions(history, results, args.scale, args.tolerance)
+    if not args.no_save:
+        run = {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "commit": _commit(),
+            "environment": _environment(),
+            "scale": args.scale,
+            "results": results,
+        }
+        with open(args.history, "a") as f:
+            f.write(json.dumps(run) + "\n")
+
+    if slower:
+        print("\nRegressions:", *slower, sep="\n  ")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+A local stand-in for the Shlink REST API, serving synthetic payloads.
+
+Only covers what the benchmarks call. Pages are rendered once and then served from
+memory, so measurements reflect the client rather than the server.
+
+Run standalone with `python -m benchmarks.server --port 8080`.
+"""
+import argparse
+import json
+import random
+import re
+import socket
+import threading
+import time
+import zlib
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks import payloads
+
+
+class Config:
+    """
+    Shape of the synthetic data.
+
+    Args:
+        short_urls: Total number of short URLs listed
+        visits: Total number of visits per short code
+        tags: Total number of tags listed by the stats endpoint
+        latency: Seconds added to every response, to simulate a remote server
+    """
+
+    def __init__(self, short_urls: int = 10_000, visits: int = 20_000, tags: int = 500, latency: float = 0.0):
+        self.short_urls = short_urls
+        self.visits = visits
+        self.tags = tags
+        self.latency = latency
+
+
+def _page(params: dict, total: int) -> Tuple[int, int, int]:
+    page = int(params.get("page", ["1"])[0])
+    per_page = int(params.get("itemsPerPage", [str(total)])[0] or total)
+    pages = max(1, -(-total // per_page))
+    return page, per_page, pages
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    config: Config = Config()
+
+    def setup(self):
+        super().setup()
+        # Headers and body go out in separate writes, don't let Nagle hold the body back
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, *_):
+        pass
+
+    def _send(self, status: int, body: bytes, content_type: str = "application/json") -> None:
+        if self.config.latency:
+            time.sleep(self.config.latency)
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        params = parse_qs(url.query)
+        body = self.route_get(url.path, params)
+        if body is None:
+            body = json.dumps({"type": "NOT_FOUND", "title": "Not found", "detail": url.path, "status": 404})
+            return self._send(404, body.encode(), "application/problem+json")
+        self._send(200, body)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        spec = json.loads(self.rfile.read(length) or b"{}")
+        if urlsplit(self.path).path != "/rest/v2/short-urls":
+            return self._send(404, b"{}")
+        data = payloads.short_url(random.Random(0), zlib.crc32(spec.get("longUrl", "").encode()) % 1_000_000)
+        data["longUrl"] = spec.get("longUrl", data["longUrl"])
+        self._send(200, json.dumps(data).encode())
+
+    def route_get(self, path: str, params: dict) -> Optional[bytes]:
+        config = self.config
+        if path == "/rest/health":
+            return b'{"status": "pass", "version": "3.0.0", "links": {"about": "https://shlink.io", "project": "x"}}'
+        if path == "/rest/v2/short-urls":
+            page, per_page, pages = _page(params, config.short_urls)
+            return _short_urls(page, per_page, pages)
+        if path == "/rest/v2/tags/stats":
+            page, per_page, pages = _page(params, config.tags)
+            return _tag_stats(page, per_page, pages)
+        if match := re.fullmatch(r"/rest/v2/short-urls/([^/]+)/visits", path):
+            page, per_page, pages = _page(params, config.visits)
+            return _visits(match.group(1), page, per_page, pages)
+        if match := re.fullmatch(r"/rest/v2/short-urls/([^/]+)", path):
+            return json.dumps(payloads.short_url(random.Random(match.group(1)), 1)).encode()
+        return None
+
+
+@lru_cache(maxsize=256)
+def _short_urls(page: int, per_page: int, pages: int) -> bytes:
+    return json.dumps(payloads.short_urls_page(per_page, page, pages)).encode()
+
+
+@lru_cache(maxsize=256)
+def _visits(code: str, page: int, per_page: int, pages: int) -> bytes:
+    return json.dumps(payloads.visits_page(per_page, page, pages, seed=zlib.crc32(code.encode()) % 1000)).encode()
+
+
+@lru_cache(maxsize=256)
+def _tag_stats(page: int, per_page: int, pages: int) -> bytes:
+    rng = random.Random(page)
+    data = [
+        {
+            "tag": f"tag-{(page - 1) * per_page + i}",
+            "shortUrlsCount": rng.randrange(100),
+            "visitsCount": rng.randrange(10000),
+        }
+        for i in range(per_page)
+    ]
+    pagination = payloads.pagination(page, pages, per_page, per_page)
+    return json.dumps({"tags": {"data": data, "pagination": pagination}}).encode()
+
+
+class StandInServer:
+    """
+    Runs the stand-in server on a background thread.
+
+    Use as a context manager; `url` is the base URL to hand to `Shlink`.
+    """
+
+    def __init__(self, config: Optional[Config] = None, port: int = 0):
+        handler = type("ConfiguredHandler", (Handler,), {"config": config or Config()})
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def __enter__(self) -> "StandInServer":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0)
+    args = parser.parse_args()
+    with StandInServer(Config(latency=args.latency), port=args.port) as server:
+        print(f"Serving on {server.url}")
+        server.thread.join()
+
+
+if __name__ == "__main__":
+    main()
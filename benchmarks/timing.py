@@ -0,0 +1,33 @@
+"""Shared measurement helpers for the benchmarks."""
+import statistics
+import time
+from typing import Callable, Dict
+
+
+def measure(fn: Callable[[], object], number: int = 20, warmup: int = 2, items: int = 1) -> Dict[str, float]:
+    """
+    Time `number` calls of `fn` after `warmup` untimed ones.
+
+    Returns throughput in `items` per second along with latency percentiles of a single call.
+    """
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(number):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return {
+        "ops": items * number / sum(samples),
+        "p50_ms": statistics.median(samples) * 1000,
+        "p95_ms": samples[min(len(samples) - 1, int(len(samples) * 0.95))] * 1000,
+    }
+
+
+def report(results: Dict[str, Dict[str, float]]) -> None:
+    for name, result in results.items():
+        print(
+            f"{name:<36} {result['ops']:14,.0f} ops/s"
+            f"  p50 {result['p50_ms']:9.3f} ms  p95 {result['p95_ms']:9.3f} ms"
+        )
@@ -0,0 +1,140 @@
+from collections import Counter
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import AsyncIterable, Iterable, List, Optional, Tuple
+
+from shlink.client.utils.sketches import HyperLogLog, SpaceSaving
+from shlink.models.visits import Visit
+
+__all__ = ("VisitAggregate",)
+
+# Added to a bucket's start in its own timezone, so in wall-clock time across DST changes
+_STEPS = {"hour": timedelta(hours=1), "day": timedelta(days=1)}
+
+
+class VisitAggregate:
+    """
+    Rolls visits up in a single pass, without holding on to them.
+
+    Feed it any iterable of visits, e.g. `client.iter_code_visits(shortCode, stream=True)`,
+    and read the counters once it's done. Memory depends on the number of buckets and
+    countries, not on the number of visits. Aggregates built from different sources,
+    or from parts of the same one, can be combined with `merge`.
+
+    Args:
+        interval: Size of the time buckets, `hour` or `day`
+        tz: Timezone the buckets are aligned to
+        top_referers:
+            Track the most frequent referers with a `SpaceSaving` summary of this many
+            entries, `None` to skip referers
+        user_agents_precision:
+            Estimate the number of distinct user agents with a `HyperLogLog` of this
+            precision, `None` to skip user agents
+
+    Attributes:
+        visits: Number of visits
+        bots: Number of visits flagged as potential bots
+        buckets: Visits per bucket, keyed by the bucket's start
+        bot_buckets: Potential bot visits per bucket
+        countries: Visits per country code, `None` for visits without a location
+        referers: Most frequent referers, an empty referer being a direct visit
+        user_agents: Distinct user agents
+    """
+
+    def __init__(
+        self,
+        interval: str = "hour",
+        tz: tzinfo = timezone.utc,
+        top_referers: Optional[int] = 100,
+        user_agents_precision: Optional[int] = 12,
+    ):
+        if interval not in _STEPS:
+            raise ValueError("interval must be 'hour' or 'day'")
+        self.interval = interval
+        self.tz = tz
+        self.visits = 0
+        self.bots = 0
+        self.buckets: Counter = Counter()
+        self.bot_buckets: Counter = Counter()
+        self.countries: Counter = Counter()
+        self.referers = SpaceSaving(top_referers) if top_referers else None
+        self.user_agents = HyperLogLog(user_agents_precision) if user_agents_precision else None
+        # Listings are sorted by date, so most visits fall in the same bucket as the previous one
+        self._start = self._end = datetime.min.replace(tzinfo=timezone.utc)
+
+    def bucket(self, date: datetime) -> datetime:
+        """Start of the bucket a date falls in."""
+        date = date.astimezone(self.tz)
+        if self.interval == "day":
+            return date.replace(hour=0, minute=0, second=0, microsecond=0)
+        return date.replace(minute=0, second=0, microsecond=0)
+
+    def add(self, visit: Visit) -> None:
+        if not self._start <= visit.date < self._end:
+            self._start = self.bucket(visit.date)
+            self._end = self._start + _STEPS[self.interval]
+        bucket = self._start
+        self.visits += 1
+        self.buckets[bucket] += 1
+        if visit.potentialBot:
+            self.bots += 1
+            self.bot_buckets[bucket] += 1
+        location = visit.visitLocation
+        self.countries[location.countryCode if location is not None else None] += 1
+        if self.referers is not None:
+            self.referers.add(visit.referer or "")
+        if self.user_agents is not None and visit.userAgent:
+            self.user_agents.add(visit.userAgent)
+
+    def update(self, visits: Iterable[Visit]) -> "VisitAggregate":
+        """Add every visit of an iterable, consuming it lazily."""
+        add = self.add
+        for visit in visits:
+            add(visit)
+        return self
+
+    async def aupdate(self, visits: AsyncIterable[Visit]) -> "VisitAggregate":
+        """Add every visit of an async iterable, e.g. an `AsyncShlink` `iter_*` listing."""
+        add = self.add
+        async for visit in visits:
+            add(visit)
+        return self
+
+    def merge(self, other: "VisitAggregate") -> "VisitAggregate":
+        """
+        Combine the counters of another aggregate into this one.
+
+        Both need the same interval and timezone. Referers and user agents are only
+        kept if both aggregates track them.
+        """
+        if (other.interval, other.tz) != (self.interval, self.tz):
+            raise ValueError("Can't merge aggregates with different buckets")
+        self.visits += other.visits
+        self.bots += other.bots
+        self.buckets.update(other.buckets)
+        self.bot_buckets.update(other.bot_buckets)
+        self.countries.update(other.countries)
+        if self.referers is not None and other.referers is not None:
+            self.referers.merge(other.referers)
+        else:
+            self.referers = None
+        if self.user_agents is not None and other.user_agents is not None:
+            self.user_agents.merge(other.user_agents)
+        else:
+            self.user_agents = None
+        return self
+
+    def series(self) -> List[Tuple[datetime, int, int]]:
+        """`(bucket, visits, bots)` for every bucket with visits, oldest first."""
+        return [(bucket, count, self.bot_buckets[bucket]) for bucket, count in sorted(self.buckets.items())]
+
+    def top_referers(self, n: int = 10) -> List[Tuple[str, int]]:
+        """The `n` most frequent referers and their approximate visit counts."""
+        if self.referers is None:
+            raise ValueError("Referers aren't tracked, set top_referers")
+        return [(referer, count) for referer, count, _ in self.referers.top(n)]
+
+    def distinct_user_agents(self) -> int:
+        """Approximate number of distinct user agents."""
+        if self.user_agents is None:
+            raise ValueError("User agents aren't tracked, set user_agents_precision")
+        return self.user_agents.count()
@@ -0,0 +1,220 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, List, Tuple, Union
+
+from shlink.models.short import ShortURL
+
+__all__ = ("ShortUrlBatcher", "AsyncShortUrlBatcher")
+
+Spec = Union[str, Dict[str, Any]]
+
+
+def _spec(spec: Spec) -> Tuple[str, Dict[str, Any]]:
+    """Normalize a spec, returning it with the key identical specs share."""
+    spec = {"longUrl": spec} if isinstance(spec, str) else dict(spec)
+    return json.dumps(spec, sort_keys=True, default=str), spec
+
+
+class _BatcherBase:
+    def __init__(self, client: Any, max_batch: int = 50, max_delay: float = 0.01, concurrency: int = 8):
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        self.client = client
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.concurrency = concurrency
+        self._pending: Dict[str, Tuple[Dict[str, Any], List[Any]]] = {}
+        self._oldest = 0.0
+        self._closed = False
+
+    def _add(self, spec: Spec, future: Any) -> None:
+        if self._closed:
+            raise RuntimeError("The batcher is closed")
+        key, spec = _spec(spec)
+        if not self._pending:
+            self._oldest = time.monotonic()
+        entry = self._pending.get(key)
+        if entry is None:
+            self._pending[key] = (spec, [future])
+        else:
+            entry[1].append(future)
+
+    def _take(self) -> List[Tuple[Dict[str, Any], List[Any]]]:
+        keys = list(self._pending)[: self.max_batch]
+        batch = [self._pending.pop(key) for key in keys]
+        self._oldest = time.monotonic()
+        return batch
+
+
+class ShortUrlBatcher(_BatcherBase):
+    """
+    Collects short URLs to create from any thread, and creates them in batches.
+
+    `submit` returns a `concurrent.futures.Future` right away. A background thread
+    flushes what was submitted once `max_batch` specs are pending, or `max_delay`
+    seconds after the oldest of them, creating the batch with `create_short_urls`.
+    Identical specs pending at the same time are only created once, and every
+    caller gets the same `ShortURL`.
+
+    Use it as a context manager, or call `close` to flush what's left and stop
+    the thread.
+
+    Args:
+        client: The `Shlink` client to create short URLs with
+        max_batch: Maximum number of specs per batch
+        max_delay: Seconds a spec may wait for its batch to fill up
+        concurrency: Maximum number of requests in flight per batch
+    """
+
+    def __init__(self, client: Any, max_batch: int = 50, max_delay: float = 0.01, concurrency: int = 8):
+        super().__init__(client, max_batch=max_batch, max_delay=max_delay, concurrency=concurrency)
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="shlink-batcher", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "ShortUrlBatcher":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def submit(self, spec: Spec) -> "Future[ShortURL]":
+        """
+        Queue a short URL to create.
+
+        Args:
+            spec: A long URL, or a dict of `create_short_url` arguments
+        """
+        future: "Future[ShortURL]" = Future()
+        with self._condition:
+            self._add(spec, future)
+            if len(self._pending) == 1 or len(self._pending) >= self.max_batch:
+                self._condition.notify()
+        return future
+
+    def close(self) -> None:
+        """Create the short URLs still pending, then stop the background thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                while len(self._pending) < self.max_batch and not self._closed:
+                    remaining = self._oldest + self.max_delay - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                if not self._pending:
+                    return
+                batch = self._take()
+            self._flush(batch)
+
+    def _flush(self, batch: List[Tuple[Dict[str, Any], List[Future]]]) -> None:
+        # Callers may have given up on their future meanwhile
+        batch = [
+            (spec, live)
+            for spec, futures in batch
+            if (live := [future for future in futures if future.set_running_or_notify_cancel()])
+        ]
+        try:
+            for result in self.client.create_short_urls([spec for spec, _ in batch], self.concurrency):
+                for future in batch[result.index][1]:
+                    if result.ok:
+                        future.set_result(result.shortUrl)
+                    else:
+                        future.set_exception(result.error)
+        except Exception as error:
+            for _, futures in batch:
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(error)
+
+
+class AsyncShortUrlBatcher(_BatcherBase):
+    """
+    Asyncio version of `ShortUrlBatcher`, for `AsyncShlink`.
+
+    `submit` must be called from the event loop, and returns an `asyncio.Future`.
+    Batches are flushed by a task started on the first submission. Use `async with`
+    or `await aclose()` to flush what's left and stop it.
+    """
+
+    def __init__(self, client: Any, max_batch: int = 50, max_delay: float = 0.01, concurrency: int = 8):
+        super().__init__(client, max_batch=max_batch, max_delay=max_delay, concurrency=concurrency)
+        self._wakeup = None
+        self._task = None
+
+    async def __aenter__(self) -> "AsyncShortUrlBatcher":
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        await self.aclose()
+
+    def submit(self, spec: Spec) -> Any:
+        """
+        Queue a short URL to create, see `ShortUrlBatcher.submit`.
+
+        Return:
+            An `asyncio.Future` resolving to the `ShortURL`
+        """
+        loop = asyncio.get_running_loop()
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._task = loop.create_task(self._run())
+        future = loop.create_future()
+        self._add(spec, future)
+        if len(self._pending) == 1 or len(self._pending) >= self.max_batch:
+            self._wakeup.set()
+        return future
+
+    async def aclose(self) -> None:
+        """Create the short URLs still pending, then stop the background task."""
+        self._closed = True
+        if self._task is not None:
+            self._wakeup.set()
+            await self._task
+
+    async def _run(self) -> None:
+        while True:
+            while not self._pending and not self._closed:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+            while len(self._pending) < self.max_batch and not self._closed:
+                remaining = self._oldest + self.max_delay - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            if not self._pending:
+                return
+            await self._flush(self._take())
+
+    async def _flush(self, batch: List[Tuple[Dict[str, Any], List[Any]]]) -> None:
+        batch = [
+            (spec, live) for spec, futures in batch if (live := [future for future in futures if not future.done()])
+        ]
+        try:
+            async for result in self.client.create_short_urls([spec for spec, _ in batch], self.concurrency):
+                for future in batch[result.index][1]:
+                    if future.done():
+                        continue
+                    if result.ok:
+                        future.set_result(result.shortUrl)
+                    else:
+                        future.set_exception(result.error)
+        except Exception as error:
+            for _, futures in batch:
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(error)
@@ -1,46 +1,430 @@
-from typing import Optional
-
-from requests import Session
+import json
+import time
+from datetime import datetime
+from functools import partial
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Hashable, Optional, Tuple, Type
 
 from shlink import __version__
+from shlink.client.cache import Cache, TTLCache
+from shlink.client.const import MISSING
 from shlink.client.error import ShlinkError
+from shlink.client.metrics import Metrics, RequestRecord
 from shlink.client.http.domain import Domain
 from shlink.client.http.health import Health
 from shlink.client.http.integration import Integration
 from shlink.client.http.short_urls import ShortURLs
 from shlink.client.http.tags import Tags
 from shlink.client.http.visits import Visits
+from shlink.client.retry import THROTTLE_STATUSES, AdaptiveLimiter, AsyncAdaptiveLimiter, RetryPolicy
+from shlink.client.route import Route
+from shlink.client.transport import AsyncHttpxTransport, AsyncTransport, RequestsTransport, Transport
+from shlink.client.utils.concurrency import AsyncSingleFlight, SingleFlight, aordered_map, ordered_map
+from shlink.client.utils.lazy import asyncio
+from shlink.client.utils.pagination import apaginate, paginate
+
+if TYPE_CHECKING:
+    from shlink.client.index import ShortUrlIndex
+    from shlink.client.pool import DecodePool
+
+# Routes answering with the short URL they created or changed
+_INDEXED_ROUTES = {
+    "GET": ("/short-urls/shorten",),
+    "PATCH": ("/short-urls/{shortCode}",),
+    "POST": ("/short-urls",),
+}
+
+
+class BaseShlink(Domain, Health, Integration, ShortURLs, Tags, Visits):
+    """
+    State and request handling shared by `Shlink` and `AsyncShlink`.
 
+    Subclasses only provide `_request`, which sends the request built by `_prepare`
+    through their transport and hands the response to `_process`.
+    """
 
-class Shlink(Domain, Health, Integration, ShortURLs, Tags, Visits):
-    def __init__(self, url: str, api_key: str):
+    def __init__(
+        self,
+        url: str,
+        api_key: str,
+        cache: Optional[Cache] = None,
+        revalidate: bool = False,
+        retry: Optional[RetryPolicy] = None,
+        metrics: Optional[Metrics] = None,
+        index: Optional["ShortUrlIndex"] = None,
+    ):
         self.url = url
         if self.url[-1] != "/":
             self.url = self.url + "/"
         self.api_url = self.url + "rest/v2"
         self.api_key = api_key
 
-        headers = {
+        self._headers = {
             "Accept": "application/problem+json",
             "X-Api-Key": self.api_key,
             "User-Agent": f"shlink-py/{__version__}",
         }
-        self._session = Session()
-        self._session.headers = headers
+        self.cache = cache
+        self._validators = TTLCache(maxsize=256, ttl=None) if revalidate else None
+        self.retry = retry
+        self.metrics = metrics
+        self.index = index
+
+    def _prepare(self, route: Route, data: Optional[Any]) -> str:
+        """
+        Validate a request and build its URL
+
+        Args:
+            route: Route to request
+            data: Optional data payload
+
+        Return:
+            The full URL for the route
+
+        Raises:
+            ValueError with incorrect request types and data mismatches
+        """
+        if route.method not in ["DELETE", "GET", "PATCH", "POST", "PUT"]:
+            raise ValueError("Invalid request type")
+        if route.method in ["PATCH", "POST", "PUT"] and not data:
+            raise ValueError("Data required for this request type")
+
+        if route.versioned:
+            return self.api_url + route.endpoint
+        return self.url + "rest" + route.endpoint
+
+    @staticmethod
+    def _encode_params(params: Optional[dict]) -> Optional[dict]:
+        """
+        Convert query parameters to the form Shlink expects
+
+        Unset values are dropped, dates are sent as ISO-8601, booleans as `true`/`false`
+        and lists use the `key[]` notation.
+        """
+        if not params:
+            return params
+        encoded = {}
+        for key, value in params.items():
+            if value is None or value is MISSING:
+                continue
+            if isinstance(value, bool):
+                value = "true" if value else "false"
+            elif isinstance(value, datetime):
+                value = value.isoformat()
+            elif isinstance(value, (list, tuple)):
+                key = key + "[]"
+            encoded[key] = value
+        return encoded
+
+    def _cache_key(self, route: Route) -> Hashable:
+        """
+        Key a route is cached under. It includes the server and API key, so a cache
+        shared between clients never answers one of them with another's short URLs.
+        """
+        return self.url, self.api_key, route.endpoint
+
+    def _cache_get(self, route: Route, cached: bool) -> Any:
+        """Look up a cacheable GET in the client cache, returns `MISSING` if not there."""
+        if not cached or self.cache is None or route.method != "GET":
+            return MISSING
+        return self.cache.get(self._cache_key(route))
+
+    def _cache_update(self, route: Route, cached: bool, result: Any) -> None:
+        """Store a cacheable GET, or invalidate what a mutation may have changed."""
+        if self.cache is None:
+            return
+        if route.method == "GET":
+            if cached and result is not MISSING:
+                self.cache.set(self._cache_key(route), result)
+        elif route.path == "/tags":
+            # Renaming or deleting tags changes every short URL carrying them
+            self.cache.clear()
+        else:
+            self.cache.invalidate(self._cache_key(route))
+
+    def _index_update(self, route: Route, data: Optional[str], result: Any) -> None:
+        """Apply a successful mutation to the short URL index."""
+        if self.index is None or result is MISSING:
+            return
+        if route.path == "/tags" and route.method == "PATCH":
+            payload = json.loads(data)
+            self.index.rename_tag(payload["oldName"], payload["newName"])
+        elif route.path == "/tags" and route.method == "DELETE":
+            self.index.delete_tags(json.loads(data)["tags"])
+        elif route.path == "/short-urls/{shortCode}" and route.method == "DELETE":
+            self.index.remove(route.parameters["shortCode"])
+        elif result is not None and route.path in _INDEXED_ROUTES.get(route.method, ()):
+            self.index.add(result)
+
+    def _request_key(self, route: Route, params: Optional[dict]) -> Hashable:
+        """Identify a request by its endpoint and query parameters, once encoded."""
+        encoded = self._encode_params(params) or {}
+        return (route.endpoint,) + tuple(
+            sorted((k, tuple(v) if isinstance(v, (list, tuple)) else v) for k, v in encoded.items())
+        )
+
+    def _request_headers(
+        self, route: Route, params: Optional[dict], model: Optional[Type] = None
+    ) -> Tuple[Optional[Hashable], Dict[str, str]]:
+        """
+        Build the headers for a request, adding any validators stored for a GET
+
+        Validators are stored per model, as a 304 hands back the model decoded for
+        them, e.g. a `VisitsView` can't answer a page requested with `columnar=True`.
+
+        Return:
+            The key the response is revalidated under, and the headers to send
+        """
+        if self._validators is None or route.method != "GET":
+            return None, self._headers
+        key = (model, self._request_key(route, params))
+        entry = self._validators.get(key)
+        if entry is MISSING:
+            return key, self._headers
+        etag, last_modified, _ = entry
+        headers = dict(self._headers)
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return key, headers
+
+    def _revalidated(self, response: Any, validator_key: Optional[Hashable]) -> Any:
+        """
+        The model a 304 confirms is still current, `MISSING` for any other response
+
+        The validators may be evicted at any time, so they are looked up once. When
+        they were evicted while the request was in flight, there's nothing to reuse
+        and the request must be sent again without them.
+        """
+        if response.status_code != 304 or validator_key is None:
+            return MISSING
+        entry = self._validators.get(validator_key)
+        return MISSING if entry is MISSING else entry[2]
+
+    def _start_record(self, route: Route, data: Optional[str]) -> Optional[RequestRecord]:
+        """Start measuring a request, when metrics are collected."""
+        if self.metrics is None:
+            return None
+        return RequestRecord(method=route.method, endpoint=route.path, bytes_out=len(data or ""))
+
+    def _finish_record(self, record: Optional[RequestRecord]) -> None:
+        if record is not None:
+            self.metrics.record(record)
+
+    def _process(
+        self,
+        response: Any,
+        model: Optional[Type] = None,
+        validator_key: Optional[Hashable] = None,
+        record: Optional[RequestRecord] = None,
+        accepts: FrozenSet[int] = frozenset(),
+    ) -> Any:
+        """
+        Turn a response into its decoded body
+
+        Args:
+            response: A `requests` or `httpx` response
+            model: Model to build from the response body, if any
+            validator_key: Key to store the response validators under, see `_request_headers`
+            record: Measurements to complete with the body size and decoding times
+            accepts: Error statuses to decode like a success, see `Route`
+
+        Return:
+            The model, the raw JSON response, or None if there's no API response
+
+        Raises:
+            ShlinkError with `ShlinkError.data` being the error object
+        """
+        self._check(response, accepts)
+        data = self._decode(response.content, model, record)
+        self._store_validators(response, validator_key, data)
+        return data
+
+    def _check(self, response: Any, accepts: FrozenSet[int] = frozenset()) -> None:
+        """
+        Raise for error responses, other than the `accepts` ones. A 304 is an error
+        here, as it only reaches this when there's no model left to reuse for it
+
+        Raises:
+            ShlinkError with `ShlinkError.data` being the error object
+        """
+        status = response.status_code
+        if status == 304 or (not (200 <= status < 400) and status not in accepts):
+            try:
+                error = response.json()
+            except Exception:  # Proxies and rate limiters may not answer with problem+json
+                error = None
+            if not isinstance(error, dict) or "title" not in error:
+                error = {
+                    "type": "about:blank",
+                    "title": f"HTTP {status}",
+                    "detail": response.text[:200],
+                    "status": status,
+                }
+            raise ShlinkError(data=error)
+
+    def _decode(self, content: bytes, model: Optional[Type], record: Optional[RequestRecord]) -> Any:
+        """Parse a response body and build its model, None if it isn't JSON."""
+        start = time.perf_counter()
+        try:
+            data = json.loads(content)
+        except Exception:  # The endpoint doesn't return JSON
+            return None
+        decoded = time.perf_counter()
+        if model is not None:
+            data = model.from_dict(data)
+        if record is not None:
+            record.bytes_in = len(content)
+            record.decode_time = decoded - start
+            record.model_time = time.perf_counter() - decoded
+        return data
+
+    def _store_validators(self, response: Any, validator_key: Optional[Hashable], data: Any) -> None:
+        """Remember the validators of a response along with its model, to revalidate it later."""
+        if validator_key is not None:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                self._validators.set(validator_key, (etag, last_modified, data))
+
+
+class Shlink(BaseShlink):
+    """
+    Shlink REST API client.
+
+    Use `with Shlink(...)` or call `close()` to release the connection pool.
+
+    Args:
+        url: Base URL of the Shlink instance
+        api_key: API key to authenticate with
+        cache:
+            Optional cache for `get_short_url`, e.g. `TTLCache`. Entries are
+            invalidated when the short URL is edited or deleted through this client.
+            It can be shared between clients, which only see their own entries
+        revalidate:
+            Send conditional GET requests using the ETag/Last-Modified validators of
+            previous responses. On a 304, the previously decoded model is returned
+            as-is, so it is shared between calls
+        transport:
+            How requests are sent, defaults to a `RequestsTransport`. Pass one to tune
+            connection pooling and timeouts, or an `HttpxTransport(http2=True)` for HTTP/2
+        retry:
+            Retry failed requests according to this `RetryPolicy`, honouring
+            `Retry-After` on 429 and 503 responses
+        limiter:
+            An `AdaptiveLimiter` capping the requests in flight across threads,
+            lowered when the server throttles and raised again as requests succeed
+        metrics:
+            A `Metrics` collecting per-endpoint request counts, sizes and the time
+            spent on the network, parsing JSON and building models
+        index:
+            A `ShortUrlIndex` to keep up to date with the short URLs created, edited
+            and deleted through this client, and the tags renamed or deleted
+        coalesce:
+            Share one request between identical GETs made at the same time, e.g. by
+            threads resolving the same short code. Like with `revalidate`, every
+            caller gets the same decoded model
+        thread_safe:
+            Without a `transport`, use a `RequestsTransport` giving every thread its
+            own session over one pool of at most 10 connections, so a single client
+            can be shared by a thread pool. The rest of the client state is already
+            safe to share
+        decode_pool:
+            A `DecodePool` parsing large response bodies and building their models in
+            worker processes, so pages fetched from many threads are decoded on
+            several cores
+    """
 
-    def __del__(self):
-        self._session.close()
+    _paginate = staticmethod(paginate)
+    _map_ordered = staticmethod(ordered_map)
+
+    def __init__(
+        self,
+        url: str,
+        api_key: str,
+        cache: Optional[Cache] = None,
+        revalidate: bool = False,
+        transport: Optional[Transport] = None,
+        retry: Optional[RetryPolicy] = None,
+        limiter: Optional[AdaptiveLimiter] = None,
+        metrics: Optional[Metrics] = None,
+        index: Optional["ShortUrlIndex"] = None,
+        coalesce: bool = False,
+        thread_safe: bool = False,
+        decode_pool: Optional["DecodePool"] = None,
+    ):
+        super().__init__(
+            url, api_key, cache=cache, revalidate=revalidate, retry=retry, metrics=metrics, index=index
+        )
+        if transport is None:
+            transport = RequestsTransport(per_thread_sessions=thread_safe, pool_block=thread_safe)
+        self.transport = transport
+        self.limiter = limiter
+        self._flights = SingleFlight() if coalesce else None
+        self.decode_pool = decode_pool
+
+    def __enter__(self) -> "Shlink":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the transport and its connection pool."""
+        self.transport.close()
+
+    def _decode(self, content: bytes, model: Optional[Type], record: Optional[RequestRecord]) -> Any:
+        if self.decode_pool is not None and self.decode_pool.accepts(content, model):
+            return self.decode_pool.decode(content, model, record)
+        return super()._decode(content, model, record)
+
+    def _send(self, method: str, url: str, accepts: FrozenSet[int] = frozenset(), **kwargs) -> Any:
+        """
+        Send a request through the transport, applying the limiter and retry policy.
+        Responses with one of the `accepts` statuses are returned without retrying.
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            throttled = False
+            if self.limiter is not None:
+                self.limiter.acquire()
+            try:
+                response = self.transport.request(method, url, **kwargs)
+            except Exception as error:
+                if self.retry is None or not self.retry.should_retry(method, attempt, error=error):
+                    raise
+                delay = self.retry.delay(attempt)
+            else:
+                accepted = response.status_code in accepts
+                throttled = response.status_code in THROTTLE_STATUSES and not accepted
+                if accepted or self.retry is None or not self.retry.should_retry(method, attempt, response=response):
+                    return response
+                delay = self.retry.delay(attempt, response)
+                if kwargs.get("stream"):
+                    response.close()
+            finally:
+                if self.limiter is not None:
+                    self.limiter.release(throttled)
+            time.sleep(delay)
 
     def _request(
-        self, endpoint: str, data: Optional[dict] = None, params: Optional[dict] = None, method: str = "GET"
-    ) -> Optional[dict]:
+        self,
+        route: Route,
+        data: Optional[str] = None,
+        params: Optional[dict] = None,
+        model: Optional[Type] = None,
+        cached: bool = False,
+    ) -> Any:
         """
         Make an API request
 
         Args:
-            endpoint: Endpoint to request
+            route: Route to request
             data: Optional data payload
-            method: Request type, oneof DELETE, GET, PATCH, POST, PUT
+            params: Optional query parameters
+            model: Model to build from the response body
+            cached: Whether the response may be served from and stored in the client cache
 
         Return:
             Response or None if there's no API response
@@ -49,17 +433,331 @@ class Shlink(Domain, Health, Integration, ShortURLs, Tags, Visits):
             ValueError with incorrect request types and data mismatches
             ShlinkError with `ShlinkError.data` being the error object
         """
-        if method not in ["DELETE", "GET", "PATCH", "POST", "PUT"]:
-            raise ValueError("Invalid request type")
-        if method in ["PATCH", "POST", "PUT"] and not data:
-            raise ValueError("Data required for this request type")
+        url = self._prepare(route, data)
+        if (result := self._cache_get(route, cached)) is not MISSING:
+            return result
+        if self._flights is not None and route.method == "GET":
+            fetch = partial(self._fetch, route, url, params=params, model=model, cached=cached)
+            return self._flights.do((model, self._request_key(route, params)), fetch)
+        return self._fetch(route, url, data, params, model, cached)
+
+    def _fetch(
+        self,
+        route: Route,
+        url: str,
+        data: Optional[str] = None,
+        params: Optional[dict] = None,
+        model: Optional[Type] = None,
+        cached: bool = False,
+    ) -> Any:
+        """Send a request that couldn't be served from the cache, see `_request`."""
+        result = MISSING
+        key, headers = self._request_headers(route, params, model)
+        record = self._start_record(route, data)
+        try:
+            start = time.perf_counter()
+            response = self._send(
+                route.method,
+                url,
+                accepts=route.accepts,
+                headers=headers,
+                data=data,
+                params=self._encode_params(params),
+            )
+            result = self._revalidated(response, key)
+            if result is MISSING and response.status_code == 304 and headers is not self._headers:
+                # The validators sent were evicted while the request was in flight
+                response = self._send(
+                    route.method,
+                    url,
+                    accepts=route.accepts,
+                    headers=self._headers,
+                    data=data,
+                    params=self._encode_params(params),
+                )
+            if record is not None:
+                record.http_time = time.perf_counter() - start
+                record.status = response.status_code
+            if result is MISSING:
+                result = self._process(response, model, key, record, route.accepts)
+        finally:
+            self._cache_update(route, cached, result)
+            self._index_update(route, data, result)
+            self._finish_record(record)
+        return result
+
+    def _stream(
+        self, route: Route, path: Tuple[str, ...], model: Optional[Type], params: Optional[dict] = None
+    ) -> Any:
+        """
+        Make an API request for a listing, decoding its items as they are received
+
+        Args:
+            route: Route to request
+            path: Keys leading to the array of items in the response body
+            model: Model to build from every item, `None` to keep the JSON dicts
+            params: Optional query parameters
+
+        Return:
+            A `StreamedPage`, once the response headers were received
 
-        endpoint = self.api_url + endpoint
-        response = self._session.request(method=method, url=endpoint, data=data, params=params)
-        if not (200 <= response.status_code < 400):
-            raise ShlinkError(data=response.json())
+        Raises:
+            ShlinkError with `ShlinkError.data` being the error object
+        """
+        from shlink.client.stream import StreamedPage
 
+        url = self._prepare(route, None)
+        record = self._start_record(route, None)
+        start = time.perf_counter()
         try:
-            return response.json()
-        except Exception:  # The endpoint doesn't return JSON
-            return None
+            response = self._send(
+                route.method, url, headers=self._headers, params=self._encode_params(params), stream=True
+            )
+        except BaseException:
+            self._finish_record(record)
+            raise
+        if record is not None:
+            record.http_time = time.perf_counter() - start
+            record.status = response.status_code
+        if not 200 <= response.status_code < 400:
+            try:
+                response.read()
+                self._process(response)
+            finally:
+                response.close()
+                self._finish_record(record)
+        return StreamedPage(response, path, model, record, lambda: self._finish_record(record))
+
+    def _subscribe(self, **options) -> Any:
+        from shlink.client.mercure import MercureSubscriber
+
+        return MercureSubscriber(self, **options)
+
+
+class AsyncShlink(BaseShlink):
+    """
+    Asyncio version of `Shlink`. Every API method returns a coroutine.
+
+    Requests go through a pooled `httpx.AsyncClient`, so many calls can be in flight
+    on one event loop. Use `async with AsyncShlink(...)` or `await client.close()`
+    to release the pool.
+
+    Args:
+        url: Base URL of the Shlink instance
+        api_key: API key to authenticate with
+        cache: Optional cache for `get_short_url`, see `Shlink`
+        revalidate: Send conditional GET requests, see `Shlink`
+        transport: How requests are sent, defaults to an `AsyncHttpxTransport`
+        retry: Retry failed requests according to this `RetryPolicy`, see `Shlink`
+        limiter: An `AsyncAdaptiveLimiter` capping the requests in flight, see `Shlink`
+        metrics: A `Metrics` collecting per-endpoint request metrics, see `Shlink`
+        index: A `ShortUrlIndex` to keep up to date, see `Shlink`
+        coalesce: Share one request between identical concurrent GETs, see `Shlink`
+        decode_pool: A `DecodePool` decoding large bodies in worker processes, see `Shlink`
+    """
+
+    _paginate = staticmethod(apaginate)
+    _map_ordered = staticmethod(aordered_map)
+
+    def __init__(
+        self,
+        url: str,
+        api_key: str,
+        cache: Optional[Cache] = None,
+        revalidate: bool = False,
+        transport: Optional[AsyncTransport] = None,
+        retry: Optional[RetryPolicy] = None,
+        limiter: Optional[AsyncAdaptiveLimiter] = None,
+        metrics: Optional[Metrics] = None,
+        index: Optional["ShortUrlIndex"] = None,
+        coalesce: bool = False,
+        decode_pool: Optional["DecodePool"] = None,
+    ):
+        super().__init__(
+            url, api_key, cache=cache, revalidate=revalidate, retry=retry, metrics=metrics, index=index
+        )
+        self.transport = transport or AsyncHttpxTransport()
+        self.limiter = limiter
+        self._flights = AsyncSingleFlight() if coalesce else None
+        self.decode_pool = decode_pool
+
+    async def __aenter__(self) -> "AsyncShlink":
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying connection pool."""
+        await self.transport.close()
+
+    async def _send(self, method: str, url: str, accepts: FrozenSet[int] = frozenset(), **kwargs) -> Any:
+        """
+        Send a request through the transport, applying the limiter and retry policy.
+        Responses with one of the `accepts` statuses are returned without retrying.
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            throttled = False
+            if self.limiter is not None:
+                await self.limiter.acquire()
+            try:
+                response = await self.transport.request(method, url, **kwargs)
+            except Exception as error:
+                if self.retry is None or not self.retry.should_retry(method, attempt, error=error):
+                    raise
+                delay = self.retry.delay(attempt)
+            else:
+                accepted = response.status_code in accepts
+                throttled = response.status_code in THROTTLE_STATUSES and not accepted
+                if accepted or self.retry is None or not self.retry.should_retry(method, attempt, response=response):
+                    return response
+                delay = self.retry.delay(attempt, response)
+                if kwargs.get("stream"):
+                    await response.aclose()
+            finally:
+                if self.limiter is not None:
+                    await self.limiter.release(throttled)
+            await asyncio.sleep(delay)
+
+    async def _request(
+        self,
+        route: Route,
+        data: Optional[str] = None,
+        params: Optional[dict] = None,
+        model: Optional[Type] = None,
+        cached: bool = False,
+    ) -> Any:
+        """
+        Make an API request
+
+        Args:
+            route: Route to request
+            data: Optional data payload
+            params: Optional query parameters
+            model: Model to build from the response body
+            cached: Whether the response may be served from and stored in the client cache
+
+        Return:
+            Response or None if there's no API response
+
+        Raises:
+            ValueError with incorrect request types and data mismatches
+            ShlinkError with `ShlinkError.data` being the error object
+        """
+        url = self._prepare(route, data)
+        if (result := self._cache_get(route, cached)) is not MISSING:
+            return result
+        if self._flights is not None and route.method == "GET":
+            fetch = partial(self._fetch, route, url, params=params, model=model, cached=cached)
+            return await self._flights.do((model, self._request_key(route, params)), fetch)
+        return await self._fetch(route, url, data, params, model, cached)
+
+    async def _fetch(
+        self,
+        route: Route,
+        url: str,
+        data: Optional[str] = None,
+        params: Optional[dict] = None,
+        model: Optional[Type] = None,
+        cached: bool = False,
+    ) -> Any:
+        """Send a request that couldn't be served from the cache, see `_request`."""
+        result = MISSING
+        key, headers = self._request_headers(route, params, model)
+        record = self._start_record(route, data)
+        try:
+            start = time.perf_counter()
+            response = await self._send(
+                route.method,
+                url,
+                accepts=route.accepts,
+                headers=headers,
+                data=data,
+                params=self._encode_params(params),
+            )
+            result = self._revalidated(response, key)
+            if result is MISSING and response.status_code == 304 and headers is not self._headers:
+                # The validators sent were evicted while the request was in flight
+                response = await self._send(
+                    route.method,
+                    url,
+                    accepts=route.accepts,
+                    headers=self._headers,
+                    data=data,
+                    params=self._encode_params(params),
+                )
+            if record is not None:
+                record.http_time = time.perf_counter() - start
+                record.status = response.status_code
+            if result is MISSING:
+                result = await self._aprocess(response, model, key, record, route.accepts)
+        finally:
+            self._cache_update(route, cached, result)
+            self._index_update(route, data, result)
+            self._finish_record(record)
+        return result
+
+    async def _aprocess(
+        self,
+        response: Any,
+        model: Optional[Type] = None,
+        validator_key: Optional[Hashable] = None,
+        record: Optional[RequestRecord] = None,
+        accepts: FrozenSet[int] = frozenset(),
+    ) -> Any:
+        """`_process`, awaiting the decode pool rather than blocking the loop on it."""
+        if self.decode_pool is None or not self.decode_pool.accepts(response.content, model):
+            return self._process(response, model, validator_key, record, accepts)
+        self._check(response, accepts)
+        data = await self.decode_pool.adecode(response.content, model, record)
+        self._store_validators(response, validator_key, data)
+        return data
+
+    async def _stream(
+        self, route: Route, path: Tuple[str, ...], model: Optional[Type], params: Optional[dict] = None
+    ) -> Any:
+        """
+        Make an API request for a listing, decoding its items as they are received
+
+        Args:
+            route: Route to request
+            path: Keys leading to the array of items in the response body
+            model: Model to build from every item, `None` to keep the JSON dicts
+            params: Optional query parameters
+
+        Return:
+            An `AsyncStreamedPage`, once the response headers were received
+
+        Raises:
+            ShlinkError with `ShlinkError.data` being the error object
+        """
+        from shlink.client.stream import AsyncStreamedPage
+
+        url = self._prepare(route, None)
+        record = self._start_record(route, None)
+        start = time.perf_counter()
+        try:
+            response = await self._send(
+                route.method, url, headers=self._headers, params=self._encode_params(params), stream=True
+            )
+        except BaseException:
+            self._finish_record(record)
+            raise
+        if record is not None:
+            record.http_time = time.perf_counter() - start
+            record.status = response.status_code
+        if not 200 <= response.status_code < 400:
+            try:
+                await response.aread()
+                self._process(response)
+            finally:
+                await response.aclose()
+                self._finish_record(record)
+        return AsyncStreamedPage(response, path, model, record, lambda: self._finish_record(record))
+
+    def _subscribe(self, **options) -> Any:
+        from shlink.client.mercure import AsyncMercureSubscriber
+
+        return AsyncMercureSubscriber(self, **options)
@@ -1,10 +1,6 @@
-import inspect
-from importlib.metadata import version as _v
+import sys
 
-try:
-    __version__ = _v("shlink")
-except Exception:
-    __version__ = "0.0.0"
+from shlink import __version__  # noqa: F401
 
 
 # Credit dis-snek/Lepton
@@ -21,9 +17,8 @@ class Singleton(type):
 class Sentinel(metaclass=Singleton):
     @staticmethod
     def _get_caller_module() -> str:
-        stack = inspect.stack()
-
-        caller = stack[2][0]
+        # `inspect.stack()` would read the source of every frame, only the globals are needed
+        caller = sys._getframe(3)
         return caller.f_globals.get("__name__")
 
     def __init__(self):
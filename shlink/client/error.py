@@ -1,10 +1,11 @@
 from typing import List, Optional
 
-from attrs import field
+from attrs import define, field
 
 from shlink.client.utils.mixins import DictSerializationMixin
 
 
+@define(kw_only=True, slots=True)
 class _ShlinkError(DictSerializationMixin):
     type: str = field()
     title: str = field()
@@ -20,9 +21,8 @@ class ShlinkError(Exception):
     def __init__(self, *args, **kwargs):
         data = kwargs.pop("data", None)
         message = "Exception occurred, no further info available"
+        self.data = None
         if data:
-            self.data = _ShlinkError.from_dict(
-                data
-            )  # DictSerializationMixin keyward 'url' error
+            self.data = _ShlinkError.from_dict(data)
             message = data["title"] + ": " + data["detail"]
         super().__init__(message, *args, **kwargs)
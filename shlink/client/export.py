@@ -0,0 +1,355 @@
+import csv
+import io
+import json
+import os
+from typing import Any, AsyncIterable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from shlink.client.utils.encoder import Column, compile_row_encoder
+
+__all__ = (
+    "VISIT_COLUMNS",
+    "SHORT_URL_COLUMNS",
+    "Writer",
+    "JSONLWriter",
+    "CSVWriter",
+    "ParquetWriter",
+    "open_writer",
+    "export",
+    "aexport",
+    "export_visits",
+    "export_short_urls",
+)
+
+VISIT_COLUMNS = (
+    Column("date", ("date",), "datetime"),
+    Column("referer", ("referer",)),
+    Column("userAgent", ("userAgent",)),
+    Column("potentialBot", ("potentialBot",), "bool", False),
+    Column("visitedUrl", ("visitedUrl",)),
+    Column("type", ("type",)),
+    Column("countryCode", ("visitLocation", "countryCode")),
+    Column("countryName", ("visitLocation", "countryName")),
+    Column("regionName", ("visitLocation", "regionName")),
+    Column("cityName", ("visitLocation", "cityName")),
+    Column("timezone", ("visitLocation", "timezone")),
+    Column("latitude", ("visitLocation", "latitude"), "float"),
+    Column("longitude", ("visitLocation", "longitude"), "float"),
+)
+
+SHORT_URL_COLUMNS = (
+    Column("shortCode", ("shortCode",)),
+    Column("shortUrl", ("shortUrl",)),
+    Column("longUrl", ("longUrl",)),
+    Column("dateCreated", ("dateCreated",), "datetime"),
+    Column("visitsCount", ("visitsCount",), "int"),
+    Column("tags", ("tags",), "list"),
+    Column("validSince", ("meta", "validSince"), "datetime"),
+    Column("validUntil", ("meta", "validUntil"), "datetime"),
+    Column("maxVisits", ("meta", "maxVisits"), "int"),
+    Column("domain", ("domain",)),
+    Column("title", ("title",)),
+    Column("crawlable", ("crawlable",), "bool", False),
+    Column("forwardQuery", ("forwardQuery",), "bool", True),
+)
+
+_FORMATS = {".jsonl": "jsonl", ".ndjson": "jsonl", ".csv": "csv", ".parquet": "parquet"}
+_COMPRESSIONS = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz"}
+
+Row = Tuple[Any, ...]
+Destination = Union[str, "os.PathLike[str]", io.BufferedIOBase]
+
+
+def _open_binary(destination: Destination, compression: Optional[str]) -> Tuple[Any, bool]:
+    """A binary file to write to, and whether it's ours to close."""
+    if compression is None:
+        if isinstance(destination, (str, os.PathLike)):
+            return open(destination, "wb"), True
+        return destination, False
+    if compression == "gzip":
+        import gzip
+
+        return gzip.open(destination, "wb"), True
+    if compression == "bz2":
+        import bz2
+
+        return bz2.open(destination, "wb"), True
+    if compression == "xz":
+        import lzma
+
+        return lzma.open(destination, "wb"), True
+    raise ValueError(f"Unknown compression {compression!r}, use gzip, bz2 or xz")
+
+
+class Writer:
+    """
+    Writes rows of `columns` to a file, a chunk at a time.
+
+    Subclasses implement `write_rows` and `close`. Writers close the files they
+    open themselves, but not the file objects they are given.
+    """
+
+    def __init__(self, columns: Sequence[Column]):
+        self.columns = tuple(columns)
+
+    def write_rows(self, rows: List[Row]) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        raise NotImplementedError
+
+    def __enter__(self) -> "Writer":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+
+class _TextWriter(Writer):
+    def __init__(self, destination: Destination, columns: Sequence[Column], compression: Optional[str] = None):
+        super().__init__(columns)
+        self._binary, self._owned = _open_binary(destination, compression)
+        self._file = io.TextIOWrapper(self._binary, encoding="utf-8", newline="", write_through=True)
+
+    def close(self) -> None:
+        self._file.flush()
+        # Detach so closing the wrapper doesn't close a file object we were handed
+        self._file.detach()
+        if self._owned:
+            self._binary.close()
+
+
+class JSONLWriter(_TextWriter):
+    """
+    One JSON object per line, keyed by column name.
+
+    Args:
+        destination: A path, or a binary file object
+        columns: The columns to write
+        compression: `gzip`, `bz2` or `xz`, `None` for plain text
+    """
+
+    def write_rows(self, rows: List[Row]) -> None:
+        names = [column.name for column in self.columns]
+        dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+        self._file.write("".join(dumps(dict(zip(names, row))) + "\n" for row in rows))
+
+
+class CSVWriter(_TextWriter):
+    """
+    CSV with a header row. Lists are written as JSON arrays, missing values as empty fields.
+
+    Args:
+        destination: A path, or a binary file object
+        columns: The columns to write
+        compression: `gzip`, `bz2` or `xz`, `None` for plain text
+    """
+
+    def __init__(self, destination: Destination, columns: Sequence[Column], compression: Optional[str] = None):
+        super().__init__(destination, columns, compression)
+        self._lists = [index for index, column in enumerate(self.columns) if column.type == "list"]
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+        self._writer.writerow([column.name for column in self.columns])
+
+    def write_rows(self, rows: List[Row]) -> None:
+        if self._lists:
+            rows = [self._encode_lists(row) for row in rows]
+        # Format the chunk in memory so the (possibly compressed) file gets a single write
+        self._writer.writerows(rows)
+        self._file.write(self._buffer.getvalue())
+        self._buffer.seek(0)
+        self._buffer.truncate()
+
+    def _encode_lists(self, row: Row) -> Row:
+        row = list(row)
+        for index in self._lists:
+            if row[index] is not None:
+                row[index] = json.dumps(row[index], ensure_ascii=False)
+        return row
+
+    def close(self) -> None:
+        self._file.write(self._buffer.getvalue())
+        super().close()
+
+
+class ParquetWriter(Writer):
+    """
+    Parquet, one row group per chunk, with dates as UTC timestamps. Needs `pyarrow`.
+
+    Args:
+        destination: A path, or a binary file object
+        columns: The columns to write
+        compression: Parquet compression codec, e.g. `snappy` (the default), `zstd` or `gzip`
+    """
+
+    def __init__(self, destination: Destination, columns: Sequence[Column], compression: Optional[str] = "snappy"):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("ParquetWriter requires pyarrow, install shlink-py[parquet]") from None
+        from shlink.client.utils.converters import timestamp_converter
+
+        super().__init__(columns)
+        self._pa = pa
+        self._parse_date = timestamp_converter
+        types = {
+            "str": pa.string(),
+            "int": pa.int64(),
+            "float": pa.float64(),
+            "bool": pa.bool_(),
+            "datetime": pa.timestamp("us", tz="UTC"),
+            "list": pa.list_(pa.string()),
+        }
+        self._schema = pa.schema([(column.name, types[column.type]) for column in self.columns])
+        self._writer = pq.ParquetWriter(destination, self._schema, compression=compression or "none")
+
+    def write_rows(self, rows: List[Row]) -> None:
+        arrays = []
+        for index, column in enumerate(self.columns):
+            values = [row[index] for row in rows]
+            if column.type == "datetime":
+                values = [None if value is None else self._parse_date(value) for value in values]
+            arrays.append(self._pa.array(values, type=self._schema.field(index).type))
+        self._writer.write_table(self._pa.Table.from_arrays(arrays, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+def open_writer(
+    destination: Destination,
+    columns: Sequence[Column],
+    format: Optional[str] = None,
+    compression: Optional[str] = None,
+) -> Writer:
+    """
+    Create the writer for a destination, inferring what isn't given from its file name.
+
+    `visits.csv.gz` is written as gzipped CSV, `visits.parquet` as Parquet.
+
+    Args:
+        destination: A path, or a binary file object
+        columns: The columns to write
+        format: `jsonl`, `csv` or `parquet`
+        compression: See the writer of the format
+    """
+    name = os.fspath(destination) if isinstance(destination, (str, os.PathLike)) else ""
+    root, extension = os.path.splitext(name.lower())
+    if compression is None and extension in _COMPRESSIONS:
+        compression = _COMPRESSIONS[extension]
+        root, extension = os.path.splitext(root)
+    format = format or _FORMATS.get(extension)
+    if format == "jsonl":
+        return JSONLWriter(destination, columns, compression)
+    if format == "csv":
+        return CSVWriter(destination, columns, compression)
+    if format == "parquet":
+        return ParquetWriter(destination, columns, compression or "snappy")
+    raise ValueError("Unknown export format, use jsonl, csv or parquet")
+
+
+class _Rows:
+    """Turns items into rows, picking the encoder from the first one."""
+
+    def __init__(self, columns: Sequence[Column]):
+        self._columns = columns
+        self._encoders: Dict[bool, Callable[[Any], Row]] = {}
+
+    def encode(self, items: List[Any]) -> List[Row]:
+        models = not isinstance(items[0], dict)
+        if (encoder := self._encoders.get(models)) is None:
+            encoder = self._encoders[models] = compile_row_encoder(self._columns, models)
+        return [encoder(item) for item in items]
+
+
+def export(
+    items: Iterable[Any],
+    destination: Union[Destination, Writer],
+    columns: Sequence[Column],
+    format: Optional[str] = None,
+    compression: Optional[str] = None,
+    chunk_size: int = 10000,
+) -> int:
+    """
+    Write items to a file as they are produced, `chunk_size` at a time.
+
+    Items are models or, faster as no model is built, the JSON dicts `raw=True`
+    listings yield. A whole listing goes straight to disk without being held in
+    memory with e.g.
+    `export(client.iter_code_visits(code, raw=True), "visits.csv.gz", VISIT_COLUMNS)`.
+
+    Args:
+        items: The items to export
+        destination: A path, a binary file object or a `Writer`
+        columns: The columns to write, e.g. `VISIT_COLUMNS`
+        format: See `open_writer`
+        compression: See `open_writer`
+        chunk_size: Number of rows encoded and written at once
+
+    Return:
+        The number of rows written
+    """
+    rows = _Rows(columns)
+    count = 0
+    if isinstance(destination, Writer):
+        writer = destination
+    else:
+        writer = open_writer(destination, columns, format, compression)
+    try:
+        chunk = []
+        for item in items:
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                writer.write_rows(rows.encode(chunk))
+                count += len(chunk)
+                chunk = []
+        if chunk:
+            writer.write_rows(rows.encode(chunk))
+            count += len(chunk)
+    finally:
+        if writer is not destination:
+            writer.close()
+    return count
+
+
+async def aexport(
+    items: AsyncIterable[Any],
+    destination: Union[Destination, Writer],
+    columns: Sequence[Column],
+    format: Optional[str] = None,
+    compression: Optional[str] = None,
+    chunk_size: int = 10000,
+) -> int:
+    """Asyncio version of `export`, for `AsyncShlink` listings. Writes are blocking."""
+    rows = _Rows(columns)
+    count = 0
+    if isinstance(destination, Writer):
+        writer = destination
+    else:
+        writer = open_writer(destination, columns, format, compression)
+    try:
+        chunk = []
+        async for item in items:
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                writer.write_rows(rows.encode(chunk))
+                count += len(chunk)
+                chunk = []
+        if chunk:
+            writer.write_rows(rows.encode(chunk))
+            count += len(chunk)
+    finally:
+        if writer is not destination:
+            writer.close()
+    return count
+
+
+def export_visits(items: Iterable[Any], destination: Union[Destination, Writer], **options) -> int:
+    """`export` with `VISIT_COLUMNS`."""
+    return export(items, destination, VISIT_COLUMNS, **options)
+
+
+def export_short_urls(items: Iterable[Any], destination: Union[Destination, Writer], **options) -> int:
+    """`export` with `SHORT_URL_COLUMNS`."""
+    return export(items, destination, SHORT_URL_COLUMNS, **options)
@@ -1,8 +1,17 @@
+from __future__ import annotations
+
 from json import dumps
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from shlink.client.const import MISSING
-from shlink.models.domain import DomainsView, Redirect
+from shlink.client.route import Route
+from shlink.client.utils.lazy import LazyModel
+
+if TYPE_CHECKING:
+    from shlink.models.domain import DomainsView, Redirect
+else:
+    DomainsView = LazyModel("shlink.models.domain:DomainsView")
+    Redirect = LazyModel("shlink.models.domain:Redirect")
 
 
 class Domain:
@@ -13,8 +22,7 @@ class Domain:
         It also includes the domain redirects, plus the default redirects that will be used for any
         non-explicitly-configured one.
         """
-        data = self._request(endpoint="/domains", method="GET")
-        return DomainsView.from_dict(data)
+        return self._request(Route("GET", "/domains"), model=DomainsView)
 
     def patch_domain(
         self,
@@ -39,7 +47,6 @@ class Domain:
         for key, value in data.items():
             if key not in ["self", "shortCode"] and value is not MISSING:
                 payload[key] = value
-        data = self._request(
-            endpoint="/domains/redirects", method="PATCH", data=dumps(payload)
+        return self._request(
+            Route("PATCH", "/domains/redirects"), data=dumps(payload), model=Redirect
         )
-        return Redirect.from_dict(data)
@@ -1,10 +1,21 @@
-from shlink.models.status import Status
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from shlink.client.route import Route
+from shlink.client.utils.lazy import LazyModel
+
+if TYPE_CHECKING:
+    from shlink.models.status import Status
+else:
+    Status = LazyModel("shlink.models.status:Status")
 
 
 class Health:
     def get_health(self) -> Status:
         """
         Checks the healthiness of the service, making sure it can access required resources.
+
+        An unhealthy service answers with a 503, returned as a `Status` with `status="fail"`.
         """
-        data = self._session.get(self.url + "rest/health").json()
-        return Status.from_dict(data)
+        return self._request(Route("GET", "/health", versioned=False, accepts=frozenset({503})), model=Status)
@@ -1,12 +1,50 @@
-from shlink.models.integration import Integration
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, Optional, Union
+
+from shlink.client.route import Route
+from shlink.client.utils.lazy import LazyModel
+
+if TYPE_CHECKING:
+    from shlink.client.mercure import AsyncMercureSubscriber, MercureSubscriber
+    from shlink.models.integration import Integration as IntegrationInfo
+else:
+    IntegrationInfo = LazyModel("shlink.models.integration:Integration")
 
 
 class Integration:
-    def get_mercure_info(self) -> Integration:
+    def get_mercure_info(self) -> IntegrationInfo:
         """
         Returns information to consume updates published by Shlink on a mercure hub.
 
         https://mercure.rocks/
         """
-        data = self._request(endpoint="/mercure-info", method="GET")
-        return Integration.from_dict(data)
+        return self._request(Route("GET", "/mercure-info"), model=IntegrationInfo)
+
+    def subscribe(
+        self,
+        topics: Optional[Iterable[str]] = None,
+        last_event_id: Optional[str] = None,
+        refresh_margin: float = 60.0,
+        reconnect_delay: float = 3.0,
+    ) -> Union[MercureSubscriber, AsyncMercureSubscriber]:
+        """
+        Subscribe to the updates Shlink publishes on its Mercure hub, instead of polling.
+
+        Iterate the returned subscriber (`async for` with `AsyncShlink`) to receive
+        `MercureUpdate`s as they are published.
+
+        Args:
+            topics: Topics to subscribe to, defaults to every new visit, see `shlink.client.mercure`
+            last_event_id: Resume after this event, e.g. the `id` of an update received earlier
+            refresh_margin: Seconds before the hub's JWT expires to get a new one
+            reconnect_delay: Seconds to wait before reconnecting, unless the hub says otherwise
+        """
+        options = {
+            "last_event_id": last_event_id,
+            "refresh_margin": refresh_margin,
+            "reconnect_delay": reconnect_delay,
+        }
+        if topics is not None:
+            options["topics"] = topics
+        return self._subscribe(**options)
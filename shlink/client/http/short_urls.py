@@ -1,10 +1,27 @@
+from __future__ import annotations
+
 from datetime import datetime
+from functools import partial
 from json import dumps
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Union
 
 from shlink.client.const import MISSING
-from shlink.models.short import ShortUrlsView, ShortURL
-from shlink.models.visits import VisitsView
+from shlink.client.route import Route
+from shlink.client.utils.lazy import LazyModel
+
+if TYPE_CHECKING:
+    from shlink.client.stream import StreamedPage
+    from shlink.models.bulk import BulkResult
+    from shlink.models.columnar import ColumnarVisitsView
+    from shlink.models.short import ShortUrlsView, ShortURL
+    from shlink.models.visits import Visit, VisitsView
+else:
+    BulkResult = LazyModel("shlink.models.bulk:BulkResult")
+    ColumnarVisitsView = LazyModel("shlink.models.columnar:ColumnarVisitsView")
+    ShortUrlsView = LazyModel("shlink.models.short:ShortUrlsView")
+    ShortURL = LazyModel("shlink.models.short:ShortURL")
+    Visit = LazyModel("shlink.models.visits:Visit")
+    VisitsView = LazyModel("shlink.models.visits:VisitsView")
 
 
 class ShortURLs:
@@ -18,7 +35,9 @@ class ShortURLs:
         orderBy: Optional[str] = None,
         startDate: Optional[datetime] = None,
         endDate: Optional[datetime] = None,
-    ) -> ShortUrlsView:
+        stream: bool = False,
+        raw: bool = False,
+    ) -> Union[ShortUrlsView, StreamedPage]:
         """
         Returns the list of short URLs.
 
@@ -35,15 +54,59 @@ class ShortURLs:
                 The field from which you want to order the result.
             startDate: The date from which we want to get short URLs.
             endDate: The date until which we want to get short URLs.
+            stream:
+                Return a `StreamedPage` decoding the short URLs as they are received,
+                instead of holding the whole page in memory
+            raw:
+                Stream the page like `stream`, but yield every item as the JSON dict
+                received, without building models
         """
-        if startDate:
-            startDate = startDate.isoformat()
-        if endDate:
-            endDate = endDate.isoformat()
         payload = locals()
-        del payload["self"]
-        data = self._request(endpoint="/short-urls", method="GET", data=dumps(payload))
-        return ShortUrlsView.from_dict(data)
+        del payload["self"], payload["stream"], payload["raw"]
+        if stream or raw:
+            model = None if raw else ShortURL
+            return self._stream(Route("GET", "/short-urls"), ("shortUrls", "data"), model, params=payload)
+        return self._request(Route("GET", "/short-urls"), params=payload, model=ShortUrlsView)
+
+    def iter_short_urls(
+        self,
+        itemsPerPage: int = 100,
+        searchTerm: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        tagsMode: Optional[str] = "any",
+        orderBy: Optional[str] = None,
+        startDate: Optional[datetime] = None,
+        endDate: Optional[datetime] = None,
+        concurrency: int = 1,
+        stream: bool = False,
+        raw: bool = False,
+    ) -> Iterator[ShortURL]:
+        """
+        Iterate over every short URL, fetching pages lazily as they are consumed.
+
+        Takes the same filters as `get_short_urls`.
+
+        Args:
+            itemsPerPage: The amount of items to fetch per request
+            concurrency:
+                How many pages to fetch at the same time. Above 1, the remaining pages
+                are prefetched once the first response reports the page count
+            stream: Decode every page as it's received, see `get_short_urls`
+            raw: Yield every item as a JSON dict, see `get_short_urls`
+        """
+        fetch = partial(
+            self.get_short_urls,
+            itemsPerPage=itemsPerPage,
+            searchTerm=searchTerm,
+            tags=tags,
+            tagsMode=tagsMode,
+            orderBy=orderBy,
+            startDate=startDate,
+            endDate=endDate,
+            stream=stream,
+            raw=raw,
+        )
+        return self._paginate(fetch, concurrency=concurrency)
 
     def create_short_url(
         self,
@@ -87,10 +150,40 @@ class ShortURLs:
                 The length for generated short code. It has to be at least 4 and defaults to 5.
                 It will be ignored when customSlug is provided
         """
+        if validSince:
+            validSince = validSince.isoformat()
+        if validUntil:
+            validUntil = validUntil.isoformat()
         payload = locals()
         del payload["self"]
-        data = self._request(endpoint="/short-urls", method="POST", params=payload)
-        return ShortURL.from_dict(data)
+        return self._request(Route("POST", "/short-urls"), data=dumps(payload), model=ShortURL)
+
+    def create_short_urls(
+        self, specs: Iterable[Union[str, Dict[str, Any]]], concurrency: int = 8
+    ) -> Iterator[BulkResult]:
+        """
+        Creates many short URLs, with up to `concurrency` requests in flight.
+
+        `specs` is consumed lazily, and one `BulkResult` is yielded per spec in input
+        order. A failing spec is reported through `BulkResult.error` and doesn't stop
+        the rest of the batch.
+
+        Args:
+            specs: Long URLs, or dicts of `create_short_url` arguments
+            concurrency: Maximum number of short URLs being created at the same time
+        """
+
+        def create(item):
+            return self.create_short_url(**item[1])
+
+        def result(item, shortUrl, error):
+            return BulkResult(index=item[0], spec=item[1], shortUrl=shortUrl, error=error)
+
+        items = (
+            (index, {"longUrl": spec} if isinstance(spec, str) else spec)
+            for index, spec in enumerate(specs)
+        )
+        return self._map_ordered(create, items, concurrency, result_factory=result)
 
     def shorten(self, longUrl: str) -> ShortURL:
         """
@@ -100,20 +193,20 @@ class ShortURLs:
             longURL: The long URL that this Short URL will redirect to
         """
         payload = {"apiKey": self.api_key, "longUrl": longUrl}
-        data = self._request(
-            endpoint="/short-urls/shorten", method="GET", params=payload
-        )
-        return ShortURL.from_dict(data)
+        return self._request(Route("GET", "/short-urls/shorten"), params=payload, model=ShortURL)
 
     def get_short_url(self, shortCode: str) -> ShortURL:
         """
         Get the long URL behind a short URL's short code.
 
+        Served from the client cache when one is configured.
+
         Args:
             shortCode: The short code to resolve
         """
-        data = self._request(endpoint=f"/short-urls/{shortCode}", method="GET")
-        return ShortURL.from_dict(data)
+        return self._request(
+            Route("GET", "/short-urls/{shortCode}", shortCode=shortCode), model=ShortURL, cached=True
+        )
 
     def delete_short_url(self, shortCode: str) -> None:
         """
@@ -122,8 +215,7 @@ class ShortURLs:
         Args:
             shortCode: The short code to resolve
         """
-        data = self._request(endpoint=f"/short-urls/{shortCode}", method="DELETE")
-        return data
+        return self._request(Route("DELETE", "/short-urls/{shortCode}", shortCode=shortCode))
 
     def edit_short_url(
         self,
@@ -162,10 +254,11 @@ class ShortURLs:
         for key, value in data.items():
             if key not in ["self", "shortCode"] and value is not MISSING:
                 payload[key] = value
-        data = self._request(
-            endpoint=f"/short-urls/{shortCode}", method="PATCH", data=dumps(payload)
+        return self._request(
+            Route("PATCH", "/short-urls/{shortCode}", shortCode=shortCode),
+            data=dumps(payload),
+            model=ShortURL,
         )
-        return ShortURL.from_dict(data)
 
     def get_code_visits(
         self,
@@ -176,7 +269,10 @@ class ShortURLs:
         page: int = 1,
         itemsPerPage: Optional[int] = MISSING,
         excludeBots: bool = True,
-    ) -> VisitsView:
+        columnar: bool = False,
+        stream: bool = False,
+        raw: bool = False,
+    ) -> Union[VisitsView, ColumnarVisitsView, StreamedPage]:
         """
         Get the list of visits on the short URL behind provided short code.
 
@@ -188,14 +284,62 @@ class ShortURLs:
             page: The page to display, default 1
             itemsPerPage: The amount of items to return on every page
             excludeBots: Whether or not to exclude bots
+            columnar: Decode the page into a `ColumnarVisitsView` instead of `Visit` objects
+            stream:
+                Return a `StreamedPage` decoding the visits as they are received,
+                instead of holding the whole page in memory
+            raw:
+                Stream the page like `stream`, but yield every item as the JSON dict
+                received, without building models
         """
         data = locals()
         payload = {}
         for key, value in data.items():
-            if key not in ["self", "shortCode"] and value is not MISSING:
+            if key not in ["self", "shortCode", "columnar", "stream", "raw"] and value is not MISSING:
                 payload[key] = value
 
-        data = self._request(
-            endpoint=f"/short-urls/{shortCode}/visits", method="GET", data=dumps(payload)
+        route = Route("GET", "/short-urls/{shortCode}/visits", shortCode=shortCode)
+        if stream or raw:
+            if columnar:
+                raise ValueError("A streamed page can't be decoded into columns")
+            return self._stream(route, ("visits", "data"), None if raw else Visit, params=payload)
+        return self._request(route, params=payload, model=ColumnarVisitsView if columnar else VisitsView)
+
+    def iter_code_visits(
+        self,
+        shortCode: str,
+        domain: Optional[str] = MISSING,
+        startDate: Optional[datetime] = MISSING,
+        endDate: Optional[datetime] = MISSING,
+        itemsPerPage: int = 100,
+        excludeBots: bool = True,
+        concurrency: int = 1,
+        stream: bool = False,
+        raw: bool = False,
+    ) -> Iterator[Visit]:
+        """
+        Iterate over every visit on the short URL behind provided short code,
+        fetching pages lazily as they are consumed.
+
+        Takes the same filters as `get_code_visits`.
+
+        Args:
+            itemsPerPage: The amount of items to fetch per request
+            concurrency:
+                How many pages to fetch at the same time. Above 1, the remaining pages
+                are prefetched once the first response reports the page count
+            stream: Decode every page as it's received, see `get_code_visits`
+            raw: Yield every item as a JSON dict, see `get_code_visits`
+        """
+        fetch = partial(
+            self.get_code_visits,
+            shortCode,
+            domain=domain,
+            startDate=startDate,
+            endDate=endDate,
+            itemsPerPage=itemsPerPage,
+            excludeBots=excludeBots,
+            stream=stream,
+            raw=raw,
         )
-        return VisitsView.from_dict(data)
+        return self._paginate(fetch, concurrency=concurrency)
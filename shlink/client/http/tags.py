@@ -1,9 +1,25 @@
+from __future__ import annotations
+
 from datetime import datetime
+from functools import partial
 from json import dumps
-from typing import List, Optional
+from typing import TYPE_CHECKING, Iterator, List, Optional, Union
+
+from shlink.client.route import Route
+from shlink.client.utils.lazy import LazyModel
 
-from shlink.models.tag import TagsView, TagStatsView
-from shlink.models.visits import VisitsView
+if TYPE_CHECKING:
+    from shlink.client.stream import StreamedPage
+    from shlink.models.columnar import ColumnarVisitsView
+    from shlink.models.tag import TagsView, TagStats, TagStatsView
+    from shlink.models.visits import Visit, VisitsView
+else:
+    ColumnarVisitsView = LazyModel("shlink.models.columnar:ColumnarVisitsView")
+    TagsView = LazyModel("shlink.models.tag:TagsView")
+    TagStats = LazyModel("shlink.models.tag:TagStats")
+    TagStatsView = LazyModel("shlink.models.tag:TagStatsView")
+    Visit = LazyModel("shlink.models.visits:Visit")
+    VisitsView = LazyModel("shlink.models.visits:VisitsView")
 
 
 class Tags:
@@ -22,8 +38,34 @@ class Tags:
             itemsPerPage: The amount of items to return on every page. Defaults to all items
             searchTerm: A query used to filter results by searching for it on the tag name
         """
-        data = self._request(endpoint="/tags", method="GET")
-        return TagsView.from_dict(data)
+        payload = {
+            "page": page,
+            "itemsPerPage": itemsPerPage,
+            "searchTerm": searchTerm,
+            "orderBy": orderBy,
+        }
+        return self._request(Route("GET", "/tags"), params=payload, model=TagsView)
+
+    def iter_tags(
+        self,
+        itemsPerPage: int = 100,
+        searchTerm: Optional[str] = None,
+        orderBy: Optional[str] = None,
+        concurrency: int = 1,
+    ) -> Iterator[str]:
+        """
+        Iterate over every tag, fetching pages lazily as they are consumed.
+
+        Takes the same filters as `get_tags`.
+
+        Args:
+            itemsPerPage: The amount of items to fetch per request
+            concurrency:
+                How many pages to fetch at the same time. Above 1, the remaining pages
+                are prefetched once the first response reports the page count
+        """
+        fetch = partial(self.get_tags, itemsPerPage=itemsPerPage, searchTerm=searchTerm, orderBy=orderBy)
+        return self._paginate(fetch, concurrency=concurrency)
 
     def edit_tag(self, oldName: str, newName: str) -> None:
         """
@@ -34,7 +76,7 @@ class Tags:
             newName: New name of the tag
         """
         payload = {"oldName": oldName, "newName": newName}
-        return self._request(endpoint="/tags", method="PATCH", data=dumps(payload))
+        return self._request(Route("PATCH", "/tags"), data=dumps(payload))
 
     def delete_tag(self, tags: List[str]) -> None:
         """
@@ -44,7 +86,7 @@ class Tags:
             tags: The names of the tags to delete
         """
         payload = {"tags": tags}
-        return self._request(endpoint="/tags", method="DELETE", data=dumps(payload))
+        return self._request(Route("DELETE", "/tags"), data=dumps(payload))
 
     def tag_stats(
         self,
@@ -68,8 +110,28 @@ class Tags:
             "searchTerm": searchTerm,
             "orderBy": orderBy,
         }
-        data = self._request(endpoint="/tags/stats", method="GET", params=payload)
-        return TagStatsView.from_dict(data)
+        return self._request(Route("GET", "/tags/stats"), params=payload, model=TagStatsView)
+
+    def iter_tag_stats(
+        self,
+        itemsPerPage: int = 100,
+        searchTerm: Optional[str] = None,
+        orderBy: Optional[str] = None,
+        concurrency: int = 1,
+    ) -> Iterator[TagStats]:
+        """
+        Iterate over the stats of every tag, fetching pages lazily as they are consumed.
+
+        Takes the same filters as `tag_stats`.
+
+        Args:
+            itemsPerPage: The amount of items to fetch per request
+            concurrency:
+                How many pages to fetch at the same time. Above 1, the remaining pages
+                are prefetched once the first response reports the page count
+        """
+        fetch = partial(self.tag_stats, itemsPerPage=itemsPerPage, searchTerm=searchTerm, orderBy=orderBy)
+        return self._paginate(fetch, concurrency=concurrency)
 
     def tag_visits(
         self,
@@ -79,7 +141,10 @@ class Tags:
         page: int = 1,
         itemsPerPage: Optional[int] = None,
         excludeBots: bool = True,
-    ) -> VisitsView:
+        columnar: bool = False,
+        stream: bool = False,
+        raw: bool = False,
+    ) -> Union[VisitsView, ColumnarVisitsView, StreamedPage]:
         """
         Get the list of visits on any short URL which is tagged with provided tag.
 
@@ -90,12 +155,60 @@ class Tags:
             page: The page to display, default 1
             itemsPerPage: The amount of items to return on every page. Defaults to all items
             excludeBots: Tells if visits from potential bots should be excluded from the result set
+            columnar: Decode the page into a `ColumnarVisitsView` instead of `Visit` objects
+            stream:
+                Return a `StreamedPage` decoding the visits as they are received,
+                instead of holding the whole page in memory
+            raw:
+                Stream the page like `stream`, but yield every item as the JSON dict
+                received, without building models
         """
         data = locals()
         payload = {}
         for key, value in data.items():
-            if key not in ["self", "tag"] and value:
+            if key not in ["self", "tag", "columnar", "stream", "raw"] and value:
                 payload[key] = value
 
-        data = self._request(endpoint=f"/tags/{tag}/visits", method="GET", params=payload)
-        return VisitsView.from_dict(data)
+        route = Route("GET", "/tags/{tag}/visits", tag=tag)
+        if stream or raw:
+            if columnar:
+                raise ValueError("A streamed page can't be decoded into columns")
+            return self._stream(route, ("visits", "data"), None if raw else Visit, params=payload)
+        return self._request(route, params=payload, model=ColumnarVisitsView if columnar else VisitsView)
+
+    def iter_tag_visits(
+        self,
+        tag: str,
+        startDate: Optional[datetime] = None,
+        endDate: Optional[datetime] = None,
+        itemsPerPage: int = 100,
+        excludeBots: bool = True,
+        concurrency: int = 1,
+        stream: bool = False,
+        raw: bool = False,
+    ) -> Iterator[Visit]:
+        """
+        Iterate over every visit on any short URL which is tagged with provided tag,
+        fetching pages lazily as they are consumed.
+
+        Takes the same filters as `tag_visits`.
+
+        Args:
+            itemsPerPage: The amount of items to fetch per request
+            concurrency:
+                How many pages to fetch at the same time. Above 1, the remaining pages
+                are prefetched once the first response reports the page count
+            stream: Decode every page as it's received, see `tag_visits`
+            raw: Yield every item as a JSON dict, see `tag_visits`
+        """
+        fetch = partial(
+            self.tag_visits,
+            tag,
+            startDate=startDate,
+            endDate=endDate,
+            itemsPerPage=itemsPerPage,
+            excludeBots=excludeBots,
+            stream=stream,
+            raw=raw,
+        )
+        return self._paginate(fetch, concurrency=concurrency)
@@ -1,8 +1,21 @@
+from __future__ import annotations
+
 from datetime import datetime
-from json import dumps
-from typing import Optional
+from functools import partial
+from typing import TYPE_CHECKING, Iterator, Optional, Union
+
+from shlink.client.route import Route
+from shlink.client.utils.lazy import LazyModel
 
-from shlink.models.visits import GenericVisits, VisitsView
+if TYPE_CHECKING:
+    from shlink.client.stream import StreamedPage
+    from shlink.models.columnar import ColumnarVisitsView
+    from shlink.models.visits import GenericVisits, Visit, VisitsView
+else:
+    ColumnarVisitsView = LazyModel("shlink.models.columnar:ColumnarVisitsView")
+    GenericVisits = LazyModel("shlink.models.visits:GenericVisits")
+    Visit = LazyModel("shlink.models.visits:Visit")
+    VisitsView = LazyModel("shlink.models.visits:VisitsView")
 
 
 class Visits:
@@ -10,8 +23,7 @@ class Visits:
         """
         Get general visits stats not linked to one specific short URL.
         """
-        data = self._request(endpoint="/visits", method="GET")
-        return GenericVisits.from_dict(data)
+        return self._request(Route("GET", "/visits"), model=GenericVisits)
 
     def get_orphan_visits(
         self,
@@ -20,7 +32,10 @@ class Visits:
         page: int = 1,
         itemsPerPage: Optional[int] = None,
         excludeBots: bool = True,
-    ) -> VisitsView:
+        columnar: bool = False,
+        stream: bool = False,
+        raw: bool = False,
+    ) -> Union[VisitsView, ColumnarVisitsView, StreamedPage]:
         """
         Get the list of visits to invalid short URLs, the base URL or any other 404.
 
@@ -31,15 +46,60 @@ class Visits:
             page: The page to display, default 1
             itemsPerPage: The amount of items to return on every page. Defaults to all items
             excludeBots: Tells if visits from potential bots should be excluded from the result set
+            columnar: Decode the page into a `ColumnarVisitsView` instead of `Visit` objects
+            stream:
+                Return a `StreamedPage` decoding the visits as they are received,
+                instead of holding the whole page in memory
+            raw:
+                Stream the page like `stream`, but yield every item as the JSON dict
+                received, without building models
         """
         data = locals()
         payload = {}
         for key, value in data.items():
-            if key != "self" and value:
+            if key not in ["self", "columnar", "stream", "raw"] and value:
                 payload[key] = value
 
-        data = self._request(endpoint="/visits/orphan", method="GET", data=dumps(payload))
-        return VisitsView.from_dict(data)
+        route = Route("GET", "/visits/orphan")
+        if stream or raw:
+            if columnar:
+                raise ValueError("A streamed page can't be decoded into columns")
+            return self._stream(route, ("visits", "data"), None if raw else Visit, params=payload)
+        return self._request(route, params=payload, model=ColumnarVisitsView if columnar else VisitsView)
+
+    def iter_orphan_visits(
+        self,
+        startDate: Optional[datetime] = None,
+        endDate: Optional[datetime] = None,
+        itemsPerPage: int = 100,
+        excludeBots: bool = True,
+        concurrency: int = 1,
+        stream: bool = False,
+        raw: bool = False,
+    ) -> Iterator[Visit]:
+        """
+        Iterate over every orphan visit, fetching pages lazily as they are consumed.
+
+        Takes the same filters as `get_orphan_visits`.
+
+        Args:
+            itemsPerPage: The amount of items to fetch per request
+            concurrency:
+                How many pages to fetch at the same time. Above 1, the remaining pages
+                are prefetched once the first response reports the page count
+            stream: Decode every page as it's received, see `get_orphan_visits`
+            raw: Yield every item as a JSON dict, see `get_orphan_visits`
+        """
+        fetch = partial(
+            self.get_orphan_visits,
+            startDate=startDate,
+            endDate=endDate,
+            itemsPerPage=itemsPerPage,
+            excludeBots=excludeBots,
+            stream=stream,
+            raw=raw,
+        )
+        return self._paginate(fetch, concurrency=concurrency)
 
     def get_nonorphan_visits(
         self,
@@ -48,7 +108,10 @@ class Visits:
         page: int = 1,
         itemsPerPage: Optional[int] = None,
         excludeBots: bool = True,
-    ) -> VisitsView:
+        columnar: bool = False,
+        stream: bool = False,
+        raw: bool = False,
+    ) -> Union[VisitsView, ColumnarVisitsView, StreamedPage]:
         """
         Get the list of visits to any short URL.
 
@@ -59,12 +122,57 @@ class Visits:
             page: The page to display, default 1
             itemsPerPage: The amount of items to return on every page. Defaults to all items
             excludeBots: Tells if visits from potential bots should be excluded from the result set
+            columnar: Decode the page into a `ColumnarVisitsView` instead of `Visit` objects
+            stream:
+                Return a `StreamedPage` decoding the visits as they are received,
+                instead of holding the whole page in memory
+            raw:
+                Stream the page like `stream`, but yield every item as the JSON dict
+                received, without building models
         """
         data = locals()
         payload = {}
         for key, value in data.items():
-            if key != "self" and value:
+            if key not in ["self", "columnar", "stream", "raw"] and value:
                 payload[key] = value
 
-        data = self._request(endpoint="/visits/non-orphan", method="GET", data=dumps(payload))
-        return VisitsView.from_dict(data)
+        route = Route("GET", "/visits/non-orphan")
+        if stream or raw:
+            if columnar:
+                raise ValueError("A streamed page can't be decoded into columns")
+            return self._stream(route, ("visits", "data"), None if raw else Visit, params=payload)
+        return self._request(route, params=payload, model=ColumnarVisitsView if columnar else VisitsView)
+
+    def iter_nonorphan_visits(
+        self,
+        startDate: Optional[datetime] = None,
+        endDate: Optional[datetime] = None,
+        itemsPerPage: int = 100,
+        excludeBots: bool = True,
+        concurrency: int = 1,
+        stream: bool = False,
+        raw: bool = False,
+    ) -> Iterator[Visit]:
+        """
+        Iterate over every visit to any short URL, fetching pages lazily as they are consumed.
+
+        Takes the same filters as `get_nonorphan_visits`.
+
+        Args:
+            itemsPerPage: The amount of items to fetch per request
+            concurrency:
+                How many pages to fetch at the same time. Above 1, the remaining pages
+                are prefetched once the first response reports the page count
+            stream: Decode every page as it's received, see `get_nonorphan_visits`
+            raw: Yield every item as a JSON dict, see `get_nonorphan_visits`
+        """
+        fetch = partial(
+            self.get_nonorphan_visits,
+            startDate=startDate,
+            endDate=endDate,
+            itemsPerPage=itemsPerPage,
+            excludeBots=excludeBots,
+            stream=stream,
+            raw=raw,
+        )
+        return self._paginate(fetch, concurrency=concurrency)
@@ -0,0 +1,217 @@
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+from attrs import evolve
+
+from shlink.client.const import MISSING
+from shlink.models.short import ShortURL
+
+__all__ = ("ShortUrlIndex", "normalize_url")
+
+# (domain, shortCode), the domain being None for the default one
+Key = Tuple[Optional[str], str]
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a long URL for lookups, so equivalent spellings of it match.
+
+    The scheme and host are lowercased, default ports dropped and an empty path
+    becomes `/`. The path, query and fragment are otherwise kept as-is, since
+    servers may treat them case-sensitively.
+    """
+    try:
+        parts = urlsplit(url.strip())
+        port = parts.port
+    except ValueError:
+        return url.strip()
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").rstrip(".")
+    if ":" in host:
+        host = f"[{host}]"
+    if port is not None and port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{port}"
+    if parts.username is not None or parts.password is not None:
+        userinfo = parts.username or ""
+        if parts.password is not None:
+            userinfo += ":" + parts.password
+        host = f"{userinfo}@{host}"
+    path = parts.path or ("/" if host else "")
+    return urlunsplit((scheme, host, path, parts.query, parts.fragment))
+
+
+def _domain(domain: Optional[str]) -> Optional[str]:
+    return domain.lower() if domain else None
+
+
+class ShortUrlIndex:
+    """
+    In-memory index of short URLs, answering lookups without a round trip to the server.
+
+    Build it from a full listing with `update(client.iter_short_urls())`, then pass it
+    as `Shlink(index=...)` so short URLs created, edited or deleted through the client,
+    and renamed or deleted tags, are reflected in it. Changes made by anyone else are
+    only picked up by updating it again.
+
+    Every lookup is a dictionary access, except `by_tags` which combines the posting
+    lists of the requested tags.
+
+    Args:
+        short_urls: Short URLs to index right away
+    """
+
+    def __init__(self, short_urls: Iterable[ShortURL] = ()):
+        self._short_urls: Dict[Key, ShortURL] = {}
+        self._long_urls: Dict[str, Set[Key]] = {}
+        self._domains: Dict[Optional[str], Set[Key]] = {}
+        self._tags: Dict[str, Set[Key]] = {}
+        self._lock = threading.Lock()
+        self.update(short_urls)
+
+    def __len__(self) -> int:
+        return len(self._short_urls)
+
+    def __iter__(self):
+        return iter(list(self._short_urls.values()))
+
+    def __contains__(self, shortCode: str) -> bool:
+        return (None, shortCode) in self._short_urls
+
+    def update(self, short_urls: Iterable[ShortURL]) -> None:
+        """Add short URLs to the index, replacing those already indexed under the same short code and domain."""
+        for short_url in short_urls:
+            self.add(short_url)
+
+    def add(self, short_url: ShortURL) -> None:
+        """Add a short URL to the index, replacing the one indexed under the same short code and domain."""
+        key = (_domain(short_url.domain), short_url.shortCode)
+        with self._lock:
+            self._discard(key)
+            self._short_urls[key] = short_url
+            self._long_urls.setdefault(normalize_url(short_url.longUrl), set()).add(key)
+            self._domains.setdefault(key[0], set()).add(key)
+            for tag in short_url.tags:
+                self._tags.setdefault(tag, set()).add(key)
+
+    def remove(self, shortCode: str, domain: Optional[str] = None) -> Optional[ShortURL]:
+        """Remove a short URL from the index, returning it if it was indexed."""
+        with self._lock:
+            return self._discard((_domain(domain), shortCode))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._short_urls.clear()
+            self._long_urls.clear()
+            self._domains.clear()
+            self._tags.clear()
+
+    def rename_tag(self, oldName: str, newName: str) -> None:
+        """Rename a tag on every indexed short URL, like `edit_tag` does on the server."""
+        with self._lock:
+            keys = self._tags.pop(oldName, set())
+            for key in keys:
+                short_url = self._short_urls[key]
+                tags = [newName if tag == oldName else tag for tag in short_url.tags]
+                self._short_urls[key] = evolve(short_url, tags=list(dict.fromkeys(tags)))
+            if keys:
+                self._tags.setdefault(newName, set()).update(keys)
+
+    def delete_tags(self, tags: Iterable[str]) -> None:
+        """Remove tags from every indexed short URL, like `delete_tag` does on the server."""
+        with self._lock:
+            deleted = set(tags)
+            for tag in deleted:
+                for key in self._tags.pop(tag, set()):
+                    short_url = self._short_urls[key]
+                    self._short_urls[key] = evolve(short_url, tags=[t for t in short_url.tags if t not in deleted])
+
+    def get(self, shortCode: str, domain: Optional[str] = None) -> Optional[ShortURL]:
+        """
+        Look up a short URL by its short code.
+
+        Custom slugs become the short code of the URL they're set on, so this is also
+        the lookup by `customSlug`.
+
+        Args:
+            shortCode: The short code or custom slug
+            domain: The domain the short code belongs to, `None` for the default domain
+        """
+        return self._short_urls.get((_domain(domain), shortCode))
+
+    def by_long_url(self, longUrl: str, domain: Optional[str] = MISSING) -> List[ShortURL]:
+        """
+        Short URLs redirecting to a long URL, compared once both are normalized.
+
+        Args:
+            longUrl: The long URL to look for
+            domain: Only return short URLs on this domain, `None` for the default domain
+        """
+        with self._lock:
+            keys = self._long_urls.get(normalize_url(longUrl), ())
+            if domain is not MISSING:
+                domain = _domain(domain)
+                keys = [key for key in keys if key[0] == domain]
+            return self._resolve(keys)
+
+    def has_long_url(self, longUrl: str, domain: Optional[str] = MISSING) -> bool:
+        """Whether a long URL is already shortened, see `by_long_url`."""
+        with self._lock:
+            keys = self._long_urls.get(normalize_url(longUrl))
+            if not keys:
+                return False
+            if domain is MISSING:
+                return True
+            domain = _domain(domain)
+            return any(key[0] == domain for key in keys)
+
+    def by_domain(self, domain: Optional[str]) -> List[ShortURL]:
+        """Short URLs on a domain, `None` for the default domain."""
+        with self._lock:
+            return self._resolve(self._domains.get(_domain(domain), ()))
+
+    def by_tags(self, tags: Iterable[str], tagsMode: str = "any") -> List[ShortURL]:
+        """
+        Short URLs carrying the provided tags, following Shlink's `tagsMode`.
+
+        Args:
+            tags: The tags to look for
+            tagsMode: `any` to match short URLs with at least one of the tags, `all` to require every one of them
+        """
+        if tagsMode not in ("any", "all"):
+            raise ValueError("tagsMode must be 'any' or 'all'")
+        with self._lock:
+            postings = [self._tags.get(tag, set()) for tag in dict.fromkeys(tags)]
+            if not postings:
+                return []
+            if tagsMode == "any":
+                keys = set().union(*postings)
+            else:
+                postings.sort(key=len)
+                keys = postings[0].intersection(*postings[1:])
+            return self._resolve(keys)
+
+    def _resolve(self, keys: Iterable[Key]) -> List[ShortURL]:
+        short_urls = self._short_urls
+        return [short_urls[key] for key in keys if key in short_urls]
+
+    def _discard(self, key: Key) -> Optional[ShortURL]:
+        """Remove a short URL from every posting list, the lock must be held."""
+        short_url = self._short_urls.pop(key, None)
+        if short_url is None:
+            return None
+        self._unpost(self._long_urls, normalize_url(short_url.longUrl), key)
+        self._unpost(self._domains, key[0], key)
+        for tag in short_url.tags:
+            self._unpost(self._tags, tag, key)
+        return short_url
+
+    @staticmethod
+    def _unpost(postings: dict, value, key: Key) -> None:
+        keys = postings.get(value)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del postings[value]
@@ -0,0 +1,198 @@
+import asyncio
+import json
+import time
+from typing import Any, AsyncIterator, Iterable, Iterator, List, Optional
+
+from shlink.client.retry import _transient_exceptions
+from shlink.client.utils.converters import timestamp_converter
+from shlink.client.utils.sse import ServerSentEvent, SSEParser
+from shlink.models.integration import Integration
+from shlink.models.mercure import MercureUpdate
+
+__all__ = (
+    "TOPIC_NEW_VISIT",
+    "TOPIC_NEW_ORPHAN_VISIT",
+    "TOPIC_NEW_SHORT_URL",
+    "visit_topic",
+    "MercureSubscriber",
+    "AsyncMercureSubscriber",
+)
+
+TOPIC_NEW_VISIT = "https://shlink.io/new-visit"
+TOPIC_NEW_ORPHAN_VISIT = "https://shlink.io/new-orphan-visit"
+TOPIC_NEW_SHORT_URL = "https://shlink.io/new-short-url"
+
+_UNAUTHORIZED = frozenset({401, 403})
+
+
+def visit_topic(shortCode: str) -> str:
+    """The topic of new visits on one short URL."""
+    return f"{TOPIC_NEW_VISIT}/{shortCode}"
+
+
+class _SubscriberBase:
+    def __init__(
+        self,
+        client: Any,
+        topics: Iterable[str] = (TOPIC_NEW_VISIT,),
+        last_event_id: Optional[str] = None,
+        refresh_margin: float = 60.0,
+        reconnect_delay: float = 3.0,
+    ):
+        self.client = client
+        self.topics = list(topics)
+        self.last_event_id = last_event_id
+        self.refresh_margin = refresh_margin
+        self.reconnect_delay = reconnect_delay
+        self._info: Optional[Integration] = None
+        self._refresh_at = 0.0
+        self._response = None
+        self._closed = False
+
+    def _needs_token(self) -> bool:
+        return self._info is None or time.time() >= self._refresh_at
+
+    def _set_info(self, info: Integration) -> None:
+        self._info = info
+        self._refresh_at = timestamp_converter(info.jwtExpiration).timestamp() - self.refresh_margin
+
+    def _request_options(self) -> dict:
+        headers = {
+            "Accept": "text/event-stream",
+            "Cache-Control": "no-cache",
+            "Authorization": f"Bearer {self._info.jwt}",
+        }
+        if self.last_event_id is not None:
+            headers["Last-Event-ID"] = self.last_event_id
+        return {"headers": headers, "params": {"topic": self.topics}, "stream": True}
+
+    def _updates(self, parser: SSEParser, events: List[ServerSentEvent]) -> List[MercureUpdate]:
+        if parser.retry is not None:
+            self.reconnect_delay = parser.retry / 1000
+        updates = []
+        for event in events:
+            updates.append(MercureUpdate.from_dict({**json.loads(event.data), "id": event.id}))
+            self.last_event_id = event.id
+        return updates
+
+    def _should_reconnect(self, status: int, unauthorized: int) -> bool:
+        """Whether a failed subscription is worth retrying, after refreshing the token if needed."""
+        if status in _UNAUTHORIZED:
+            # The token may have been revoked early, but don't loop on a token that never works
+            self._info = None
+            return unauthorized < 2
+        return status == 429 or status >= 500
+
+
+class MercureSubscriber(_SubscriberBase):
+    """
+    Receives the updates Shlink publishes on its Mercure hub, as they happen.
+
+    Iterating it connects to the hub with the JWT from `get_mercure_info` and yields
+    a `MercureUpdate` per event. The JWT is refreshed `refresh_margin` seconds before
+    it expires, which is checked whenever data is received, Mercure's heartbeats
+    included. Dropped connections are resumed after `reconnect_delay` seconds (or the
+    server's `retry`), passing the last event ID so no update is missed.
+
+    Args:
+        client: The `Shlink` client to get the hub URL and tokens from, and send requests with
+        topics: Topics to subscribe to, see `TOPIC_NEW_VISIT` and `visit_topic`
+        last_event_id: Resume after this event, e.g. the `id` of an update received earlier
+        refresh_margin: Seconds before the JWT expires to get a new one
+        reconnect_delay: Seconds to wait before reconnecting
+    """
+
+    def __iter__(self) -> Iterator[MercureUpdate]:
+        unauthorized = 0
+        while not self._closed:
+            if self._needs_token():
+                self._set_info(self.client.get_mercure_info())
+            try:
+                self._response = response = self.client.transport.request(
+                    "GET", self._info.mercureHubUrl, **self._request_options()
+                )
+            except _transient_exceptions():
+                time.sleep(self.reconnect_delay)
+                continue
+
+            try:
+                if not 200 <= response.status_code < 300:
+                    unauthorized = unauthorized + 1 if response.status_code in _UNAUTHORIZED else 0
+                    if not self._should_reconnect(response.status_code, unauthorized):
+                        response.read()
+                        self.client._process(response)
+                    time.sleep(0 if response.status_code in _UNAUTHORIZED else self.reconnect_delay)
+                    continue
+                unauthorized = 0
+                parser = SSEParser(self.last_event_id)
+                for chunk in response.iter_bytes():
+                    yield from self._updates(parser, parser.feed(chunk))
+                    if self._needs_token():
+                        break  # Reconnect with a fresh token before the hub drops us
+                else:
+                    time.sleep(self.reconnect_delay)
+            except Exception as error:
+                if self._closed:
+                    return
+                if not isinstance(error, _transient_exceptions()):
+                    raise
+                time.sleep(self.reconnect_delay)
+            finally:
+                response.close()
+                self._response = None
+
+    def close(self) -> None:
+        """Stop receiving updates, closing the connection to the hub."""
+        self._closed = True
+        if self._response is not None:
+            self._response.close()
+
+
+class AsyncMercureSubscriber(_SubscriberBase):
+    """Asyncio version of `MercureSubscriber`, for `AsyncShlink` and iterated with `async for`."""
+
+    async def __aiter__(self) -> AsyncIterator[MercureUpdate]:
+        unauthorized = 0
+        while not self._closed:
+            if self._needs_token():
+                self._set_info(await self.client.get_mercure_info())
+            try:
+                self._response = response = await self.client.transport.request(
+                    "GET", self._info.mercureHubUrl, **self._request_options()
+                )
+            except _transient_exceptions():
+                await asyncio.sleep(self.reconnect_delay)
+                continue
+
+            try:
+                if not 200 <= response.status_code < 300:
+                    unauthorized = unauthorized + 1 if response.status_code in _UNAUTHORIZED else 0
+                    if not self._should_reconnect(response.status_code, unauthorized):
+                        await response.aread()
+                        self.client._process(response)
+                    await asyncio.sleep(0 if response.status_code in _UNAUTHORIZED else self.reconnect_delay)
+                    continue
+                unauthorized = 0
+                parser = SSEParser(self.last_event_id)
+                async for chunk in response.aiter_bytes():
+                    for update in self._updates(parser, parser.feed(chunk)):
+                        yield update
+                    if self._needs_token():
+                        break
+                else:
+                    await asyncio.sleep(self.reconnect_delay)
+            except Exception as error:
+                if self._closed:
+                    return
+                if not isinstance(error, _transient_exceptions()):
+                    raise
+                await asyncio.sleep(self.reconnect_delay)
+            finally:
+                await response.aclose()
+                self._response = None
+
+    async def aclose(self) -> None:
+        """Stop receiving updates, closing the connection to the hub."""
+        self._closed = True
+        if self._response is not None:
+            await self._response.aclose()
@@ -0,0 +1,184 @@
+import bisect
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from attrs import define, field
+
+__all__ = ("DEFAULT_BUCKETS", "EndpointStats", "Histogram", "Metrics", "RequestRecord")
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram of durations in seconds, like a Prometheus histogram.
+
+    Args:
+        buckets: Upper bounds of the buckets, an implicit `+Inf` bucket is added
+    """
+
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def merge(self, other: "Histogram") -> None:
+        if other.buckets != self.buckets:
+            raise ValueError("Can't merge histograms with different buckets")
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.sum += other.sum
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile as the upper bound of the bucket it falls in."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """`(upper bound, observations at or below it)` pairs, ending with `+Inf`."""
+        total = 0
+        pairs = []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+
+@define(kw_only=True, slots=True)
+class RequestRecord:
+    """
+    Measurements of a single API request.
+
+    `http_time` covers sending the request and receiving the body, including retries,
+    `decode_time` the JSON parsing and `model_time` building the models.
+    """
+
+    method: str = field()
+    endpoint: str = field()
+    status: Optional[int] = field(default=None)
+    bytes_out: int = field(default=0)
+    bytes_in: int = field(default=0)
+    http_time: float = field(default=0.0)
+    decode_time: float = field(default=0.0)
+    model_time: float = field(default=0.0)
+
+
+class EndpointStats:
+    """Aggregated `RequestRecord`s of one method and endpoint template."""
+
+    __slots__ = ("requests", "errors", "bytes_out", "bytes_in", "http", "decode", "model")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.requests = 0
+        self.errors = 0
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.http = Histogram(buckets)
+        self.decode = Histogram(buckets)
+        self.model = Histogram(buckets)
+
+    def add(self, record: RequestRecord) -> None:
+        self.requests += 1
+        if record.status is None or not 200 <= record.status < 400:
+            self.errors += 1
+        self.bytes_out += record.bytes_out
+        self.bytes_in += record.bytes_in
+        self.http.observe(record.http_time)
+        self.decode.observe(record.decode_time)
+        self.model.observe(record.model_time)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Metrics:
+    """
+    Collects per-endpoint request metrics from a client, passed as `Shlink(metrics=...)`.
+
+    Requests are grouped by method and path template (`/short-urls/{shortCode}/visits`)
+    rather than the expanded URL. Every record is also handed to the listeners
+    registered with `add_listener`, e.g. to forward them to another metrics system.
+
+    Args:
+        buckets: Histogram bucket upper bounds, in seconds
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._stats: Dict[Tuple[str, str], EndpointStats] = {}
+        self._listeners: List[Callable[[RequestRecord], None]] = []
+        self._lock = threading.Lock()
+
+    def add_listener(self, listener: Callable[[RequestRecord], None]) -> None:
+        """Call `listener` with every `RequestRecord`."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[RequestRecord], None]) -> None:
+        self._listeners.remove(listener)
+
+    def record(self, record: RequestRecord) -> None:
+        key = (record.method, record.endpoint)
+        with self._lock:
+            if (stats := self._stats.get(key)) is None:
+                stats = self._stats[key] = EndpointStats(self.buckets)
+            stats.add(record)
+        for listener in self._listeners:
+            listener(record)
+
+    def stats(self) -> Dict[Tuple[str, str], EndpointStats]:
+        """The collected stats, keyed by `(method, endpoint template)`."""
+        with self._lock:
+            return dict(self._stats)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def render_prometheus(self, prefix: str = "shlink_client") -> str:
+        """Render the collected stats in the Prometheus text exposition format."""
+        stats = sorted(self.stats().items())
+        lines = []
+        for name, attribute, help_text in [
+            ("requests_total", "requests", "Requests sent"),
+            ("errors_total", "errors", "Requests that failed or got an error status"),
+            ("sent_bytes_total", "bytes_out", "Request body bytes sent"),
+            ("received_bytes_total", "bytes_in", "Response body bytes received"),
+        ]:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            for (method, endpoint), endpoint_stats in stats:
+                labels = f'method="{method}",endpoint="{_escape(endpoint)}"'
+                lines.append(f"{prefix}_{name}{{{labels}}} {getattr(endpoint_stats, attribute)}")
+
+        for name, attribute, help_text in [
+            ("http_seconds", "http", "Time spent on the network"),
+            ("decode_seconds", "decode", "Time spent parsing JSON"),
+            ("model_seconds", "model", "Time spent building models"),
+        ]:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} histogram")
+            for (method, endpoint), endpoint_stats in stats:
+                labels = f'method="{method}",endpoint="{_escape(endpoint)}"'
+                histogram = getattr(endpoint_stats, attribute)
+                for bound, count in histogram.cumulative():
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f'{prefix}_{name}_bucket{{{labels},le="{le}"}} {count}')
+                lines.append(f"{prefix}_{name}_sum{{{labels}}} {histogram.sum}")
+                lines.append(f"{prefix}_{name}_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
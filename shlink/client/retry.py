@@ -0,0 +1,185 @@
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, FrozenSet, Optional, Tuple, Type
+
+from shlink.client.utils.lazy import asyncio
+
+__all__ = ("RetryPolicy", "AdaptiveLimiter", "AsyncAdaptiveLimiter", "THROTTLE_STATUSES")
+
+# Statuses meaning the server is pushing back rather than failing the request
+THROTTLE_STATUSES = frozenset({429, 503})
+
+
+def _transient_exceptions() -> Tuple[Type[BaseException], ...]:
+    # requests' connection and timeout errors are OSErrors, httpx has its own hierarchy.
+    # httpx errors can only be raised once an httpx transport imported it
+    httpx = sys.modules.get("httpx")
+    if httpx is None:
+        return (OSError,)
+    return (OSError, httpx.TransportError)
+
+
+def retry_after(response: Any) -> Optional[float]:
+    """Seconds the server asked to wait through `Retry-After`, if it did."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    from email.utils import parsedate_to_datetime
+
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """
+    When and how long to wait before retrying a request.
+
+    Idempotent requests are retried on transient statuses and connection errors.
+    A 429 is retried for any method, as the server didn't process the request.
+    Waits follow `Retry-After` when sent, otherwise exponential backoff with full jitter.
+
+    Args:
+        max_attempts: Total number of attempts, including the first one
+        backoff: Base delay in seconds, doubled on every attempt
+        max_backoff: Upper bound for a single delay in seconds
+        statuses: Response statuses worth retrying
+        methods: Methods safe to retry on any of `statuses` or a connection error
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        statuses: FrozenSet[int] = frozenset({429, 502, 503, 504}),
+        methods: FrozenSet[str] = frozenset({"GET", "PUT", "DELETE"}),
+    ):
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.statuses = statuses
+        self.methods = methods
+
+    def should_retry(
+        self, method: str, attempt: int, response: Any = None, error: Optional[BaseException] = None
+    ) -> bool:
+        """
+        Whether a failed attempt should be retried.
+
+        Args:
+            method: The request method
+            attempt: Number of attempts made so far, starting at 1
+            response: The response received, if any
+            error: The exception raised instead of a response, if any
+        """
+        if attempt >= self.max_attempts:
+            return False
+        if error is not None:
+            return method in self.methods and isinstance(error, _transient_exceptions())
+        if response.status_code == 429:
+            return True
+        return response.status_code in self.statuses and method in self.methods
+
+    def delay(self, attempt: int, response: Any = None) -> float:
+        """Seconds to wait before the next attempt."""
+        if response is not None and (wait := retry_after(response)) is not None:
+            return min(wait, self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+
+
+class _AIMD:
+    """
+    Additive-increase/multiplicative-decrease state shared by the limiters.
+
+    The limit grows by `increase` per limit's worth of successful requests, and is
+    multiplied by `decrease` when the server throttles, at most once per `cooldown`.
+    """
+
+    def __init__(
+        self,
+        initial: int = 8,
+        minimum: int = 1,
+        maximum: int = 64,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        cooldown: float = 1.0,
+    ):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self.in_flight = 0
+        self._last_decrease = 0.0
+
+    def _has_room(self) -> bool:
+        return self.in_flight < int(self.limit)
+
+    def _update(self, throttled: bool) -> None:
+        self.in_flight -= 1
+        if throttled:
+            now = time.monotonic()
+            if now - self._last_decrease >= self.cooldown:
+                self.limit = max(self.minimum, self.limit * self.decrease)
+                self._last_decrease = now
+        else:
+            self.limit = min(self.maximum, self.limit + self.increase / self.limit)
+
+
+class AdaptiveLimiter(_AIMD):
+    """
+    Caps the number of requests a `Shlink` client has in flight, adapting the cap
+    to server back-pressure (AIMD).
+
+    Args:
+        initial: Starting number of concurrent requests
+        minimum: Lowest the limit can go
+        maximum: Highest the limit can go
+        increase: How much the limit grows per limit's worth of successes
+        decrease: Factor applied to the limit when throttled
+        cooldown: Minimum seconds between two decreases
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._condition = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._condition:
+            self._condition.wait_for(self._has_room)
+            self.in_flight += 1
+
+    def release(self, throttled: bool = False) -> None:
+        with self._condition:
+            self._update(throttled)
+            self._condition.notify_all()
+
+
+class AsyncAdaptiveLimiter(_AIMD):
+    """Asyncio version of `AdaptiveLimiter`, for `AsyncShlink`."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._condition = None
+
+    async def acquire(self) -> None:
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        async with self._condition:
+            await self._condition.wait_for(self._has_room)
+            self.in_flight += 1
+
+    async def release(self, throttled: bool = False) -> None:
+        async with self._condition:
+            self._update(throttled)
+            self._condition.notify_all()
@@ -0,0 +1,48 @@
+from typing import Any, Dict, FrozenSet
+from urllib.parse import quote
+
+
+class Route:
+    """
+    A single Shlink API call, described independently of the client executing it.
+
+    Routes keep the path template (`/short-urls/{shortCode}`) separate from its
+    parameters so both the sync and async clients can build requests the same way.
+
+    Args:
+        method: Request type, oneof DELETE, GET, PATCH, POST, PUT
+        path: Path template, relative to the versioned REST API
+        versioned: Whether the path lives under `rest/v2` or directly under `rest`
+        accepts:
+            Error statuses answered with a regular body, which is decoded rather
+            than raised or retried, e.g. a 503 for a failing health check
+        **parameters: Values used to fill in the path template
+    """
+
+    __slots__ = ("method", "path", "versioned", "accepts", "parameters")
+
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        versioned: bool = True,
+        accepts: FrozenSet[int] = frozenset(),
+        **parameters: Any,
+    ):
+        self.method = method
+        self.path = path
+        self.versioned = versioned
+        self.accepts = accepts
+        self.parameters: Dict[str, Any] = parameters
+
+    def __repr__(self) -> str:
+        return f"<Route {self.method} {self.endpoint}>"
+
+    @property
+    def endpoint(self) -> str:
+        """The path with its parameters filled in and quoted."""
+        if not self.parameters:
+            return self.path
+        return self.path.format_map(
+            {key: quote(str(value), safe="") for key, value in self.parameters.items()}
+        )
@@ -0,0 +1,143 @@
+import time
+from typing import Any, AsyncIterator, Callable, Iterator, List, Optional, Sequence
+
+from shlink.client.metrics import RequestRecord
+from shlink.client.utils.jsonstream import ArrayStreamParser
+from shlink.models import Pagination
+
+__all__ = ("StreamedPage", "AsyncStreamedPage")
+
+
+class _StreamedPageBase:
+    def __init__(
+        self,
+        response: Any,
+        path: Sequence[str],
+        model: Any,
+        record: Optional[RequestRecord] = None,
+        on_close: Optional[Callable[[], None]] = None,
+    ):
+        self._response = response
+        self._parser = ArrayStreamParser(path)
+        self._model = model
+        self._record = record
+        self._on_close = on_close
+        self._iterated = False
+        self._closed = False
+
+    @property
+    def data(self):
+        return self
+
+    @property
+    def pagination(self) -> Pagination:
+        """
+        The page's pagination, known once every item was consumed.
+
+        Raises:
+            RuntimeError if the server hasn't sent it yet
+        """
+        container = self._parser.rest
+        for key in self._parser.path[:-1]:
+            container = container.get(key, {})
+        if "pagination" not in container:
+            raise RuntimeError("The pagination of a streamed page is only known once its data was consumed")
+        return Pagination.from_dict(container["pagination"])
+
+    def _start(self) -> None:
+        if self._iterated:
+            raise RuntimeError("A streamed page can only be iterated once")
+        self._iterated = True
+
+    def _decode(self, chunk: Optional[bytes]) -> List[Any]:
+        """Models completed by `chunk`, or the last ones when the body ended (`None`)."""
+        start = time.perf_counter()
+        items = self._parser.close() if chunk is None else self._parser.feed(chunk)
+        decoded = time.perf_counter()
+        models = self._model.from_list(items) if items and self._model is not None else items
+        if (record := self._record) is not None:
+            record.bytes_in += len(chunk or b"")
+            record.decode_time += decoded - start
+            record.model_time += time.perf_counter() - decoded
+        return models
+
+    def _receive_time(self, seconds: float) -> None:
+        if self._record is not None:
+            self._record.http_time += seconds
+
+    def _finish(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self._on_close is not None:
+            self._on_close()
+
+
+class StreamedPage(_StreamedPageBase):
+    """
+    A listing page decoded while it's being received, returned with `stream=True`.
+
+    Iterate it, or its `data`, to get the models as each one arrives (or the JSON
+    dicts, with `raw=True`); it can only be iterated once. Only the items of the
+    chunk being decoded are held in memory, so large `itemsPerPage` values don't
+    need a matching amount of memory. The response is closed once iterated, use
+    `close()` or `with` to stop early.
+    """
+
+    def __iter__(self) -> Iterator[Any]:
+        self._start()
+        try:
+            chunks = iter(self._response.iter_bytes())
+            while True:
+                start = time.perf_counter()
+                chunk = next(chunks, None)
+                self._receive_time(time.perf_counter() - start)
+                yield from self._decode(chunk)
+                if chunk is None:
+                    break
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Release the connection, dropping whatever wasn't consumed."""
+        self._response.close()
+        self._finish()
+
+    def __enter__(self) -> "StreamedPage":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+
+class AsyncStreamedPage(_StreamedPageBase):
+    """Asyncio version of `StreamedPage`, iterated with `async for`."""
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        self._start()
+        try:
+            chunks = self._response.aiter_bytes().__aiter__()
+            while True:
+                start = time.perf_counter()
+                try:
+                    chunk = await chunks.__anext__()
+                except StopAsyncIteration:
+                    chunk = None
+                self._receive_time(time.perf_counter() - start)
+                for model in self._decode(chunk):
+                    yield model
+                if chunk is None:
+                    break
+        finally:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        """Release the connection, dropping whatever wasn't consumed."""
+        await self._response.aclose()
+        self._finish()
+
+    async def __aenter__(self) -> "AsyncStreamedPage":
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        await self.aclose()
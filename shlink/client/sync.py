@@ -0,0 +1,238 @@
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from collections import Counter
+from datetime import datetime, timezone
+from hashlib import blake2b
+from typing import Callable, Dict, Iterator, Optional
+
+from attrs import define, field
+
+from shlink.client.const import MISSING
+from shlink.client.utils.converters import timestamp_converter
+from shlink.models.visits import Visit
+
+__all__ = (
+    "Cursor",
+    "CursorStore",
+    "MemoryCursorStore",
+    "JSONCursorStore",
+    "SQLiteCursorStore",
+    "VisitSync",
+    "visit_key",
+)
+
+
+def visit_key(visit: Visit) -> str:
+    """
+    A stable identifier for a visit. Shlink doesn't expose visit IDs, so it's a digest
+    of every field the API returns.
+    """
+    location = visit.visitLocation
+    parts = [
+        visit.date.isoformat(),
+        visit.referer,
+        visit.userAgent,
+        visit.visitedUrl,
+        visit.type,
+        str(visit.potentialBot),
+    ]
+    if location is not None:
+        parts += [location.countryCode, location.cityName, str(location.latitude), str(location.longitude)]
+    return blake2b("\x1f".join(part or "" for part in parts).encode(), digest_size=12).hexdigest()
+
+
+@define(kw_only=True, slots=True)
+class Cursor:
+    """
+    High-water mark of a synced visit source.
+
+    `keys` counts the `visit_key`s already emitted at exactly `date`, since Shlink's
+    `startDate` filter is inclusive.
+    """
+
+    date: datetime = field(converter=timestamp_converter)
+    keys: Dict[str, int] = field(factory=dict)
+
+    def to_json(self) -> str:
+        return json.dumps({"date": self.date.isoformat(), "keys": self.keys})
+
+    @classmethod
+    def from_json(cls, data: str) -> "Cursor":
+        return cls(**json.loads(data))
+
+
+class CursorStore:
+    """Interface for persisting `Cursor`s by source name."""
+
+    def get(self, source: str) -> Optional[Cursor]:
+        raise NotImplementedError
+
+    def set(self, source: str, cursor: Cursor) -> None:
+        raise NotImplementedError
+
+
+class MemoryCursorStore(CursorStore):
+    """Keeps cursors for the lifetime of the process."""
+
+    def __init__(self):
+        self._cursors: Dict[str, Cursor] = {}
+
+    def get(self, source: str) -> Optional[Cursor]:
+        return self._cursors.get(source)
+
+    def set(self, source: str, cursor: Cursor) -> None:
+        self._cursors[source] = cursor
+
+
+class JSONCursorStore(CursorStore):
+    """
+    Keeps cursors in a JSON file, rewritten atomically on every update.
+
+    Args:
+        path: The file to store cursors in, created on first write
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, str]:
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def get(self, source: str) -> Optional[Cursor]:
+        with self._lock:
+            data = self._load().get(source)
+        return Cursor.from_json(data) if data else None
+
+    def set(self, source: str, cursor: Cursor) -> None:
+        with self._lock:
+            data = self._load()
+            data[source] = cursor.to_json()
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.path)))
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp, self.path)
+
+
+class SQLiteCursorStore(CursorStore):
+    """
+    Keeps cursors in a SQLite database.
+
+    Args:
+        path: Path of the database, or `:memory:`
+    """
+
+    def __init__(self, path: str):
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._db:
+            self._db.execute("CREATE TABLE IF NOT EXISTS cursors (source TEXT PRIMARY KEY, cursor TEXT NOT NULL)")
+
+    def get(self, source: str) -> Optional[Cursor]:
+        with self._lock:
+            row = self._db.execute("SELECT cursor FROM cursors WHERE source = ?", (source,)).fetchone()
+        return Cursor.from_json(row[0]) if row else None
+
+    def set(self, source: str, cursor: Cursor) -> None:
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO cursors (source, cursor) VALUES (?, ?)", (source, cursor.to_json())
+            )
+
+    def close(self) -> None:
+        self._db.close()
+
+
+class VisitSync:
+    """
+    Incrementally pull visits, only fetching what previous runs haven't emitted.
+
+    Every method returns a generator of new visits, newest first as Shlink lists them.
+    Each run only requests visits from the stored cursor up to the moment the run
+    started, so pages don't shift while it's paging. The cursor is saved once the
+    generator is exhausted; a run that stops early is simply repeated next time.
+
+    Args:
+        client: A `Shlink` client
+        store: Where cursors are persisted
+        itemsPerPage: The amount of visits to fetch per request
+    """
+
+    def __init__(self, client, store: CursorStore, itemsPerPage: int = 1000):
+        self.client = client
+        self.store = store
+        self.itemsPerPage = itemsPerPage
+
+    def code_visits(self, shortCode: str, domain: Optional[str] = MISSING, excludeBots: bool = True) -> Iterator[Visit]:
+        """New visits on the short URL behind provided short code."""
+        source = f"code:{domain or ''}/{shortCode}"
+        return self._sync(
+            source,
+            lambda startDate, endDate: self.client.iter_code_visits(
+                shortCode,
+                domain=domain,
+                startDate=startDate,
+                endDate=endDate,
+                itemsPerPage=self.itemsPerPage,
+                excludeBots=excludeBots,
+            ),
+        )
+
+    def tag_visits(self, tag: str, excludeBots: bool = True) -> Iterator[Visit]:
+        """New visits on any short URL tagged with provided tag."""
+        return self._sync(
+            f"tag:{tag}",
+            lambda startDate, endDate: self.client.iter_tag_visits(
+                tag, startDate=startDate, endDate=endDate, itemsPerPage=self.itemsPerPage, excludeBots=excludeBots
+            ),
+        )
+
+    def orphan_visits(self, excludeBots: bool = True) -> Iterator[Visit]:
+        """New orphan visits."""
+        return self._sync(
+            "orphan",
+            lambda startDate, endDate: self.client.iter_orphan_visits(
+                startDate=startDate, endDate=endDate, itemsPerPage=self.itemsPerPage, excludeBots=excludeBots
+            ),
+        )
+
+    def nonorphan_visits(self, excludeBots: bool = True) -> Iterator[Visit]:
+        """New visits on any short URL."""
+        return self._sync(
+            "non-orphan",
+            lambda startDate, endDate: self.client.iter_nonorphan_visits(
+                startDate=startDate, endDate=endDate, itemsPerPage=self.itemsPerPage, excludeBots=excludeBots
+            ),
+        )
+
+    def _sync(self, source: str, iterate: Callable[..., Iterator[Visit]]) -> Iterator[Visit]:
+        cursor = self.store.get(source)
+        newest = cursor.date if cursor else None
+        newest_keys = Counter(cursor.keys) if cursor else Counter()
+        skip = Counter(cursor.keys) if cursor else Counter()
+
+        for visit in iterate(startDate=newest, endDate=datetime.now(timezone.utc)):
+            key = visit_key(visit)
+            if cursor is not None and visit.date <= cursor.date:
+                if visit.date < cursor.date:
+                    continue
+                if skip[key] > 0:
+                    skip[key] -= 1
+                    continue
+
+            if newest is None or visit.date > newest:
+                newest = visit.date
+                newest_keys = Counter()
+            if visit.date == newest:
+                newest_keys[key] += 1
+            yield visit
+
+        if newest is not None:
+            self.store.set(source, Cursor(date=newest, keys=dict(newest_keys)))
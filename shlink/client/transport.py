@@ -0,0 +1,258 @@
+import threading
+from typing import Any, Dict, Iterator, Optional
+
+# requests and httpx take longer to import than the rest of the client, so they are
+# only imported once a transport using them is created
+__all__ = ("Transport", "AsyncTransport", "RequestsTransport", "HttpxTransport", "AsyncHttpxTransport")
+
+
+def _require_httpx(name: str):
+    try:
+        import httpx
+    except ImportError:
+        raise ImportError(f"{name} requires httpx, install shlink-py[async]") from None
+    return httpx
+
+
+class Transport:
+    """
+    Sends HTTP requests for `Shlink`.
+
+    Implementations return a response object with `status_code`, `headers`,
+    `content` and `json()`, as `requests` and `httpx` responses do.
+
+    With `stream`, the body isn't read up front; the response then also has
+    `iter_bytes()`, `read()` and `close()`, as `httpx` responses do.
+    """
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        data: Optional[str] = None,
+        params: Optional[dict] = None,
+        stream: bool = False,
+    ) -> Any:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        raise NotImplementedError
+
+
+class AsyncTransport:
+    """
+    Sends HTTP requests for `AsyncShlink`, see `Transport`.
+
+    Streamed responses have `aiter_bytes()`, `aread()` and `aclose()` instead.
+    """
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        data: Optional[str] = None,
+        params: Optional[dict] = None,
+        stream: bool = False,
+    ) -> Any:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        raise NotImplementedError
+
+
+class _StreamedResponse:
+    """Gives a streamed `requests` response the `httpx` streaming methods."""
+
+    def __init__(self, response: Any, chunk_size: int):
+        self._response = response
+        self._chunk_size = chunk_size
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._response, name)
+
+    def iter_bytes(self) -> Iterator[bytes]:
+        # `iter_content` waits for a full chunk unless the body uses chunked encoding,
+        # `read1` hands over whatever arrived, which event streams rely on. requests
+        # leaves the raw response undecoded, so gzip and deflate are undone here
+        raw = self._response.raw
+        if not hasattr(raw, "read1"):  # urllib3 < 2
+            yield from self._response.iter_content(self._chunk_size)
+            return
+        while chunk := raw.read1(self._chunk_size, decode_content=True):
+            yield chunk
+
+    def read(self) -> bytes:
+        return self._response.content
+
+    def close(self) -> None:
+        self._response.close()
+
+
+class RequestsTransport(Transport):
+    """
+    HTTP/1.1 transport on `requests`, the default for `Shlink`.
+
+    A `requests.Session` isn't meant to be shared between threads, so with
+    `per_thread_sessions` every thread sending requests gets its own. They are
+    cheap: all of them send through the same connection pool, which `pool_block`
+    keeps to `pool_maxsize` connections however many threads there are.
+
+    Args:
+        pool_connections: Number of per-host connection pools to keep
+        pool_maxsize: Maximum number of connections kept per host
+        pool_block: Wait for a free connection instead of opening extra, unpooled ones
+        connect_timeout: Seconds to wait for a connection, `None` to wait forever
+        read_timeout: Seconds to wait for response data, `None` to wait forever
+        chunk_size: Maximum bytes read from the socket at once when streaming a response
+        per_thread_sessions: Give every thread its own session over the shared pool
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        chunk_size: int = 65536,
+        per_thread_sessions: bool = False,
+    ):
+        from requests.adapters import HTTPAdapter
+
+        self.timeout = (connect_timeout, read_timeout)
+        self.chunk_size = chunk_size
+        self.adapter = HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block
+        )
+        self.closed = False
+        self._local = threading.local() if per_thread_sessions else None
+        self._session = None if per_thread_sessions else self._new_session()
+
+    def _new_session(self) -> Any:
+        from requests import Session
+
+        session = Session()
+        session.mount("https://", self.adapter)
+        session.mount("http://", self.adapter)
+        return session
+
+    @property
+    def session(self) -> Any:
+        """The `requests.Session` requests from the current thread are sent with."""
+        if self._local is None:
+            return self._session
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = self._new_session()
+        return session
+
+    def request(self, method, url, headers=None, data=None, params=None, stream=False):
+        if self.closed:
+            raise RuntimeError("The transport is closed")
+        response = self.session.request(
+            method=method, url=url, headers=headers, data=data, params=params, timeout=self.timeout, stream=stream
+        )
+        return _StreamedResponse(response, self.chunk_size) if stream else response
+
+    def close(self) -> None:
+        # Sessions only hold the adapter, closing it closes every pooled connection
+        self.closed = True
+        self.adapter.close()
+
+
+def _httpx_options(
+    httpx,
+    http2: bool,
+    max_connections: Optional[int],
+    max_keepalive_connections: Optional[int],
+    keepalive_expiry: Optional[float],
+    connect_timeout: Optional[float],
+    read_timeout: Optional[float],
+) -> dict:
+    return {
+        "http2": http2,
+        "limits": httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        "timeout": httpx.Timeout(None, connect=connect_timeout, read=read_timeout),
+    }
+
+
+class HttpxTransport(Transport):
+    """
+    Transport on an `httpx.Client`, supporting HTTP/2 multiplexing. The client is
+    thread-safe, so a single one is shared by every thread.
+
+    httpx limits connections across all hosts rather than per host; a client only
+    talks to one Shlink instance, so the two are the same here.
+
+    Args:
+        http2:
+            Negotiate HTTP/2, multiplexing requests over few connections. Needs `h2`,
+            e.g. from `httpx[http2]`
+        max_connections: Maximum number of open connections
+        max_keepalive_connections: Maximum number of idle connections kept open
+        keepalive_expiry: Seconds an idle connection is kept open
+        connect_timeout: Seconds to wait for a connection, `None` to wait forever
+        read_timeout: Seconds to wait for response data, `None` to wait forever
+    """
+
+    def __init__(
+        self,
+        http2: bool = False,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        connect_timeout: Optional[float] = 5.0,
+        read_timeout: Optional[float] = None,
+    ):
+        httpx = _require_httpx(type(self).__name__)
+        self.session = httpx.Client(
+            **_httpx_options(
+                httpx,
+                http2, max_connections, max_keepalive_connections, keepalive_expiry, connect_timeout, read_timeout
+            )
+        )
+
+    def request(self, method, url, headers=None, data=None, params=None, stream=False):
+        request = self.session.build_request(method=method, url=url, headers=headers, content=data, params=params)
+        return self.session.send(request, stream=stream)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class AsyncHttpxTransport(AsyncTransport):
+    """
+    Transport on an `httpx.AsyncClient`, the default for `AsyncShlink`.
+
+    Takes the same options as `HttpxTransport`.
+    """
+
+    def __init__(
+        self,
+        http2: bool = False,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        connect_timeout: Optional[float] = 5.0,
+        read_timeout: Optional[float] = None,
+    ):
+        httpx = _require_httpx(type(self).__name__)
+        self.session = httpx.AsyncClient(
+            **_httpx_options(
+                httpx,
+                http2, max_connections, max_keepalive_connections, keepalive_expiry, connect_timeout, read_timeout
+            )
+        )
+
+    async def request(self, method, url, headers=None, data=None, params=None, stream=False):
+        request = self.session.build_request(method=method, url=url, headers=headers, content=data, params=params)
+        return await self.session.send(request, stream=stream)
+
+    async def close(self) -> None:
+        await self.session.aclose()
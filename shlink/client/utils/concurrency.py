@@ -0,0 +1,180 @@
+import threading
+import typing
+from collections import deque
+
+from shlink.client.utils.lazy import asyncio
+
+T = typing.TypeVar("T")
+R = typing.TypeVar("R")
+
+
+ResultFactory = typing.Callable[[T, typing.Optional[R], typing.Optional[Exception]], typing.Any]
+
+
+def _call(fn: typing.Callable, item: T, result_factory: typing.Optional[ResultFactory]) -> typing.Any:
+    if result_factory is None:
+        return fn(item)
+    try:
+        result = fn(item)
+    except Exception as error:
+        return result_factory(item, None, error)
+    return result_factory(item, result, None)
+
+
+async def _acall(fn: typing.Callable, item: T, result_factory: typing.Optional[ResultFactory]) -> typing.Any:
+    if result_factory is None:
+        return await fn(item)
+    try:
+        result = await fn(item)
+    except Exception as error:
+        return result_factory(item, None, error)
+    return result_factory(item, result, None)
+
+
+def ordered_map(
+    fn: typing.Callable[[T], R],
+    items: typing.Iterable[T],
+    concurrency: int,
+    result_factory: typing.Optional[ResultFactory] = None,
+) -> typing.Iterator[R]:
+    """
+    Run `fn` over `items` on a thread pool, yielding results in input order.
+
+    At most `concurrency` calls are in flight, and `items` is consumed lazily,
+    so arbitrarily long inputs can be streamed through.
+
+    args:
+        fn: The function to call for every item
+        items: The items to process
+        concurrency: Maximum number of concurrent calls
+        result_factory:
+            Called as `result_factory(item, result, error)` to build what is yielded.
+            When given, exceptions raised by `fn` are passed to it instead of propagating
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    pool = ThreadPoolExecutor(max_workers=concurrency)
+    pending = deque()
+    try:
+        for item in items:
+            pending.append(pool.submit(_call, fn, item, result_factory))
+            if len(pending) >= concurrency:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+async def aordered_map(
+    fn: typing.Callable[[T], typing.Awaitable[R]],
+    items: typing.Iterable[T],
+    concurrency: int,
+    result_factory: typing.Optional[ResultFactory] = None,
+) -> typing.AsyncIterator[R]:
+    """
+    Asyncio version of `ordered_map`, running `fn` as tasks on the current loop.
+
+    args:
+        fn: The coroutine function to call for every item
+        items: The items to process
+        concurrency: Maximum number of concurrent calls
+        result_factory: See `ordered_map`
+    """
+    pending = deque()
+    try:
+        for item in items:
+            pending.append(asyncio.ensure_future(_acall(fn, item, result_factory)))
+            if len(pending) >= concurrency:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+class _Flight:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: typing.Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesce identical concurrent calls, so only one of them runs.
+
+    Threads calling `do` with a key that is already in flight wait for that call
+    and share its result, or its exception. Once it completes, the next call with
+    the key runs again: nothing is cached.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: typing.Dict[typing.Hashable, _Flight] = {}
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    def do(self, key: typing.Hashable, fn: typing.Callable[[], R]) -> R:
+        """
+        Run `fn`, unless a call with the same key is in flight.
+
+        args:
+            key: Identifies calls that are interchangeable
+            fn: The call to run
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = fn()
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result
+
+
+class AsyncSingleFlight:
+    """
+    Asyncio version of `SingleFlight`.
+
+    The call runs as a task shared by every caller, so cancelling one of them
+    doesn't fail the others.
+    """
+
+    def __init__(self):
+        self._flights: typing.Dict[typing.Hashable, typing.Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    async def do(self, key: typing.Hashable, fn: typing.Callable[[], typing.Awaitable[R]]) -> R:
+        """
+        Await `fn()`, unless a call with the same key is in flight.
+
+        args:
+            key: Identifies calls that are interchangeable
+            fn: The coroutine function to call
+        """
+        task = self._flights.get(key)
+        if task is None:
+            task = self._flights[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda _: self._flights.pop(key, None))
+        return await asyncio.shield(task)
@@ -1,23 +1,66 @@
 import inspect
 import re
+import sys
 import typing
 from datetime import datetime
+from functools import lru_cache
 
 from shlink.client.const import MISSING
 
-iso8601 = re.compile(
-    r"^([\+-]?\d{4}(?!\d{2}\b))((-?)((0[1-9]|1[0-2])(\3([12]\d|0[1-9]|3[01]))?"
-    r"|W([0-4]\d|5[0-2])(-?[1-7])?|(00[1-9]|0[1-9]\d|[12]\d{2}|3([0-5]\d|6[1-6])))"
-    r"([T\s]((([01]\d|2[0-3])((:?)[0-5]\d)?|24\:?00)([\.,]\d+(?!:))?)?(\17[0-5]\d"
-    r"([\.,]\d+)?)?([zZ]|([\+-])([01]\d|2[0-3]):?([0-5]\d)?)?)?)?$"
-)
+
+@lru_cache(maxsize=None)
+def _iso8601() -> typing.Pattern:
+    # Compiled on first use, Shlink's own timestamps never need it
+    return re.compile(
+        r"^([\+-]?\d{4}(?!\d{2}\b))((-?)((0[1-9]|1[0-2])(\3([12]\d|0[1-9]|3[01]))?"
+        r"|W([0-4]\d|5[0-2])(-?[1-7])?|(00[1-9]|0[1-9]\d|[12]\d{2}|3([0-5]\d|6[1-6])))"
+        r"([T\s]((([01]\d|2[0-3])((:?)[0-5]\d)?|24\:?00)([\.,]\d+(?!:))?)?(\17[0-5]\d"
+        r"([\.,]\d+)?)?([zZ]|([\+-])([01]\d|2[0-3]):?([0-5]\d)?)?)?)?$"
+    )
+
+
+def _parse_iso8601(timestamp: str) -> typing.Optional[datetime]:
+    # Shlink emits ATOM timestamps (`2022-03-01T10:00:00+00:00`), which `fromisoformat`
+    # parses and validates on its own; the general regex is only needed for anything else
+    if len(timestamp) == 25 and timestamp[10] == "T" and timestamp[19] in "+-":
+        try:
+            return datetime.fromisoformat(timestamp)
+        except ValueError:
+            pass
+    if timestamp and timestamp[-1] in "zZ":
+        timestamp = timestamp[:-1] + "+00:00"
+    if _iso8601().match(timestamp):
+        return datetime.fromisoformat(timestamp)
+    return None
+
+
+_parse_timestamp = _parse_iso8601
+
+
+def enable_timestamp_cache(maxsize: int = 4096) -> None:
+    """
+    Memoize parsed timestamp strings in a bounded LRU.
+
+    Useful when decoding pages where many visits share the same second.
+
+    args:
+        maxsize: Maximum number of timestamps remembered
+    """
+    global _parse_timestamp
+    _parse_timestamp = lru_cache(maxsize=maxsize)(_parse_iso8601)
+
+
+def disable_timestamp_cache() -> None:
+    """Stop memoizing parsed timestamps and drop the memo."""
+    global _parse_timestamp
+    _parse_timestamp = _parse_iso8601
 
 
 def timestamp_converter(timestamp: int | str | datetime) -> typing.Optional[datetime]:
+    if isinstance(timestamp, str):
+        return _parse_timestamp(timestamp)
     if isinstance(timestamp, datetime):
         return timestamp
-    if isinstance(timestamp, str) and iso8601.match(timestamp):
-        return datetime.fromisoformat(timestamp)
     if isinstance(timestamp, (int, float)):
         return datetime.fromtimestamp(timestamp)
 
@@ -28,6 +71,7 @@ def list_converter(converter) -> typing.Callable[[list], list]:
     def convert_action(value: list) -> list:
         return [converter(element) for element in value]
 
+    convert_action.element_converter = converter  # Lets compiled decoders inline the loop
     return convert_action
 
 
@@ -60,4 +104,11 @@ def optional(converter: typing.Callable) -> typing.Any:
         if sig.return_annotation is not inspect.Signature.empty:
             optional_converter.__annotations__["return"] = typing.Optional[sig.return_annotation]
 
+    optional_converter.converter = converter  # Lets compiled decoders inline the check
     return optional_converter
+
+
+# Model fields repeating the same few values (countries, user agents, tags...) share a
+# single string object instead of each holding its own copy of it
+intern_converter = optional(sys.intern)
+
@@ -0,0 +1,116 @@
+import typing
+
+import attr
+
+from shlink.client.const import MISSING
+
+__all__ = ("compile_decoder",)
+
+
+def _find_slot(cls: type, name: str) -> typing.Any:
+    for klass in cls.__mro__:
+        if name in klass.__dict__:
+            return klass.__dict__[name]
+    return None
+
+
+def _is_inherited(method: typing.Any, qualname: str) -> bool:
+    """Whether a bound classmethod is the mixin's own implementation rather than an override."""
+    return getattr(getattr(method, "__func__", None), "__qualname__", None) == qualname
+
+
+class _Emitter:
+    """Collects the names referenced by the generated source."""
+
+    def __init__(self):
+        self.namespace: typing.Dict[str, typing.Any] = {"_M": MISSING}
+
+    def ref(self, prefix: str, value: typing.Any) -> str:
+        name = f"_{prefix}{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def converter(self, converter: typing.Callable, value: str) -> str:
+        """Return an expression applying `converter` to the expression `value`, inlined where possible."""
+        if (element := getattr(converter, "element_converter", None)) is not None:
+            return f"[{self.converter(element, '_e')} for _e in {value}]"
+        if (inner := getattr(converter, "converter", None)) is not None:
+            return f"({value} if {value} is None or {value} is _M else {self.converter(inner, value)})"
+
+        if _is_inherited(converter, "DictSerializationMixin.from_dict"):
+            # Nested models go straight to their own compiled decoder
+            decoder = converter.__self__._get_decoder()
+            if getattr(decoder, "compiled", False):
+                converter = decoder
+        return f"{self.ref('c', converter)}({value})"
+
+
+def compile_decoder(cls: type) -> typing.Optional[typing.Callable[[dict], typing.Any]]:
+    """
+    Generate a `from_dict` for an attrs model that writes API keys straight into its slots.
+
+    Converters are inlined and `__init__` is skipped, so a model is built with one dict
+    lookup and one slot write per field. Returns None for classes it can't handle
+    (no slots, validators, or factories taking self); those keep the generic path.
+
+    args:
+        cls: The attrs class to build a decoder for
+    """
+    if not attr.has(cls) or "__slots__" not in cls.__dict__:
+        return None
+
+    emit = _Emitter()
+    lines = [
+        "def from_dict(data):",
+        "    if isinstance(data, cls):",
+        "        return data",
+    ]
+    if not _is_inherited(cls._process_dict, "DictSerializationMixin._process_dict"):
+        lines.append("    data = process(data)")
+    lines += ["    get = data.get", "    self = new(cls)"]
+    for a in attr.fields(cls):
+        slot = _find_slot(cls, a.name)
+        if a.validator is not None or not hasattr(slot, "__set__"):
+            return None
+
+        key = a.name.removeprefix("_")
+        default = a.default
+        if isinstance(default, attr.Factory):
+            if default.takes_self:
+                return None
+            default_expr = f"{emit.ref('f', default.factory)}()"
+        elif default is attr.NOTHING:
+            default_expr = None
+        else:
+            default_expr = emit.ref("d", default)
+
+        if not a.init:
+            if default_expr is None:
+                continue
+            lines.append(f"    v = {default_expr}")
+        elif default_expr is None:
+            message = f"{cls.__name__} missing required field {a.name!r}"
+            lines.append(f"    v = get({key!r}, _M)")
+            lines.append("    if v is _M:")
+            lines.append(f"        raise TypeError({message!r})")
+        elif isinstance(default, attr.Factory):
+            lines.append(f"    v = get({key!r}, _M)")
+            lines.append("    if v is _M:")
+            lines.append(f"        v = {default_expr}")
+        else:
+            lines.append(f"    v = get({key!r}, {default_expr})")
+
+        value = emit.converter(a.converter, "v") if a.converter is not None else "v"
+        lines.append(f"    {emit.ref('s', slot.__set__)}(self, {value})")
+
+    if hasattr(cls, "__attrs_post_init__"):
+        lines.append("    self.__attrs_post_init__()")
+    lines.append("    return self")
+
+    emit.namespace.update(cls=cls, process=cls._process_dict, new=object.__new__)
+    source = "\n".join(lines)
+    exec(source, emit.namespace)
+    decoder = emit.namespace["from_dict"]
+    decoder.compiled = True
+    decoder.source = source
+    return decoder
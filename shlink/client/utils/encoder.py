@@ -0,0 +1,84 @@
+import typing
+from datetime import datetime, timezone
+
+__all__ = ("Column", "compile_row_encoder")
+
+
+class Column(typing.NamedTuple):
+    """
+    A flat export column.
+
+    args:
+        name: The column name
+        path: Keys, or attribute names, leading to the value from the top-level item
+        type: One of `str`, `int`, `float`, `bool`, `datetime` or `list`
+        default: Value of the column when a JSON dict lacks it, like the model's default
+    """
+
+    name: str
+    path: typing.Tuple[str, ...]
+    type: str = "str"
+    default: typing.Any = None
+
+
+def _isoformat(value: typing.Optional[datetime]) -> typing.Optional[str]:
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.isoformat()
+
+
+def compile_row_encoder(
+    columns: typing.Sequence[Column], models: bool
+) -> typing.Callable[[typing.Any], typing.Tuple[typing.Any, ...]]:
+    """
+    Generate a function flattening one item into a tuple of column values.
+
+    Items are either the JSON dicts of a listing, or the models built from them;
+    both give the same row, with dates as ISO-8601 strings. Nested objects are
+    looked up once per item however many columns read from them, and missing
+    ones give `None` values.
+
+    args:
+        columns: The columns of the row, in order
+        models: Whether items are models rather than JSON dicts
+    """
+    lines = ["def encode(item):"]
+    namespace: typing.Dict[str, typing.Any] = {"_iso": _isoformat}
+    parents: typing.Dict[typing.Tuple[str, ...], str] = {(): "item"}
+
+    def parent(path: typing.Tuple[str, ...]) -> str:
+        if path not in parents:
+            outer = parent(path[:-1])
+            name = parents[path] = f"_p{len(parents)}"
+            value = f"{outer}.{path[-1]}" if models else f"{outer}.get({path[-1]!r})"
+            if outer != "item":
+                value = f"None if {outer} is None else {value}"
+            lines.append(f"    {name} = {value}")
+        return parents[path]
+
+    values = []
+    for column in columns:
+        outer = parent(column.path[:-1])
+        key = column.path[-1]
+        if models:
+            value = f"{outer}.{key}"
+            if outer != "item":
+                value = f"(None if {outer} is None else {value})"
+            if column.type == "datetime":
+                value = f"_iso({value})"
+        else:
+            value = f"{outer}.get({key!r})"
+            if column.default is not None:
+                value = f"{outer}.get({key!r}, {column.default!r})"
+            if outer != "item":
+                value = f"(None if {outer} is None else {value})"
+        values.append(value)
+    lines.append(f"    return ({', '.join(values)},)")
+
+    source = "\n".join(lines)
+    exec(source, namespace)
+    encoder = namespace["encode"]
+    encoder.source = source
+    return encoder
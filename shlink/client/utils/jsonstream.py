@@ -0,0 +1,152 @@
+import codecs
+import json
+import re
+import typing
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Parser states
+_VALUE, _KEY, _COLON, _MEMBER, _OBJECT_NEXT, _ITEM_FIRST, _ITEM, _ITEM_NEXT, _DONE = range(9)
+
+
+class ArrayStreamParser:
+    """
+    Incrementally extracts the elements of one array nested in a JSON document.
+
+    Bytes are pushed with `feed` as they arrive, which returns the elements completed
+    so far. Only the element being received is buffered, so memory depends on the
+    size of an element rather than of the document. Everything outside of the array
+    is kept in `rest`, with the same nesting as the document.
+
+    args:
+        path: Object keys leading to the array, e.g. `("visits", "data")`
+    """
+
+    def __init__(self, path: typing.Sequence[str]):
+        self.path = tuple(path)
+        self.rest: typing.Dict[str, typing.Any] = {}
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._scan = json.JSONDecoder().raw_decode
+        self._buffer = ""
+        self._pos = 0
+        self._state = _VALUE
+        self._stack: typing.List[typing.Dict[str, typing.Any]] = []
+        self._key: typing.Optional[str] = None
+        self._eof = False
+
+    @property
+    def done(self) -> bool:
+        return self._state == _DONE
+
+    def feed(self, chunk: bytes) -> typing.List[typing.Any]:
+        """Add received bytes, returning the array elements they completed."""
+        self._buffer = self._buffer[self._pos :] + self._decoder.decode(chunk)
+        self._pos = 0
+        return self._parse()
+
+    def close(self) -> typing.List[typing.Any]:
+        """Signal the end of the document, returning the last elements."""
+        self._buffer = self._buffer[self._pos :] + self._decoder.decode(b"", final=True)
+        self._pos = 0
+        self._eof = True
+        items = self._parse()
+        if self._state != _DONE:
+            raise ValueError("Truncated JSON document")
+        return items
+
+    def _skip(self) -> typing.Optional[str]:
+        """Skip whitespace, returning the next character if any was received."""
+        self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+        return self._buffer[self._pos] if self._pos < len(self._buffer) else None
+
+    def _value(self) -> typing.Tuple[bool, typing.Any]:
+        """Decode a whole value, unless it hasn't been completely received yet."""
+        try:
+            value, end = self._scan(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if self._eof:
+                raise
+            return False, None
+        # A number or literal at the very end of the buffer may still continue
+        if end == len(self._buffer) and not self._eof and not isinstance(value, (dict, list, str)):
+            return False, None
+        self._pos = end
+        return True, value
+
+    def _expect(self, char: str, expected: str) -> None:
+        if char != expected:
+            raise ValueError(f"Expected {expected!r} at {'/'.join(self.path[: len(self._stack)])}, got {char!r}")
+        self._pos += 1
+
+    def _parse(self) -> typing.List[typing.Any]:
+        items = []
+        while self._state != _DONE and (char := self._skip()) is not None:
+            state = self._state
+            depth = len(self._stack)
+
+            if state == _VALUE:
+                # A value on the path: an object to descend into, or the array itself
+                if depth == len(self.path):
+                    self._expect(char, "[")
+                    self._state = _ITEM_FIRST
+                else:
+                    self._expect(char, "{")
+                    container = self.rest if not self._stack else self._stack[-1].setdefault(self._key, {})
+                    self._stack.append(container)
+                    self._state = _KEY
+
+            elif state == _KEY:
+                if char == "}":
+                    self._close_object()
+                    continue
+                complete, key = self._value()
+                if not complete:
+                    break
+                if not isinstance(key, str):
+                    raise ValueError("Expected an object key")
+                self._key = key
+                self._state = _COLON
+
+            elif state == _COLON:
+                self._expect(char, ":")
+                self._state = _VALUE if self._key == self.path[depth - 1] else _MEMBER
+
+            elif state == _MEMBER:
+                # A value off the path, kept whole
+                complete, value = self._value()
+                if not complete:
+                    break
+                self._stack[-1][self._key] = value
+                self._state = _OBJECT_NEXT
+
+            elif state == _OBJECT_NEXT:
+                if char == "}":
+                    self._close_object()
+                else:
+                    self._expect(char, ",")
+                    self._state = _KEY
+
+            elif state in (_ITEM_FIRST, _ITEM):
+                if state == _ITEM_FIRST and char == "]":
+                    self._pos += 1
+                    self._state = _OBJECT_NEXT
+                    continue
+                complete, value = self._value()
+                if not complete:
+                    break
+                items.append(value)
+                self._state = _ITEM_NEXT
+
+            elif state == _ITEM_NEXT:
+                if char == "]":
+                    self._pos += 1
+                    self._state = _OBJECT_NEXT
+                else:
+                    self._expect(char, ",")
+                    self._state = _ITEM
+        return items
+
+    def _close_object(self) -> None:
+        self._pos += 1
+        self._stack.pop()
+        self._state = _OBJECT_NEXT if self._stack else _DONE
@@ -0,0 +1,67 @@
+import importlib
+import typing
+
+
+class LazyModel:
+    """
+    Stands in for a model class, importing it the first time it's used.
+
+    The HTTP mixins reference every model, building all of their attrs classes
+    whenever the client is imported. Through this, a model's module is only
+    imported once a request returning it is made.
+
+    args:
+        path: Where the model lives, as `module:ClassName`
+    """
+
+    __slots__ = ("path", "_model")
+
+    def __init__(self, path: str):
+        self.path = path
+        self._model = None
+
+    def resolve(self) -> type:
+        if self._model is None:
+            module, _, name = self.path.partition(":")
+            self._model = getattr(importlib.import_module(module), name)
+        return self._model
+
+    def from_dict(self, data: typing.Dict[str, typing.Any]) -> typing.Any:
+        return self.resolve().from_dict(data)
+
+    def __call__(self, *args, **kwargs) -> typing.Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> typing.Any:
+        return getattr(self.resolve(), name)
+
+    def __repr__(self) -> str:
+        return f"<LazyModel {self.path}>"
+
+
+class LazyModule:
+    """
+    Stands in for a module, importing it the first time one of its attributes is used.
+
+    args:
+        name: The module to import
+    """
+
+    __slots__ = ("name", "_module")
+
+    def __init__(self, name: str):
+        self.name = name
+        self._module = None
+
+    def __getattr__(self, name: str) -> typing.Any:
+        if self._module is None:
+            self._module = importlib.import_module(self.name)
+        return getattr(self._module, name)
+
+    def __repr__(self) -> str:
+        return f"<LazyModule {self.name}>"
+
+
+# The asyncio halves of the client live next to the synchronous code they mirror, and
+# import it through this so that synchronous users never do
+asyncio = LazyModule("asyncio")
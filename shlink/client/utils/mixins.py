@@ -1,8 +1,9 @@
-from typing import Any, Dict, List, TypeVar
+from typing import Any, Callable, Dict, List, TypeVar
 
 import attr
 
 from shlink.client.utils import serializer
+from shlink.client.utils.decoder import compile_decoder
 
 
 T = TypeVar("T")
@@ -45,6 +46,14 @@ class DictSerializationMixin:
         """
         return data
 
+    @classmethod
+    def _get_decoder(cls) -> Callable[[Dict[str, Any]], Any]:
+        """Returns the decoder compiled for this exact class, building it on first use."""
+        if (decoder := cls.__dict__.get("_decoder")) is None:
+            decoder = compile_decoder(cls) or cls._from_dict_generic
+            setattr(cls, "_decoder", decoder)
+        return decoder
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]):
         """
@@ -54,6 +63,11 @@ class DictSerializationMixin:
             data: The json data received from schlink api.
 
         """
+        return cls._get_decoder()(data)
+
+    @classmethod
+    def _from_dict_generic(cls, data: Dict[str, Any]):
+        """`from_dict` through `__init__`, used for classes the decoder can't be compiled for."""
         if isinstance(data, cls):
             return data
 
@@ -69,7 +83,8 @@ class DictSerializationMixin:
             data: The json data received from schlink api.
 
         """
-        return [cls.from_dict(data) for data in datas]
+        decoder = cls._get_decoder()
+        return [decoder(data) for data in datas]
 
     def update_from_dict(self: T, data: Dict[str, Any]) -> T:
         """Updates object attribute(s) with new json data received from schlink api."""
@@ -0,0 +1,76 @@
+import typing
+from functools import lru_cache
+
+import attr
+
+from shlink.client.utils.decoder import _find_slot, _is_inherited
+
+__all__ = ("compile_packer", "get_packer")
+
+Packer = typing.Tuple[typing.Callable[[typing.Any], tuple], typing.Callable[[tuple], typing.Any]]
+
+
+def _nested(converter: typing.Any) -> typing.Tuple[str, typing.Optional[type]]:
+    """What a field holds, judging from its converter: a `model`, a `list` of models, or `None` for plain values."""
+    if (element := getattr(converter, "element_converter", None)) is not None:
+        kind, model = _nested(element)
+        return ("list", model) if kind == "model" else (None, None)
+    if (inner := getattr(converter, "converter", None)) is not None:
+        return _nested(inner)
+    if _is_inherited(converter, "DictSerializationMixin.from_dict"):
+        return "model", converter.__self__
+    return None, None
+
+
+def compile_packer(cls: type) -> typing.Optional[Packer]:
+    """
+    Generate a `pack` flattening a model into a tuple of its field values, and the `unpack` reversing it.
+
+    Tuples of builtins pickle and unpickle in C, and `unpack` writes the values straight
+    into the slots of a new instance without running converters, so a model can be
+    shipped across processes for much less than it costs to decode it. Nested models,
+    and lists of them, are packed recursively. Returns None for classes it can't handle
+    (no slots, or nested models that can't be packed).
+
+    args:
+        cls: The attrs class to build a packer for
+    """
+    if not attr.has(cls) or "__slots__" not in cls.__dict__:
+        return None
+
+    namespace: typing.Dict[str, typing.Any] = {"cls": cls, "new": object.__new__}
+    packed, unpack = [], ["def unpack(values):", "    self = new(cls)"]
+    for index, a in enumerate(attr.fields(cls)):
+        slot = _find_slot(cls, a.name)
+        if not hasattr(slot, "__set__"):
+            return None
+        namespace[f"_s{index}"] = slot.__set__
+        value, stored = f"self.{a.name}", f"values[{index}]"
+
+        kind, model = _nested(a.converter)
+        if kind is not None:
+            if (inner := get_packer(model)) is None:
+                return None
+            namespace[f"_p{index}"], namespace[f"_u{index}"] = inner
+            if kind == "list":
+                value = f"None if (v := {value}) is None else [_p{index}(e) for e in v]"
+                stored = f"None if (v := {stored}) is None else [_u{index}(e) for e in v]"
+            else:
+                value = f"None if (v := {value}) is None else _p{index}(v)"
+                stored = f"None if (v := {stored}) is None else _u{index}(v)"
+            value = f"({value})"
+        packed.append(value)
+        unpack.append(f"    _s{index}(self, {stored})")
+    unpack.append("    return self")
+
+    source = f"def pack(self):\n    return ({', '.join(packed)},)\n\n" + "\n".join(unpack)
+    exec(source, namespace)
+    pack, unpack = namespace["pack"], namespace["unpack"]
+    pack.source = unpack.source = source
+    return pack, unpack
+
+
+@lru_cache(maxsize=None)
+def get_packer(cls: type) -> typing.Optional[Packer]:
+    """The packer compiled for a class, built on first use, see `compile_packer`."""
+    return compile_packer(cls)
@@ -0,0 +1,81 @@
+import typing
+
+from shlink.client.utils.concurrency import aordered_map, ordered_map
+
+T = typing.TypeVar("T")
+
+
+def paginate(
+    fetch: typing.Callable[..., typing.Any], page: int = 1, concurrency: int = 1
+) -> typing.Iterator[T]:
+    """
+    Lazily walk a paginated listing, yielding one item at a time.
+
+    Pages are fetched one after another by default, keeping only the page currently
+    being iterated alive. With a `concurrency` above 1, the page count is read from
+    the first response and up to that many of the remaining pages are fetched ahead
+    on a thread pool, still yielded in order.
+
+    args:
+        fetch: Callable returning the `*View` for a `page` keyword
+        page: The page to start from
+        concurrency: Maximum number of pages fetched at the same time
+    """
+    view = fetch(page=page)
+    yield from view.data
+    pages = view.pagination.pagesCount  # Streamed pages only know it once consumed
+    del view
+
+    if concurrency > 1:
+        for view in ordered_map(lambda p: fetch(page=p), range(page + 1, pages + 1), concurrency):
+            yield from view.data
+        return
+
+    while page < pages:
+        page += 1
+        view = fetch(page=page)
+        yield from view.data
+        pages = view.pagination.pagesCount
+        del view
+
+
+async def _aitems(view: typing.Any) -> typing.AsyncIterator[T]:
+    # Streamed pages are iterated asynchronously, decoded views hold a plain list
+    if hasattr(view.data, "__aiter__"):
+        async for item in view.data:
+            yield item
+    else:
+        for item in view.data:
+            yield item
+
+
+async def apaginate(
+    fetch: typing.Callable[..., typing.Awaitable[typing.Any]], page: int = 1, concurrency: int = 1
+) -> typing.AsyncIterator[T]:
+    """
+    Asyncio version of `paginate`, for fetchers returning coroutines.
+
+    args:
+        fetch: Callable returning an awaitable of the `*View` for a `page` keyword
+        page: The page to start from
+        concurrency: Maximum number of pages fetched at the same time
+    """
+    view = await fetch(page=page)
+    async for item in _aitems(view):
+        yield item
+    pages = view.pagination.pagesCount
+    del view
+
+    if concurrency > 1:
+        async for view in aordered_map(lambda p: fetch(page=p), range(page + 1, pages + 1), concurrency):
+            async for item in _aitems(view):
+                yield item
+        return
+
+    while page < pages:
+        page += 1
+        view = await fetch(page=page)
+        async for item in _aitems(view):
+            yield item
+        pages = view.pagination.pagesCount
+        del view
@@ -0,0 +1,126 @@
+import math
+import typing
+from functools import lru_cache
+from hashlib import blake2b
+
+T = typing.TypeVar("T", bound=typing.Hashable)
+
+
+class SpaceSaving(typing.Generic[T]):
+    """
+    Approximate top-K counter (Metwally et al.) in constant memory.
+
+    At most `capacity` items are counted. When a new item arrives and the summary
+    is full, it replaces the item with the lowest count and inherits that count as
+    its `error`. Any item seen more than `total / capacity` times is guaranteed to
+    be kept, and its true count lies between `count - error` and `count`.
+
+    args:
+        capacity: Number of items to keep counts for, a few times the K you're after
+    """
+
+    __slots__ = ("capacity", "total", "_counts")
+
+    def __init__(self, capacity: int = 100):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.total = 0
+        self._counts: typing.Dict[T, typing.List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def add(self, item: T, count: int = 1) -> None:
+        self.total += count
+        counts = self._counts
+        if (entry := counts.get(item)) is not None:
+            entry[0] += count
+        elif len(counts) < self.capacity:
+            counts[item] = [count, 0]
+        else:
+            evicted = min(counts, key=lambda key: counts[key][0])
+            floor = counts.pop(evicted)[0]
+            counts[item] = [floor + count, floor]
+
+    def top(self, n: typing.Optional[int] = None) -> typing.List[typing.Tuple[T, int, int]]:
+        """The `n` items with the highest counts, as `(item, count, error)` tuples."""
+        ranked = sorted(self._counts.items(), key=lambda entry: entry[1][0], reverse=True)
+        return [(item, count, error) for item, (count, error) in ranked[:n]]
+
+    def _floor(self) -> int:
+        """The most an item that isn't counted may have been seen."""
+        if len(self._counts) < self.capacity:
+            return 0
+        return min(count for count, _ in self._counts.values())
+
+    def merge(self, other: "SpaceSaving[T]") -> "SpaceSaving[T]":
+        """
+        Combine the counts of another summary into this one (Agarwal et al.).
+
+        Items only one of them counts are assumed to have been seen as often as
+        the other's least counted item, which is added to their error.
+        """
+        floor, other_floor = self._floor(), other._floor()
+        merged = {}
+        for item in self._counts.keys() | other._counts.keys():
+            count, error = self._counts.get(item, (floor, floor))
+            other_count, other_error = other._counts.get(item, (other_floor, other_floor))
+            merged[item] = [count + other_count, error + other_error]
+        capacity = max(self.capacity, other.capacity)
+        ranked = sorted(merged.items(), key=lambda entry: entry[1][0], reverse=True)[:capacity]
+        self.capacity = capacity
+        self.total += other.total
+        self._counts = dict(ranked)
+        return self
+
+
+@lru_cache(maxsize=4096)
+def _hash64(value: str) -> int:
+    # Visits repeat the same few user agents, so hashes are worth caching
+    return int.from_bytes(blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+class HyperLogLog:
+    """
+    Approximate distinct counter (Flajolet et al.) in `2 ** precision` bytes.
+
+    The standard error of `count()` is about `1.04 / sqrt(2 ** precision)`, 1.6%
+    with the default precision of 12.
+
+    args:
+        precision: Number of bits of the hash used to pick a register, between 4 and 18
+    """
+
+    __slots__ = ("precision", "registers")
+
+    def __init__(self, precision: int = 12):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def add(self, value: str) -> None:
+        hashed = _hash64(value)
+        bits = 64 - self.precision
+        index = hashed >> bits
+        rank = bits - (hashed & ((1 << bits) - 1)).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def count(self) -> int:
+        registers = self.registers
+        m = len(registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0 ** -register for register in registers)
+        if estimate <= 2.5 * m and (zeros := registers.count(0)):
+            # Linear counting is more accurate for small cardinalities
+            estimate = m * math.log(m / zeros)
+        return round(estimate)
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """Combine another sketch of the same precision into this one."""
+        if other.precision != self.precision:
+            raise ValueError("Can't merge sketches of different precisions")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+        return self
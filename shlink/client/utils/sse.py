@@ -0,0 +1,71 @@
+import codecs
+import re
+import typing
+
+# A trailing "\r" may be the first half of a "\r\n" split across chunks
+_LINE_END = re.compile(r"\r\n|\r(?=[^\n])|\n")
+
+
+class ServerSentEvent(typing.NamedTuple):
+    event: str
+    data: str
+    id: typing.Optional[str]
+
+
+class SSEParser:
+    """
+    Incremental parser for `text/event-stream` bodies, following the HTML spec.
+
+    Bytes are pushed with `feed` as they arrive, which returns the events they
+    completed. `last_event_id` and `retry` (in milliseconds) keep the last values
+    the server sent, as they apply to reconnections.
+    """
+
+    def __init__(self, last_event_id: typing.Optional[str] = None):
+        self.last_event_id = last_event_id
+        self.retry: typing.Optional[int] = None
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._buffer = ""
+        self._started = False
+        self._event = ""
+        self._data: typing.List[str] = []
+
+    def feed(self, chunk: bytes) -> typing.List[ServerSentEvent]:
+        text = self._decoder.decode(chunk)
+        if not self._started and text:
+            self._started = True
+            text = text.removeprefix("\ufeff")
+        self._buffer += text
+
+        events = []
+        end = 0
+        for match in _LINE_END.finditer(self._buffer):
+            if (event := self._line(self._buffer[end : match.start()])) is not None:
+                events.append(event)
+            end = match.end()
+        self._buffer = self._buffer[end:]
+        return events
+
+    def _line(self, line: str) -> typing.Optional[ServerSentEvent]:
+        if not line:
+            return self._dispatch()
+        if line.startswith(":"):
+            return None
+        name, _, value = line.partition(":")
+        value = value.removeprefix(" ")
+        if name == "data":
+            self._data.append(value)
+        elif name == "event":
+            self._event = value
+        elif name == "id" and "\0" not in value:
+            self.last_event_id = value
+        elif name == "retry" and value.isdigit():
+            self.retry = int(value)
+        return None
+
+    def _dispatch(self) -> typing.Optional[ServerSentEvent]:
+        data, event = self._data, self._event
+        self._data, self._event = [], ""
+        if not data:
+            return None
+        return ServerSentEvent(event=event or "message", data="\n".join(data), id=self.last_event_id)
@@ -0,0 +1,19 @@
+from typing import Any, Dict, Optional
+
+from attrs import field, define
+
+from shlink.models.short import ShortURL
+
+
+@define(kw_only=True, slots=True)
+class BulkResult:
+    """Outcome of one item of a bulk operation, in the position of its input."""
+
+    index: int = field()
+    spec: Dict[str, Any] = field()
+    shortUrl: Optional[ShortURL] = field(default=None)
+    error: Optional[Exception] = field(default=None)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
@@ -0,0 +1,252 @@
+from array import array
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+from shlink.client.utils.converters import timestamp_converter
+from shlink.models import Pagination
+from shlink.models.visits import Visit, VisitLocation
+
+__all__ = ("Bitmap", "Categories", "ColumnarVisitsView")
+
+
+class Bitmap:
+    """Append-only packed booleans, one bit per row."""
+
+    __slots__ = ("bits", "length")
+
+    def __init__(self):
+        self.bits = bytearray()
+        self.length = 0
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index: int) -> bool:
+        if not -self.length <= index < self.length:
+            raise IndexError("bitmap index out of range")
+        index %= self.length
+        return bool(self.bits[index >> 3] & (1 << (index & 7)))
+
+    def append(self, value: bool) -> None:
+        if not self.length & 7:
+            self.bits.append(0)
+        if value:
+            self.bits[-1] |= 1 << (self.length & 7)
+        self.length += 1
+
+    def extend(self, other: "Bitmap") -> None:
+        if not self.length & 7:
+            self.bits.extend(other.bits)
+            self.length += other.length
+            return
+        for index in range(len(other)):
+            self.append(other[index])
+
+    def count(self) -> int:
+        """Number of set bits."""
+        return sum(bin(byte).count("1") for byte in self.bits)
+
+
+class Categories:
+    """
+    Dictionary-encoded strings: each distinct value is stored once, rows hold its index.
+
+    `values` lists the distinct values in first-seen order, `codes` is the per-row index.
+    """
+
+    __slots__ = ("values", "codes", "_index")
+
+    def __init__(self):
+        self.values: List[Optional[str]] = []
+        self.codes = array("I")
+        self._index: Dict[Optional[str], int] = {}
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index: int) -> Optional[str]:
+        return self.values[self.codes[index]]
+
+    def append(self, value: Optional[str]) -> None:
+        if (code := self._index.get(value)) is None:
+            code = self._index[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def extend(self, other: "Categories") -> None:
+        remap = []
+        for value in other.values:
+            if (code := self._index.get(value)) is None:
+                code = self._index[value] = len(self.values)
+                self.values.append(value)
+            remap.append(code)
+        self.codes.extend(remap[code] for code in other.codes)
+
+
+_CATEGORIES = (
+    "referer",
+    "userAgent",
+    "visitedUrl",
+    "type",
+    "countryCode",
+    "countryName",
+    "regionName",
+    "cityName",
+    "timezone",
+)
+_LOCATION = ("countryCode", "countryName", "regionName", "cityName", "timezone")
+
+
+class ColumnarVisitsView:
+    """
+    A page of visits decoded into parallel columns instead of `Visit` objects.
+
+    Dates are epoch seconds in an `array('q')`, coordinates `array('d')` (NaN without a
+    location), flags packed `Bitmap`s and every string field a `Categories` column.
+    Accepts the same payload as `VisitsView.from_dict`, and pages can be concatenated
+    with `extend` to hold a whole listing in a few compact buffers.
+    """
+
+    def __init__(self):
+        self.date = array("q")
+        self.latitude = array("d")
+        self.longitude = array("d")
+        self.potentialBot = Bitmap()
+        self.hasLocation = Bitmap()
+        for name in _CATEGORIES:
+            setattr(self, name, Categories())
+        self.pagination: Optional[Pagination] = None
+
+    def __len__(self) -> int:
+        return len(self.date)
+
+    def __iter__(self) -> Iterator[Visit]:
+        return (self.row(index) for index in range(len(self)))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ColumnarVisitsView":
+        """
+        Decodes a visits listing response.
+
+        parameters:
+            data: The json data received from schlink api.
+
+        """
+        data = data.pop("visits")
+        view = cls()
+        view.extend_raw(data["data"])
+        view.pagination = Pagination.from_dict(data["pagination"])
+        return view
+
+    def extend_raw(self, visits: List[Dict[str, Any]]) -> None:
+        """Appends raw visit dicts, as found in the API's `visits.data`."""
+        nan = float("nan")
+        date, latitude, longitude = self.date, self.latitude, self.longitude
+        bots, located = self.potentialBot, self.hasLocation
+        referer, agent, url, kind = self.referer, self.userAgent, self.visitedUrl, self.type
+        location_columns = [getattr(self, name) for name in _LOCATION]
+
+        for visit in visits:
+            date.append(int(timestamp_converter(visit["date"]).timestamp()))
+            bots.append(visit.get("potentialBot", False))
+            referer.append(visit.get("referer"))
+            agent.append(visit.get("userAgent"))
+            url.append(visit.get("visitedUrl"))
+            kind.append(visit.get("type"))
+
+            location = visit.get("visitLocation")
+            located.append(location is not None)
+            if location is None:
+                latitude.append(nan)
+                longitude.append(nan)
+                for column in location_columns:
+                    column.append(None)
+            else:
+                latitude.append(location.get("latitude", nan))
+                longitude.append(location.get("longitude", nan))
+                for name, column in zip(_LOCATION, location_columns):
+                    column.append(location.get(name))
+
+    def extend(self, other: "ColumnarVisitsView") -> None:
+        """Appends the rows of another view, e.g. the next page of the same listing."""
+        self.date.extend(other.date)
+        self.latitude.extend(other.latitude)
+        self.longitude.extend(other.longitude)
+        self.potentialBot.extend(other.potentialBot)
+        self.hasLocation.extend(other.hasLocation)
+        for name in _CATEGORIES:
+            getattr(self, name).extend(getattr(other, name))
+        self.pagination = other.pagination
+
+    def row(self, index: int) -> Visit:
+        """Materializes one row as a `Visit`, with its date in UTC."""
+        location = None
+        if self.hasLocation[index]:
+            location = VisitLocation(
+                latitude=self.latitude[index],
+                longitude=self.longitude[index],
+                **{name: getattr(self, name)[index] for name in _LOCATION},
+            )
+        return Visit(
+            referer=self.referer[index],
+            date=datetime.fromtimestamp(self.date[index], tz=timezone.utc),
+            userAgent=self.userAgent[index],
+            visitLocation=location,
+            potentialBot=self.potentialBot[index],
+            visitedUrl=self.visitedUrl[index],
+            type=self.type[index],
+        )
+
+    def buffers(self) -> Dict[str, memoryview]:
+        """
+        Zero-copy views over every column's underlying buffer.
+
+        Categorical columns are exposed as their `codes`, bitmaps as packed bytes.
+        """
+        buffers = {
+            "date": memoryview(self.date),
+            "latitude": memoryview(self.latitude),
+            "longitude": memoryview(self.longitude),
+            "potentialBot": memoryview(self.potentialBot.bits),
+            "hasLocation": memoryview(self.hasLocation.bits),
+        }
+        for name in _CATEGORIES:
+            buffers[name] = memoryview(getattr(self, name).codes)
+        return buffers
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """
+        Columns as NumPy arrays. Numeric columns and category codes share memory
+        with this view; bitmaps are unpacked into boolean arrays.
+        """
+        import numpy as np
+
+        columns = {
+            "date": np.frombuffer(self.date, dtype=np.int64),
+            "latitude": np.frombuffer(self.latitude, dtype=np.float64),
+            "longitude": np.frombuffer(self.longitude, dtype=np.float64),
+        }
+        for name in ("potentialBot", "hasLocation"):
+            packed = np.frombuffer(getattr(self, name).bits, dtype=np.uint8)
+            columns[name] = np.unpackbits(packed, bitorder="little")[: len(self)].astype(bool)
+        for name in _CATEGORIES:
+            columns[name] = np.frombuffer(getattr(self, name).codes, dtype=np.uint32)
+        return columns
+
+    def to_pandas(self) -> Any:
+        """Columns as a `pandas.DataFrame`, with string fields as categoricals."""
+        import numpy as np
+        import pandas as pd
+
+        columns = self.to_numpy()
+        for name in _CATEGORIES:
+            values = getattr(self, name).values
+            # pandas categories can't hold None, it's represented by the -1 code instead
+            categories = [value for value in values if value is not None]
+            lookup = np.full(len(values), -1, dtype=np.int64)
+            lookup[[i for i, value in enumerate(values) if value is not None]] = np.arange(len(categories))
+            columns[name] = pd.Categorical.from_codes(
+                lookup[columns[name]], categories=pd.Index(categories, dtype=object)
+            )
+        columns["date"] = pd.to_datetime(columns["date"], unit="s", utc=True)
+        return pd.DataFrame(columns)
@@ -0,0 +1,22 @@
+from typing import Optional
+
+from attrs import field, define
+
+from shlink.client.utils.converters import optional as c_optional
+from shlink.client.utils.mixins import DictSerializationMixin
+from shlink.models.short import ShortURL
+from shlink.models.visits import Visit
+
+
+@define(kw_only=True, slots=True)
+class MercureUpdate(DictSerializationMixin):
+    """
+    An update Shlink published on its Mercure hub.
+
+    New visits carry the `visit` and, unless it's an orphan visit, its `shortUrl`.
+    New short URL updates only carry the `shortUrl`.
+    """
+
+    id: Optional[str] = field(default=None)
+    visit: Optional[Visit] = field(default=None, converter=c_optional(Visit.from_dict))
+    shortUrl: Optional[ShortURL] = field(default=None, converter=c_optional(ShortURL.from_dict))
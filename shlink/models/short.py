@@ -3,7 +3,7 @@ from typing import List, Optional
 
 from attrs import field, define
 
-from shlink.client.utils.converters import list_converter, timestamp_converter
+from shlink.client.utils.converters import intern_converter, list_converter, timestamp_converter
 from shlink.client.utils.mixins import DictSerializationMixin
 from shlink.models import Pagination
 
@@ -26,9 +26,9 @@ class ShortURL(DictSerializationMixin):
     longUrl: str = field()
     dateCreated: datetime = field(converter=timestamp_converter)
     visitsCount: int = field()
-    tags: List[str] = field(factory=list)
+    tags: List[str] = field(factory=list, converter=list_converter(intern_converter))
     meta: Meta = field(converter=Meta.from_dict)
-    domain: Optional[str] = field(default=None)
+    domain: Optional[str] = field(default=None, converter=intern_converter)
     title: Optional[str] = field(default=None)
     crawlable: bool = field(default=False)
     forwardQuery: bool = field(default=True)
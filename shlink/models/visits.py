@@ -3,7 +3,7 @@ from typing import List, Optional
 
 from attrs import field, define
 
-from shlink.client.utils.converters import list_converter, optional as c_optional, timestamp_converter
+from shlink.client.utils.converters import intern_converter, list_converter, optional as c_optional, timestamp_converter
 from shlink.client.utils.mixins import DictSerializationMixin
 from shlink.models import Pagination
 
@@ -23,25 +23,24 @@ class GenericVisits(VisitsMixin):
 
 @define(kw_only=True, slots=True)
 class VisitLocation(DictSerializationMixin):
-    cityName: str
-    countryCode: str
-    countryName: str
-    latitude: int
-    longitude: int
-    regionName: str
-    timezone: str
+    cityName: str = field(converter=intern_converter)
+    countryCode: str = field(converter=intern_converter)
+    countryName: str = field(converter=intern_converter)
+    latitude: int = field()
+    longitude: int = field()
+    regionName: str = field(converter=intern_converter)
+    timezone: str = field(converter=intern_converter)
 
 
 @define(kw_only=True, slots=True)
 class Visit(DictSerializationMixin):
-    referer: str = field()
+    referer: str = field(converter=intern_converter)
     date: datetime = field(converter=timestamp_converter)
-    userAgent: str = field()
-    visitLocation: Optional[VisitLocation] = field(
-        default=None, converter=c_optional(VisitLocation.from_dict))
+    userAgent: str = field(converter=intern_converter)
+    visitLocation: Optional[VisitLocation] = field(default=None, converter=c_optional(VisitLocation.from_dict))
     potentialBot: bool = field(default=False)
     visitedUrl: Optional[str] = field(default=None)
-    type: Optional[str] = field(default=None)  # Only for orphan visits
+    type: Optional[str] = field(default=None, converter=intern_converter)  # Only for orphan visits
 
 
 @define(kw_only=True, slots=True)
@@ -0,0 +1,49 @@
+"""API payloads shared by the test modules."""
+
+PAGINATION = {"currentPage": 1, "pagesCount": 1, "itemsPerPage": 10, "itemsInCurrentPage": 1, "totalItems": 1}
+VISITS = {
+    "visits": {
+        "data": [
+            {
+                "referer": "https://t.co/",
+                "date": "2022-03-01T10:00:00+00:00",
+                "userAgent": "Mozilla/5.0",
+                "visitLocation": {
+                    "cityName": "Madrid",
+                    "countryCode": "ES",
+                    "countryName": "Spain",
+                    "latitude": 40.4,
+                    "longitude": -3.7,
+                    "regionName": "Madrid",
+                    "timezone": "Europe/Madrid",
+                },
+                "potentialBot": True,
+            },
+            {"referer": "", "date": "2022-03-02T10:00:00+00:00", "userAgent": "", "visitLocation": None},
+        ],
+        "pagination": PAGINATION,
+    }
+}
+SHORT_URLS = {
+    "shortUrls": {
+        "data": [
+            {
+                "shortCode": "abc12",
+                "shortUrl": "https://s.test/abc12",
+                "longUrl": "https://example.com",
+                "dateCreated": "2022-03-01T10:00:00+00:00",
+                "visitsCount": 3,
+                "tags": ["a", "b"],
+                "meta": {"validSince": "2022-03-01T00:00:00+00:00", "validUntil": None, "maxVisits": 5},
+                "unknownField": "ignored",
+            }
+        ],
+        "pagination": PAGINATION,
+    }
+}
+DOMAINS = {
+    "domains": {
+        "data": [{"domain": "s.test", "isDefault": True, "redirect": {"baseUrlRedirect": "https://a.test"}}],
+        "defaultRedirects": {"regular404Redirect": None},
+    }
+}
@@ -0,0 +1,98 @@
+import asyncio
+import random
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from shlink.client.aggregate import VisitAggregate
+from shlink.client.utils.sketches import HyperLogLog, SpaceSaving
+from shlink.models.visits import Visit, VisitLocation
+
+START = datetime(2022, 3, 1, 22, 30, tzinfo=timezone.utc)
+
+
+def _visits(n, seed=0):
+    rng = random.Random(seed)
+    for i in range(n):
+        location = None
+        if i % 4:
+            location = VisitLocation(
+                cityName="", countryCode=rng.choice("ABC"), countryName="", latitude=0, longitude=0,
+                regionName="", timezone="",
+            )
+        yield Visit(
+            referer=f"https://r{min(int(rng.paretovariate(1)), 50)}.test" if i % 3 else "",
+            date=START + timedelta(minutes=7 * i),
+            userAgent=f"agent {rng.randrange(300)}",
+            visitLocation=location,
+            potentialBot=i % 10 == 0,
+        )
+
+
+def test_aggregate_matches_naive_rollups():
+    visits = list(_visits(2000))
+    aggregate = VisitAggregate(interval="day", top_referers=20).update(iter(visits))
+
+    assert aggregate.visits == 2000 and aggregate.bots == 200
+    days = Counter(visit.date.replace(hour=0, minute=0) for visit in visits)
+    bots = Counter(visit.date.replace(hour=0, minute=0) for visit in visits if visit.potentialBot)
+    assert aggregate.series() == [(day, count, bots[day]) for day, count in sorted(days.items())]
+    assert aggregate.countries == Counter(v.visitLocation and v.visitLocation.countryCode for v in visits)
+    exact = Counter(visit.referer for visit in visits).most_common(3)
+    assert aggregate.top_referers(3) == exact
+    assert abs(aggregate.distinct_user_agents() - 300) <= 15
+
+
+def test_hourly_buckets_follow_timezone():
+    tz = timezone(timedelta(hours=5, minutes=30))
+    aggregate = VisitAggregate(tz=tz, top_referers=None, user_agents_precision=None).update(_visits(6))
+    # 22:30 to 23:05 UTC is 04:00 to 04:35 here
+    assert aggregate.series() == [(datetime(2022, 3, 2, 4, tzinfo=tz), 6, 1)]
+    with pytest.raises(ValueError):
+        aggregate.top_referers()
+
+
+def test_merged_parts_match_single_pass():
+    visits = list(_visits(3000, seed=1))
+    whole = VisitAggregate().update(visits)
+    merged = VisitAggregate().update(visits[:1000]).merge(VisitAggregate().update(visits[1000:]))
+    assert merged.series() == whole.series()
+    assert merged.countries == whole.countries
+    assert merged.top_referers(3) == whole.top_referers(3)
+    assert merged.distinct_user_agents() == whole.distinct_user_agents()
+    with pytest.raises(ValueError):
+        merged.merge(VisitAggregate(interval="day"))
+
+
+def test_async_update():
+    async def visits():
+        for visit in _visits(50):
+            yield visit
+
+    aggregate = asyncio.run(VisitAggregate().aupdate(visits()))
+    assert aggregate.visits == 50
+
+
+def test_space_saving_keeps_heavy_hitters():
+    summary = SpaceSaving(10)
+    stream = ["hot"] * 500 + ["warm"] * 200 + [f"cold {i}" for i in range(1000)]
+    random.Random(2).shuffle(stream)
+    for item in stream:
+        summary.add(item)
+    (first, count, error), (second, *_) = summary.top(2)
+    assert (first, second) == ("hot", "warm")
+    assert count - error <= 500 <= count
+    assert len(summary) == 10 and summary.total == len(stream)
+
+
+def test_hyperloglog_accuracy_and_merge():
+    left, right = HyperLogLog(), HyperLogLog()
+    for i in range(20000):
+        (left if i % 2 else right).add(str(i))
+        left.add(str(i % 100))
+    assert abs(left.merge(right).count() - 20000) / 20000 < 0.05
+    small = HyperLogLog()
+    for i in range(10):
+        small.add(str(i))
+    assert small.count() == 10
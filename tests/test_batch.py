@@ -0,0 +1,105 @@
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from shlink.client.batch import AsyncShortUrlBatcher, ShortUrlBatcher
+from shlink.client.client import AsyncShlink, Shlink
+from shlink.client.error import ShlinkError
+from shlink.client.transport import AsyncTransport, Transport
+from tests.fixtures import SHORT_URLS
+
+SHORT_URL = SHORT_URLS["shortUrls"]["data"][0]
+
+
+def _respond(data):
+    payload = json.loads(data)
+    if "invalid" in payload["longUrl"]:
+        body = {"type": "INVALID_URL", "title": "Invalid URL", "detail": "", "status": 400}
+        return SimpleNamespace(status_code=400, headers={}, content=json.dumps(body), json=lambda: body)
+    body = {**SHORT_URL, "shortCode": str(abs(hash(payload["longUrl"]))), "longUrl": payload["longUrl"]}
+    return SimpleNamespace(status_code=200, headers={}, content=json.dumps(body))
+
+
+class CreatingTransport(Transport):
+    def __init__(self):
+        self.created = []
+        self._lock = threading.Lock()
+
+    def request(self, method, url, headers=None, data=None, params=None, stream=False):
+        with self._lock:
+            self.created.append(json.loads(data)["longUrl"])
+        time.sleep(0.001)
+        return _respond(data)
+
+    def close(self):
+        pass
+
+
+class AsyncCreatingTransport(AsyncTransport):
+    def __init__(self):
+        self.created = []
+
+    async def request(self, method, url, headers=None, data=None, params=None, stream=False):
+        self.created.append(json.loads(data)["longUrl"])
+        await asyncio.sleep(0.001)
+        return _respond(data)
+
+    async def close(self):
+        pass
+
+
+def test_batcher_deduplicates_and_resolves_every_caller():
+    transport = CreatingTransport()
+    client = Shlink("https://s.test/", "key", transport=transport)
+    futures = []
+    with ShortUrlBatcher(client, max_batch=8, max_delay=0.05) as batcher:
+
+        def produce(i):
+            futures.append((i % 5, batcher.submit(f"https://example.com/{i % 5}")))
+
+        threads = [threading.Thread(target=produce, args=(i,)) for i in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        futures.append((None, batcher.submit({"longUrl": "https://invalid.test"})))
+
+    assert len(futures) == 21
+    for i, future in futures:
+        if i is None:
+            with pytest.raises(ShlinkError):
+                future.result()
+        else:
+            assert future.result().longUrl == f"https://example.com/{i}"
+    expected = {f"https://example.com/{i}" for i in range(5)} | {"https://invalid.test"}
+    assert sorted(transport.created) == sorted(expected)
+    with pytest.raises(RuntimeError):
+        batcher.submit("https://example.com/late")
+
+
+def test_batcher_flushes_after_max_delay():
+    client = Shlink("https://s.test/", "key", transport=CreatingTransport())
+    with ShortUrlBatcher(client, max_batch=100, max_delay=0.01) as batcher:
+        start = time.monotonic()
+        assert batcher.submit("https://example.com").result(timeout=2).longUrl == "https://example.com"
+        assert time.monotonic() - start < 1
+
+
+def test_async_batcher():
+    async def main():
+        transport = AsyncCreatingTransport()
+        async with AsyncShlink("https://s.test/", "key", transport=transport) as client:
+            async with AsyncShortUrlBatcher(client, max_batch=4, max_delay=0.01) as batcher:
+                futures = [batcher.submit(f"https://example.com/{i % 3}") for i in range(10)]
+                futures.append(batcher.submit("https://invalid.test"))
+                results = await asyncio.gather(*futures, return_exceptions=True)
+        return transport.created, results
+
+    created, results = asyncio.run(main())
+    assert sorted(created) == sorted([f"https://example.com/{i}" for i in range(3)] + ["https://invalid.test"])
+    assert [result.longUrl for result in results[:-1]] == [f"https://example.com/{i % 3}" for i in range(10)]
+    assert isinstance(results[-1], ShlinkError)
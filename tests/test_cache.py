@@ -0,0 +1,125 @@
+import json
+import time
+from collections import Counter
+from types import SimpleNamespace
+from urllib.parse import urlsplit
+
+from shlink.client.cache import TTLCache
+from shlink.client.client import Shlink
+from shlink.client.const import MISSING
+from shlink.client.transport import Transport
+from tests.fixtures import SHORT_URLS
+
+SHORT_URL = SHORT_URLS["shortUrls"]["data"][0]
+
+
+def test_ttl_cache_hits_and_misses():
+    cache = TTLCache(maxsize=2)
+    assert cache.get("a") is MISSING
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.info().hits == 1
+    assert cache.info().misses == 1
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_expires_and_invalidates():
+    cache = TTLCache(ttl=0.01)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.invalidate("b")
+    assert cache.get("b") is MISSING
+    time.sleep(0.02)
+    assert cache.get("a") is MISSING
+    assert len(cache) == 0
+
+
+class CountingTransport(Transport):
+    """Answers every request with a short URL, counting the requests sent per method and path."""
+
+    def __init__(self):
+        self.requests = Counter()
+
+    def request(self, method, url, headers=None, data=None, params=None, stream=False):
+        path = urlsplit(url).path.split("/rest/v2", 1)[-1]
+        self.requests[method, path] += 1
+        if method == "DELETE" or path == "/tags":
+            return SimpleNamespace(status_code=204, headers={}, content=b"")
+        short_code = path.rsplit("/", 1)[-1]
+        content = json.dumps({**SHORT_URL, "shortCode": short_code}).encode()
+        return SimpleNamespace(status_code=200, headers={}, content=content)
+
+    def close(self):
+        pass
+
+
+def _client():
+    transport = CountingTransport()
+    return Shlink("https://s.test/", "key", transport=transport, cache=TTLCache()), transport
+
+
+def test_client_serves_repeated_get_from_cache():
+    client, transport = _client()
+    first = client.get_short_url("abc12")
+    assert client.get_short_url("abc12") is first
+    assert transport.requests["GET", "/short-urls/abc12"] == 1
+    client.get_short_url("def34")
+    assert transport.requests["GET", "/short-urls/def34"] == 1
+    assert client.cache.info().hits == 1
+
+
+def test_client_evicts_edited_and_deleted_short_urls():
+    client, transport = _client()
+    client.get_short_url("abc12")
+    other = client.get_short_url("def34")
+
+    client.edit_short_url("abc12", longUrl="https://example.com/new")
+    client.get_short_url("abc12")
+    assert transport.requests["GET", "/short-urls/abc12"] == 2
+
+    client.delete_short_url("abc12")
+    client.get_short_url("abc12")
+    assert transport.requests["GET", "/short-urls/abc12"] == 3
+    # Only the mutated short URL is evicted
+    assert client.get_short_url("def34") is other
+    assert transport.requests["GET", "/short-urls/def34"] == 1
+
+
+def test_client_evicts_everything_on_tag_changes():
+    client, transport = _client()
+    client.get_short_url("abc12")
+    client.edit_tag("foo", "bar")
+    client.get_short_url("abc12")
+    assert transport.requests["GET", "/short-urls/abc12"] == 2
+
+    client.delete_tag(["bar"])
+    client.get_short_url("abc12")
+    assert transport.requests["GET", "/short-urls/abc12"] == 3
+    assert transport.requests["PATCH", "/tags"] == transport.requests["DELETE", "/tags"] == 1
+
+
+def test_cache_shared_between_clients_keeps_their_entries_apart():
+    cache, transport = TTLCache(), CountingTransport()
+    clients = [
+        Shlink("https://s.test/", "key", transport=transport, cache=cache),
+        Shlink("https://other.test/", "key", transport=transport, cache=cache),
+        Shlink("https://s.test/", "other-key", transport=transport, cache=cache),
+    ]
+    short_urls = [client.get_short_url("abc12") for client in clients]
+    assert transport.requests["GET", "/short-urls/abc12"] == 3
+    assert [client.get_short_url("abc12") for client in clients] == short_urls
+    assert transport.requests["GET", "/short-urls/abc12"] == 3
+
+    clients[1].delete_short_url("abc12")
+    assert clients[0].get_short_url("abc12") is short_urls[0]
+    assert transport.requests["GET", "/short-urls/abc12"] == 3
@@ -0,0 +1,128 @@
+import asyncio
+import json
+from types import SimpleNamespace
+from urllib.parse import urlsplit
+
+import pytest
+
+from shlink.client.client import AsyncShlink, Shlink
+from shlink.client.retry import RetryPolicy
+from shlink.client.transport import AsyncTransport, Transport
+from shlink.models.domain import DomainsView, Redirect
+from shlink.models.integration import Integration
+from shlink.models.short import ShortURL, ShortUrlsView
+from shlink.models.status import Status
+from shlink.models.tag import TagStatsView, TagsView
+from shlink.models.visits import GenericVisits, VisitsView
+from tests.fixtures import DOMAINS, PAGINATION, SHORT_URLS, VISITS
+
+SHORT_URL = SHORT_URLS["shortUrls"]["data"][0]
+HEALTH = {"status": "pass", "version": "3.0.0", "links": {"about": "https://shlink.io", "project": "https://s.test"}}
+TAG_STATS = {"shortUrlsCount": 1, "visitsCount": 2}
+
+RESPONSES = {
+    "/health": HEALTH,
+    "/domains": DOMAINS,
+    "/domains/redirects": {"baseUrlRedirect": "https://a.test"},
+    "/mercure-info": {"mercureHubUrl": "https://hub.test", "jwt": "token", "jwtExpiration": "2022-03-02T10:00:00Z"},
+    "/short-urls": SHORT_URLS,
+    ("POST", "/short-urls"): SHORT_URL,
+    "/short-urls/shorten": SHORT_URL,
+    "/short-urls/abc12": SHORT_URL,
+    "/short-urls/abc12/visits": VISITS,
+    "/tags": {"tags": {"data": ["a", "b"], "pagination": PAGINATION}},
+    "/tags/stats": {"tags": {"data": [{"tag": "a", **TAG_STATS}], "pagination": PAGINATION}},
+    "/tags/a/visits": VISITS,
+    "/visits": {"visits": {"visitsCount": 3, "orphanVisitsCount": 1}},
+    "/visits/orphan": VISITS,
+    "/visits/non-orphan": VISITS,
+}
+
+
+class RoutingTransport(Transport):
+    """Answers every endpoint with its canned payload, recording the requests sent."""
+
+    def __init__(self, status=200, responses=RESPONSES):
+        self.status = status
+        self.responses = responses
+        self.requests = []
+
+    def request(self, method, url, headers=None, data=None, params=None, stream=False):
+        path = urlsplit(url).path.removeprefix("/rest").removeprefix("/v2")
+        self.requests.append((method, path, params, data))
+        if method == "DELETE" or (method == "PATCH" and path == "/tags"):
+            return SimpleNamespace(status_code=204, headers={}, content=b"")
+        body = self.responses.get((method, path), self.responses.get(path))
+        return SimpleNamespace(status_code=self.status, headers={}, content=json.dumps(body).encode())
+
+    def close(self):
+        pass
+
+
+class AsyncRoutingTransport(AsyncTransport):
+    def __init__(self, *args, **kwargs):
+        self.transport = RoutingTransport(*args, **kwargs)
+
+    async def request(self, method, url, headers=None, data=None, params=None, stream=False):
+        return self.transport.request(method, url, headers, data, params, stream)
+
+    async def close(self):
+        pass
+
+
+CALLS = [
+    (lambda client: client.get_health(), "GET", "/health", Status),
+    (lambda client: client.get_domains(), "GET", "/domains", DomainsView),
+    (lambda client: client.patch_domain("s.test", regular404Redirect="/"), "PATCH", "/domains/redirects", Redirect),
+    (lambda client: client.get_mercure_info(), "GET", "/mercure-info", Integration),
+    (lambda client: client.get_short_urls(), "GET", "/short-urls", ShortUrlsView),
+    (lambda client: client.create_short_url("https://example.com"), "POST", "/short-urls", ShortURL),
+    (lambda client: client.shorten("https://example.com"), "GET", "/short-urls/shorten", ShortURL),
+    (lambda client: client.get_short_url("abc12"), "GET", "/short-urls/abc12", ShortURL),
+    (lambda client: client.edit_short_url("abc12", "https://example.com"), "PATCH", "/short-urls/abc12", ShortURL),
+    (lambda client: client.delete_short_url("abc12"), "DELETE", "/short-urls/abc12", type(None)),
+    (lambda client: client.get_code_visits("abc12"), "GET", "/short-urls/abc12/visits", VisitsView),
+    (lambda client: client.get_tags(), "GET", "/tags", TagsView),
+    (lambda client: client.edit_tag("a", "b"), "PATCH", "/tags", type(None)),
+    (lambda client: client.delete_tag(["a"]), "DELETE", "/tags", type(None)),
+    (lambda client: client.tag_stats(), "GET", "/tags/stats", TagStatsView),
+    (lambda client: client.tag_visits("a"), "GET", "/tags/a/visits", VisitsView),
+    (lambda client: client.get_visits(), "GET", "/visits", GenericVisits),
+    (lambda client: client.get_orphan_visits(), "GET", "/visits/orphan", VisitsView),
+    (lambda client: client.get_nonorphan_visits(), "GET", "/visits/non-orphan", VisitsView),
+]
+
+
+@pytest.mark.parametrize("call, method, path, model", CALLS)
+def test_sync_and_async_clients_send_the_same_requests(call, method, path, model):
+    transport = RoutingTransport()
+    result = call(Shlink("https://s.test", "key", transport=transport))
+    assert isinstance(result, model)
+
+    async_transport = AsyncRoutingTransport()
+
+    async def main():
+        async with AsyncShlink("https://s.test", "key", transport=async_transport) as client:
+            return await call(client)
+
+    assert asyncio.run(main()) == result
+    assert async_transport.transport.requests == transport.requests
+    assert [request[:2] for request in transport.requests] == [(method, path)]
+
+
+def test_failing_health_check_is_a_status():
+    failing = {**RESPONSES, "/health": {**HEALTH, "status": "fail"}}
+    transport = RoutingTransport(status=503, responses=failing)
+    client = Shlink("https://s.test", "key", transport=transport, retry=RetryPolicy())
+    assert client.get_health().status == "fail"
+    # A 503 from the health check is its answer, not a transient error to retry
+    assert len(transport.requests) == 1
+
+    async_transport = AsyncRoutingTransport(status=503, responses=failing)
+
+    async def main():
+        async with AsyncShlink("https://s.test", "key", transport=async_transport, retry=RetryPolicy()) as client:
+            return await client.get_health()
+
+    assert asyncio.run(main()).status == "fail"
+    assert len(async_transport.transport.requests) == 1
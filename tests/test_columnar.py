@@ -0,0 +1,72 @@
+import copy
+import json
+import math
+from types import SimpleNamespace
+
+from shlink.client.client import Shlink
+from shlink.client.transport import Transport
+from shlink.models.columnar import Bitmap, ColumnarVisitsView
+from shlink.models.visits import VisitsView
+from tests.fixtures import VISITS
+
+
+def test_bitmap():
+    bitmap = Bitmap()
+    values = [i % 3 == 0 for i in range(21)]
+    for value in values:
+        bitmap.append(value)
+    other = Bitmap()
+    other.append(True)
+    bitmap.extend(other)
+    assert [bitmap[i] for i in range(len(bitmap))] == values + [True]
+    assert bitmap.count() == sum(values) + 1
+
+
+def test_columnar_rows_match_visits_view():
+    columns = ColumnarVisitsView.from_dict(copy.deepcopy(VISITS))
+    view = VisitsView.from_dict(copy.deepcopy(VISITS))
+    assert len(columns) == 2
+    assert columns.pagination == view.pagination
+    assert list(columns) == view.data
+    assert columns.countryCode.values == ["ES", None]
+    assert math.isnan(columns.latitude[1])
+
+
+def test_columnar_extend_reuses_categories():
+    columns = ColumnarVisitsView.from_dict(copy.deepcopy(VISITS))
+    columns.extend(ColumnarVisitsView.from_dict(copy.deepcopy(VISITS)))
+    assert len(columns) == 4
+    assert columns.countryCode.values == ["ES", None]
+    assert list(columns.countryCode.codes) == [0, 1, 0, 1]
+    assert [columns.potentialBot[i] for i in range(4)] == [True, False, True, False]
+    assert columns.buffers()["date"].nbytes == 4 * 8
+
+
+class NotModifiedTransport(Transport):
+    """Answers every conditional request with a 304, as if the visits never changed."""
+
+    def __init__(self):
+        self.requests = []
+
+    def request(self, method, url, headers=None, data=None, params=None, stream=False):
+        self.requests.append(headers)
+        if "If-None-Match" in headers:
+            return SimpleNamespace(status_code=304, headers={}, content=b"")
+        return SimpleNamespace(status_code=200, headers={"ETag": '"v1"'}, content=json.dumps(VISITS).encode())
+
+    def close(self):
+        pass
+
+
+def test_revalidation_keeps_columnar_and_object_views_apart():
+    transport = NotModifiedTransport()
+    client = Shlink("https://s.test/", "key", transport=transport, revalidate=True)
+    view = client.get_code_visits("abc12")
+    columns = client.get_code_visits("abc12", columnar=True)
+    assert isinstance(view, VisitsView)
+    assert isinstance(columns, ColumnarVisitsView)
+    assert list(columns) == view.data
+    # Each view is then revalidated on its own
+    assert client.get_code_visits("abc12") is view
+    assert client.get_code_visits("abc12", columnar=True) is columns
+    assert [headers.get("If-None-Match") for headers in transport.requests] == [None, None, '"v1"', '"v1"']
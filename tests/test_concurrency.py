@@ -0,0 +1,270 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+
+from shlink.client.client import AsyncShlink, Shlink
+from shlink.client.error import ShlinkError
+from shlink.client.transport import AsyncTransport, RequestsTransport, Transport
+from shlink.client.utils.concurrency import AsyncSingleFlight, SingleFlight, aordered_map, ordered_map
+from tests.fixtures import SHORT_URLS
+
+
+def _result(item, result, error):
+    return item, result, error
+
+
+def _maybe_fail(item):
+    time.sleep(0.001 * (10 - item))
+    if item % 3 == 0:
+        raise ValueError(item)
+    return item * 2
+
+
+def test_ordered_map_keeps_input_order():
+    assert list(ordered_map(_maybe_fail, [1, 2, 4, 5], 3)) == [2, 4, 8, 10]
+
+
+def test_ordered_map_reports_failures_in_place():
+    results = list(ordered_map(_maybe_fail, range(1, 8), 4, result_factory=_result))
+    assert [item for item, _, _ in results] == list(range(1, 8))
+    assert [item for item, _, error in results if error is not None] == [3, 6]
+    assert results[0][1] == 2
+
+
+def test_aordered_map_reports_failures_in_place():
+    async def fn(item):
+        await asyncio.sleep(0.001 * (10 - item))
+        return _maybe_fail(item)
+
+    async def collect():
+        return [result async for result in aordered_map(fn, range(1, 8), 4, result_factory=_result)]
+
+    results = asyncio.run(collect())
+    assert [item for item, _, _ in results] == list(range(1, 8))
+    assert isinstance(results[2][2], ValueError)
+
+
+SPECS = ["https://example.com/1", {"longUrl": "https://invalid.test/2", "title": "Bad"}, "https://example.com/3"]
+
+
+def _created(data):
+    """Answer a creation, slower for earlier specs so they complete out of order."""
+    payload = json.loads(data)
+    delay = 0.01 / int(payload["longUrl"].rsplit("/", 1)[1])
+    if "invalid" in payload["longUrl"]:
+        body = {"type": "INVALID_URL", "title": "Invalid URL", "detail": "Unreachable", "status": 400}
+        return delay, SimpleNamespace(status_code=400, headers={}, content=json.dumps(body), json=lambda: body)
+    body = {**SHORT_URLS["shortUrls"]["data"][0], "longUrl": payload["longUrl"]}
+    return delay, SimpleNamespace(status_code=200, headers={}, content=json.dumps(body))
+
+
+class CreatingTransport(Transport):
+    def request(self, method, url, headers=None, data=None, params=None, stream=False):
+        delay, response = _created(data)
+        time.sleep(delay)
+        return response
+
+    def close(self):
+        pass
+
+
+class AsyncCreatingTransport(AsyncTransport):
+    async def request(self, method, url, headers=None, data=None, params=None, stream=False):
+        delay, response = _created(data)
+        await asyncio.sleep(delay)
+        return response
+
+    async def close(self):
+        pass
+
+
+def _check_bulk_results(results):
+    assert [result.index for result in results] == [0, 1, 2]
+    assert [result.spec for result in results] == [
+        {"longUrl": "https://example.com/1"},
+        {"longUrl": "https://invalid.test/2", "title": "Bad"},
+        {"longUrl": "https://example.com/3"},
+    ]
+    assert [result.ok for result in results] == [True, False, True]
+    assert [result.shortUrl and result.shortUrl.longUrl for result in results] == [
+        "https://example.com/1",
+        None,
+        "https://example.com/3",
+    ]
+    assert isinstance(results[1].error, ShlinkError)
+    assert results[1].error.data.type == "INVALID_URL"
+
+
+def test_create_short_urls():
+    client = Shlink("https://s.test/", "key", transport=CreatingTransport())
+    _check_bulk_results(list(client.create_short_urls(iter(SPECS), concurrency=3)))
+
+
+def test_async_create_short_urls():
+    async def main():
+        async with AsyncShlink("https://s.test/", "key", transport=AsyncCreatingTransport()) as client:
+            return [result async for result in client.create_short_urls(iter(SPECS), concurrency=3)]
+
+    _check_bulk_results(asyncio.run(main()))
+
+
+class SlowTransport(Transport):
+    """Counts requests, holding every response until `release` is set."""
+
+    def __init__(self):
+        self.requests = []
+        self.release = threading.Event()
+
+    def request(self, method, url, headers=None, data=None, params=None, stream=False):
+        self.requests.append((url, params))
+        self.release.wait(5)
+        body = json.dumps(SHORT_URLS["shortUrls"]["data"][0])
+        return SimpleNamespace(status_code=200, headers={}, content=body)
+
+    def close(self):
+        pass
+
+
+def test_single_flight_shares_result_and_error():
+    flights = SingleFlight()
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def fn():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        if len(calls) > 1:
+            raise ValueError
+        return object()
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(flights.do("k", fn))) for _ in range(8)]
+    threads[0].start()
+    started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1 and len(results) == 8 and len({id(result) for result in results}) == 1
+    assert len(flights) == 0
+
+    # Not cached: the next call runs again
+    with pytest.raises(ValueError):
+        flights.do("k", fn)
+
+
+def test_async_single_flight_survives_cancelled_caller():
+    async def main():
+        flights = AsyncSingleFlight()
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return len(calls)
+
+        first = asyncio.ensure_future(flights.do("k", fn))
+        others = [asyncio.ensure_future(flights.do("k", fn)) for _ in range(4)]
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await asyncio.gather(*others) == [1, 1, 1, 1]
+        await asyncio.sleep(0)
+        assert len(flights) == 0
+
+    asyncio.run(main())
+
+
+def test_client_coalesces_identical_gets():
+    transport = SlowTransport()
+    client = Shlink("https://s.test/", "key", transport=transport, coalesce=True)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(client.get_short_url("abc12"))) for _ in range(8)]
+    threads.append(threading.Thread(target=lambda: results.append(client.get_short_url("other"))))
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    transport.release.set()
+    for thread in threads:
+        thread.join()
+    assert len(results) == 9
+    assert sorted(url for url, _ in transport.requests) == [
+        "https://s.test/rest/v2/short-urls/abc12",
+        "https://s.test/rest/v2/short-urls/other",
+    ]
+
+
+class ShortUrlHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, *_):
+        pass
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.connections.add(self.client_address)
+        shortCode = self.path.rsplit("/", 1)[1]
+        body = json.dumps({**SHORT_URLS["shortUrls"]["data"][0], "shortCode": shortCode}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def test_thread_safe_client_under_contention():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ShortUrlHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.connections = set()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    errors = []
+    sessions = set()
+    barrier = threading.Barrier(32)
+
+    def worker(client, n):
+        barrier.wait()
+        sessions.add(id(client.transport.session))
+        try:
+            for i in range(25):
+                shortCode = f"t{n}-{i}"
+                assert client.get_short_url(shortCode).shortCode == shortCode
+        except Exception as error:
+            errors.append(error)
+
+    try:
+        with Shlink(f"http://127.0.0.1:{server.server_port}/", "key", thread_safe=True) as client:
+            threads = [threading.Thread(target=worker, args=(client, n)) for n in range(32)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert errors == []
+        assert len(sessions) == 32
+        # Every session drew from the one bounded pool
+        assert len(server.connections) <= 10
+        with pytest.raises(RuntimeError):
+            client.get_short_url("closed")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_shared_session_by_default():
+    transport = RequestsTransport()
+    sessions = []
+    thread = threading.Thread(target=lambda: sessions.append(transport.session))
+    thread.start()
+    thread.join()
+    assert sessions == [transport.session]
+    transport.close()
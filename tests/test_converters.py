@@ -0,0 +1,58 @@
+import copy
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from shlink.client.utils import converters
+from shlink.client.utils.converters import timestamp_converter
+from shlink.models.short import ShortUrlsView
+from shlink.models.visits import VisitsView
+from tests.fixtures import SHORT_URLS, VISITS
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2022-03-01T10:00:00+00:00", datetime(2022, 3, 1, 10, tzinfo=timezone.utc)),
+        ("2022-03-01T10:00:00-05:00", datetime(2022, 3, 1, 10, tzinfo=timezone(timedelta(hours=-5)))),
+        ("2022-03-01T10:00:00Z", datetime(2022, 3, 1, 10, tzinfo=timezone.utc)),
+        ("2022-03-01T10:00:00.5+00:00", datetime(2022, 3, 1, 10, 0, 0, 500000, tzinfo=timezone.utc)),
+        ("2022-03-01", datetime(2022, 3, 1)),
+        ("2022-13-01T10:00:00+00:00", None),
+        ("not a date", None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_timestamp_converter(value, expected):
+    assert timestamp_converter(value) == expected
+
+
+def test_timestamp_cache():
+    converters.enable_timestamp_cache(maxsize=2)
+    try:
+        first = timestamp_converter("2022-03-01T10:00:00+00:00")
+        assert timestamp_converter("2022-03-01T10:00:00+00:00") is first
+        assert converters._parse_timestamp.cache_info().hits == 1
+    finally:
+        converters.disable_timestamp_cache()
+    assert not hasattr(converters._parse_timestamp, "cache_info")
+
+
+def test_decoded_models_share_repeated_values():
+    payload = copy.deepcopy(VISITS)
+    payload["visits"]["data"] = [payload["visits"]["data"][0]] * 2
+    # Decoding fresh JSON, as every visit then has its own copy of every string
+    first, second = VisitsView.from_dict(json.loads(json.dumps(payload))).data
+    assert first.userAgent is second.userAgent
+    assert first.visitLocation.cityName is second.visitLocation.cityName
+    # Only the values are shared, every visit still has a location of its own
+    first.visitLocation.cityName = "Getafe"
+    assert second.visitLocation.cityName == "Madrid"
+
+    payload = copy.deepcopy(SHORT_URLS)
+    payload["shortUrls"]["data"] *= 2
+    first, second = ShortUrlsView.from_dict(json.loads(json.dumps(payload))).data
+    assert first.tags[0] is second.tags[0]
+
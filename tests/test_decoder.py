@@ -0,0 +1,28 @@
+import copy
+
+import pytest
+
+from shlink.models.domain import DomainsView
+from shlink.models.short import ShortUrlsView
+from shlink.models.visits import VisitsView
+from tests.fixtures import DOMAINS, SHORT_URLS, VISITS
+
+
+@pytest.mark.parametrize("view, payload", [(VisitsView, VISITS), (ShortUrlsView, SHORT_URLS), (DomainsView, DOMAINS)])
+def test_compiled_decoder_matches_generic(view, payload):
+    assert view._get_decoder().compiled
+    assert view.from_dict(copy.deepcopy(payload)) == view._from_dict_generic(copy.deepcopy(payload))
+
+
+def test_compiled_decoder_applies_defaults_and_converters():
+    view = VisitsView.from_dict(copy.deepcopy(VISITS))
+    assert view.data[0].date.year == 2022
+    assert view.data[0].visitLocation.countryCode == "ES"
+    assert view.data[1].potentialBot is False
+    assert view.data[1].visitLocation is None
+    assert view.data[1].type is None
+
+
+def test_compiled_decoder_requires_fields():
+    with pytest.raises(TypeError):
+        VisitsView.from_dict({"visits": {"data": []}})
@@ -0,0 +1,60 @@
+import copy
+import csv
+import gzip
+import io
+import json
+
+import pytest
+
+from shlink.client.client import Shlink
+from shlink.client.export import SHORT_URL_COLUMNS, VISIT_COLUMNS, export_short_urls, export_visits, open_writer
+from shlink.client.utils.encoder import compile_row_encoder
+from shlink.models.short import ShortUrlsView
+from shlink.models.visits import VisitsView
+from tests.fixtures import SHORT_URLS, VISITS
+from tests.test_stream import PagedTransport
+
+
+@pytest.mark.parametrize(
+    "view, payload, columns", [(VisitsView, VISITS, VISIT_COLUMNS), (ShortUrlsView, SHORT_URLS, SHORT_URL_COLUMNS)]
+)
+def test_models_and_dicts_encode_to_the_same_rows(view, payload, columns):
+    items = next(iter(payload.values()))["data"]
+    models = view.from_dict(copy.deepcopy(payload)).data
+    from_dicts = list(map(compile_row_encoder(columns, models=False), items))
+    assert from_dicts == list(map(compile_row_encoder(columns, models=True), models))
+    assert len(from_dicts[0]) == len(columns)
+
+
+def test_csv_export_streams_a_listing():
+    client = Shlink("https://s.test/", "key", transport=PagedTransport(pages=3))
+    buffer = io.BytesIO()
+    count = export_visits(client.iter_code_visits("abc12", raw=True), buffer, format="csv", chunk_size=2)
+
+    rows = list(csv.DictReader(io.StringIO(buffer.getvalue().decode())))
+    assert count == len(rows) == 3 * len(VISITS["visits"]["data"])
+    first = VISITS["visits"]["data"][0]
+    assert rows[0]["date"] == first["date"] and rows[0]["countryCode"] == "ES"
+    assert rows[1]["countryCode"] == "" and not buffer.closed
+
+
+def test_compressed_jsonl_from_models(tmp_path):
+    path = tmp_path / "short-urls.jsonl.gz"
+    export_short_urls(ShortUrlsView.from_dict(copy.deepcopy(SHORT_URLS)).data, path)
+    with gzip.open(path, "rt") as f:
+        (row,) = [json.loads(line) for line in f]
+    assert row["shortCode"] == "abc12" and row["tags"] == ["a", "b"]
+    assert row["validSince"] == "2022-03-01T00:00:00+00:00" and row["validUntil"] is None
+
+
+def test_unknown_format():
+    with pytest.raises(ValueError):
+        open_writer(io.BytesIO(), VISIT_COLUMNS)
+
+
+def test_parquet_export(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "visits.parquet"
+    assert export_visits(copy.deepcopy(VISITS["visits"]["data"]), path, chunk_size=1) == 2
+    table = pq.read_table(path)
+    assert table.num_rows == 2 and table.schema.field("date").type.tz == "UTC"
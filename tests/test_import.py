@@ -0,0 +1,44 @@
+import json
+import subprocess
+import sys
+
+from shlink.client.utils.lazy import LazyModel, LazyModule
+
+# Imported on first use rather than with the client, see `benchmarks.bench_import` for timings
+DEFERRED = (
+    "requests",
+    "httpx",
+    "asyncio",
+    "concurrent.futures",
+    "email.utils",
+    "shlink.models.short",
+    "shlink.models.visits",
+)
+
+
+def _run(code):
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+
+def test_import_defers_heavy_modules():
+    code = f"import json, sys, shlink.client.client; print(json.dumps([m for m in {DEFERRED!r} if m in sys.modules]))"
+    assert json.loads(_run(code).stdout) == []
+
+
+def test_lazy_model():
+    model = LazyModel("shlink.models:Pagination")
+    pagination = model.from_dict(
+        {"currentPage": 1, "pagesCount": 2, "itemsPerPage": 10, "itemsInCurrentPage": 10, "totalItems": 20}
+    )
+    assert isinstance(pagination, model.resolve())
+    assert model(**pagination.to_dict()) == pagination
+
+
+def test_lazy_module():
+    code = (
+        "import sys; from shlink.client.utils.lazy import LazyModule; "
+        "module = LazyModule('colorsys'); print('colorsys' in sys.modules); "
+        "module.rgb_to_hsv(0, 0, 0); print('colorsys' in sys.modules)"
+    )
+    assert _run(code).stdout.split() == ["False", "True"]
+    assert repr(LazyModule("colorsys")) == "<LazyModule colorsys>"
@@ -0,0 +1,99 @@
+import copy
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from shlink.client.client import Shlink
+from shlink.client.index import ShortUrlIndex, normalize_url
+from shlink.client.transport import Transport
+from shlink.models.short import ShortURL
+from tests.fixtures import SHORT_URLS
+
+SHORT_URL = SHORT_URLS["shortUrls"]["data"][0]
+
+
+def _short_url(shortCode, longUrl="https://example.com", tags=(), domain=None):
+    payload = {**copy.deepcopy(SHORT_URL), "shortCode": shortCode, "longUrl": longUrl, "tags": list(tags)}
+    return ShortURL.from_dict({**payload, "domain": domain})
+
+
+class EchoTransport(Transport):
+    """Answers short URL mutations like Shlink would, with the resulting short URL."""
+
+    def request(self, method, url, headers=None, data=None, params=None, stream=False):
+        if url.endswith("/short-urls") and method == "POST":
+            payload = json.loads(data)
+            body = {**SHORT_URL, "shortCode": payload["customSlug"], "longUrl": payload["longUrl"]}
+            body["tags"] = payload["tags"]
+        elif method == "PATCH" and "/short-urls/" in url:
+            body = {**SHORT_URL, "shortCode": url.rsplit("/", 1)[1], **json.loads(data)}
+        else:
+            body = None
+        content = json.dumps(body).encode() if body is not None else b""
+        return SimpleNamespace(status_code=200 if body else 204, headers={}, content=content)
+
+    def close(self):
+        pass
+
+
+def test_normalize_url():
+    assert normalize_url("HTTPS://Example.COM:443") == "https://example.com/"
+    assert normalize_url(" http://example.com:8080/A?b=C#d ") == "http://example.com:8080/A?b=C#d"
+    assert normalize_url("https://u:p@[::1]:80/") == "https://u:p@[::1]:80/"
+
+
+def test_lookups():
+    index = ShortUrlIndex(
+        [
+            _short_url("a", "https://one.test/", tags=["x", "y"]),
+            _short_url("b", "HTTPS://ONE.test", tags=["y"], domain="Other.test"),
+            _short_url("c", "https://two.test/", tags=["x"]),
+        ]
+    )
+    assert index.get("a").shortCode == "a"
+    assert index.get("b") is None and index.get("b", "other.test").shortCode == "b"
+    assert "a" in index and "b" not in index
+    assert {s.shortCode for s in index.by_long_url("https://one.test")} == {"a", "b"}
+    assert [s.shortCode for s in index.by_long_url("https://one.test", domain=None)] == ["a"]
+    assert index.has_long_url("https://two.test:443") and not index.has_long_url("https://three.test")
+    assert [s.shortCode for s in index.by_domain("other.test")] == ["b"]
+    assert {s.shortCode for s in index.by_tags(["x", "y"])} == {"a", "b", "c"}
+    assert [s.shortCode for s in index.by_tags(["x", "y"], tagsMode="all")] == ["a"]
+    assert index.by_tags(["x", "missing"], tagsMode="all") == []
+    with pytest.raises(ValueError):
+        index.by_tags(["x"], tagsMode="some")
+
+
+def test_replacing_and_removing_updates_postings():
+    index = ShortUrlIndex([_short_url("a", "https://one.test/", tags=["x"])])
+    index.add(_short_url("a", "https://two.test/", tags=["y"]))
+    assert len(index) == 1
+    assert not index.has_long_url("https://one.test/") and index.by_tags(["x"]) == []
+    assert index.remove("a").longUrl == "https://two.test/"
+    assert index.remove("a") is None
+    assert index.by_tags(["y"]) == [] and index.by_domain(None) == []
+
+
+def test_client_mutations_keep_index_fresh():
+    original = _short_url("a", "https://one.test/", tags=["x", "y"])
+    index = ShortUrlIndex([original, _short_url("b", tags=["y"])])
+    client = Shlink("https://s.test/", "key", transport=EchoTransport(), index=index)
+
+    client.create_short_url("https://new.test", customSlug="new", tags=["x"])
+    assert index.get("new").longUrl == "https://new.test"
+    assert {s.shortCode for s in index.by_tags(["x"])} == {"a", "new"}
+
+    client.edit_short_url("a", longUrl="https://edited.test")
+    assert index.by_long_url("https://edited.test")[0].shortCode == "a"
+    assert not index.has_long_url("https://one.test/")
+
+    client.edit_tag("y", "z")
+    assert [s.shortCode for s in index.by_tags(["z"])] == ["b"]
+    assert index.get("b").tags == ["z"] and original.tags == ["x", "y"]
+
+    client.delete_tag(["x"])
+    assert index.by_tags(["x"]) == [] and index.get("new").tags == []
+
+    client.delete_short_url("b")
+    assert index.get("b") is None and len(index) == 2
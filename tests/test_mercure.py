@@ -0,0 +1,136 @@
+import asyncio
+import itertools
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from shlink.client.client import AsyncShlink, Shlink
+from shlink.client.utils.sse import ServerSentEvent, SSEParser
+from tests.fixtures import SHORT_URLS, VISITS
+
+VISIT = VISITS["visits"]["data"][0]
+SHORT_URL = SHORT_URLS["shortUrls"]["data"][0]
+# Orphan visits carry no short URL
+EVENTS = [{"shortUrl": SHORT_URL, "visit": VISIT} if i % 2 else {"visit": VISIT} for i in range(1, 6)]
+
+
+class Hub(BaseHTTPRequestHandler):
+    """Stands in for both Shlink's mercure-info endpoint and the Mercure hub."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *_):
+        pass
+
+    def _json(self, data):
+        body = json.dumps(data).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        state = self.server.state
+        if self.path.startswith("/rest/v2/mercure-info"):
+            state["tokens"] += 1
+            expiration = datetime.now(timezone.utc) + timedelta(seconds=state["expires_in"])
+            return self._json(
+                {
+                    "mercureHubUrl": f"http://127.0.0.1:{self.server.server_port}/hub",
+                    "jwt": f"token-{state['tokens']}",
+                    "jwtExpiration": expiration.isoformat(timespec="seconds"),
+                }
+            )
+
+        state["connections"].append((self.headers["Authorization"], self.headers.get("Last-Event-ID"), self.path))
+        if self.headers["Authorization"] != f"Bearer token-{state['tokens']}":
+            self.send_response(401)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        # Unknown length, the stream ends when the connection is closed
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(b": heartbeat\n\nretry: 10\n\n")
+        start = int(self.headers.get("Last-Event-ID") or 0)
+        for event_id in range(start + 1, min(start + 2, len(EVENTS)) + 1):
+            self.wfile.write(f"id: {event_id}\ndata: {json.dumps(EVENTS[event_id - 1])}\n\n".encode())
+            self.wfile.flush()
+
+
+@pytest.fixture
+def hub():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Hub)
+    server.daemon_threads = True
+    server.state = {"tokens": 0, "expires_in": 3600, "connections": []}
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _check(updates):
+    assert [update.id for update in updates] == ["1", "2", "3", "4", "5"]
+    assert all(update.visit.referer == VISIT["referer"] for update in updates)
+    assert [update.shortUrl is not None for update in updates] == [True, False, True, False, True]
+
+
+def test_sse_parser():
+    body = "\ufeff: comment\r\nid: 1\r\ndata: a\r\ndata: b\r\n\r\nevent: x\rdata: c\r\rretry: 5\n\n".encode()
+    for size in (1, 3, len(body)):
+        parser = SSEParser()
+        events = []
+        for start in range(0, len(body), size):
+            events += parser.feed(body[start : start + size])
+        assert events == [ServerSentEvent("message", "a\nb", "1"), ServerSentEvent("x", "c", "1")]
+        assert parser.retry == 5
+
+
+def test_subscriber_resumes_after_disconnects(hub):
+    client = Shlink(f"http://127.0.0.1:{hub.server_port}/", "key")
+    subscriber = client.subscribe(topics=["https://shlink.io/new-visit/abc12"])
+    updates = list(itertools.islice(subscriber, 5))
+    subscriber.close()
+
+    _check(updates)
+    assert [last_id for _, last_id, _ in hub.state["connections"]] == [None, "2", "4"]
+    assert "topic=https%3A%2F%2Fshlink.io%2Fnew-visit%2Fabc12" in hub.state["connections"][0][2]
+    assert hub.state["tokens"] == 1
+
+
+def test_subscriber_refreshes_token_before_expiration(hub):
+    hub.state["expires_in"] = 30
+    client = Shlink(f"http://127.0.0.1:{hub.server_port}/", "key")
+    subscriber = client.subscribe(refresh_margin=60)
+    updates = list(itertools.islice(subscriber, 5))
+    subscriber.close()
+
+    _check(updates)
+    assert hub.state["tokens"] > 1
+    tokens = [f"Bearer token-{i + 1}" for i in range(hub.state["tokens"])]
+    assert [auth for auth, _, _ in hub.state["connections"]] == tokens
+
+
+def test_async_subscriber(hub):
+    pytest.importorskip("httpx")
+
+    async def receive():
+        async with AsyncShlink(f"http://127.0.0.1:{hub.server_port}/", "key") as client:
+            subscriber = client.subscribe(last_event_id="2")
+            updates = []
+            async for update in subscriber:
+                updates.append(update)
+                if len(updates) == 3:
+                    break
+            await subscriber.aclose()
+            return updates
+
+    updates = asyncio.run(receive())
+    assert [update.id for update in updates] == ["3", "4", "5"]
+    assert hub.state["connections"][0][1] == "2"
@@ -0,0 +1,86 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from shlink.client.client import Shlink
+from shlink.client.error import ShlinkError
+from shlink.client.metrics import Histogram, Metrics, RequestRecord
+from shlink.client.transport import Transport
+from tests.fixtures import SHORT_URLS
+
+SHORT_URL = json.dumps(SHORT_URLS["shortUrls"]["data"][0]).encode()
+NOT_FOUND = json.dumps(
+    {"type": "INVALID_SHORTCODE", "title": "Short URL not found", "detail": "No URL found", "status": 404}
+).encode()
+
+
+def test_histogram():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.cumulative() == [(0.1, 2), (1.0, 3), (float("inf"), 4)]
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.99) == float("inf")
+
+
+def test_metrics_group_by_template_and_notify_listeners():
+    metrics = Metrics(buckets=(0.1, 1.0))
+    seen = []
+    metrics.add_listener(seen.append)
+    for status in (200, 200, 404):
+        metrics.record(
+            RequestRecord(
+                method="GET",
+                endpoint="/short-urls/{shortCode}/visits",
+                status=status,
+                bytes_in=100,
+                http_time=0.05,
+                decode_time=0.01,
+                model_time=0.2,
+            )
+        )
+    stats = metrics.stats()[("GET", "/short-urls/{shortCode}/visits")]
+    assert (stats.requests, stats.errors, stats.bytes_in) == (3, 1, 300)
+    assert stats.model.counts == [0, 3, 0]
+    assert len(seen) == 3
+
+    text = metrics.render_prometheus()
+    labels = 'method="GET",endpoint="/short-urls/{shortCode}/visits"'
+    assert f"shlink_client_requests_total{{{labels}}} 3" in text
+    assert f'shlink_client_http_seconds_bucket{{{labels},le="+Inf"}} 3' in text
+
+
+class ShortUrlTransport(Transport):
+    """Answers with the short URL for `abc12`, and a 404 for any other short code."""
+
+    def request(self, method, url, headers=None, data=None, params=None, stream=False):
+        if url.endswith("/abc12"):
+            return SimpleNamespace(status_code=200, headers={}, content=SHORT_URL)
+        return SimpleNamespace(status_code=404, headers={}, content=NOT_FOUND, json=lambda: json.loads(NOT_FOUND))
+
+    def close(self):
+        pass
+
+
+def test_client_records_requests():
+    metrics = Metrics()
+    seen = []
+    metrics.add_listener(seen.append)
+    client = Shlink("https://s.test/", "key", transport=ShortUrlTransport(), metrics=metrics)
+    client.edit_short_url("abc12", "https://example.com")
+    with pytest.raises(ShlinkError):
+        client.get_short_url("missing")
+
+    edited, missing = seen
+    endpoint = "/short-urls/{shortCode}"
+    assert (edited.method, edited.endpoint, edited.status) == ("PATCH", endpoint, 200)
+    assert edited.bytes_out == len(json.dumps({"longUrl": "https://example.com"}))
+    assert edited.bytes_in == len(SHORT_URL)
+    assert edited.http_time > 0 and edited.model_time > 0
+    # Failed requests are recorded too, under the endpoint template rather than the short code
+    assert (missing.method, missing.endpoint, missing.status, missing.bytes_in) == ("GET", endpoint, 404, 0)
+    stats = metrics.stats()
+    assert (stats["GET", endpoint].requests, stats["GET", endpoint].errors) == (1, 1)
+    assert (stats["PATCH", endpoint].requests, stats["PATCH", endpoint].errors) == (1, 0)
@@ -0,0 +1,75 @@
+import asyncio
+
+from shlink.client.utils.pagination import apaginate, paginate
+from shlink.models.tag import TagsView
+
+
+def _pages(count, per_page=3):
+    def fetch(page):
+        fetch.calls.append(page)
+        return TagsView.from_dict(
+            {
+                "tags": {
+                    "data": [f"tag-{page}-{i}" for i in range(per_page)],
+                    "pagination": {
+                        "currentPage": page,
+                        "pagesCount": count,
+                        "itemsPerPage": per_page,
+                        "itemsInCurrentPage": per_page,
+                        "totalItems": count * per_page,
+                    },
+                }
+            }
+        )
+
+    fetch.calls = []
+    return fetch
+
+
+def test_paginate_follows_pages_count():
+    fetch = _pages(3)
+    items = list(paginate(fetch))
+    assert fetch.calls == [1, 2, 3]
+    assert items[0] == "tag-1-0"
+    assert items[-1] == "tag-3-2"
+    assert len(items) == 9
+
+
+def test_paginate_is_lazy():
+    fetch = _pages(3)
+    iterator = paginate(fetch)
+    assert fetch.calls == []
+    next(iterator)
+    assert fetch.calls == [1]
+
+
+def test_apaginate():
+    fetch = _pages(2)
+
+    async def afetch(page):
+        return fetch(page=page)
+
+    async def collect():
+        return [item async for item in apaginate(afetch)]
+
+    assert len(asyncio.run(collect())) == 6
+
+
+def test_paginate_prefetch_keeps_order():
+    fetch = _pages(6)
+    items = list(paginate(fetch, concurrency=3))
+    assert sorted(fetch.calls) == [1, 2, 3, 4, 5, 6]
+    assert items == [f"tag-{page}-{i}" for page in range(1, 7) for i in range(3)]
+
+
+def test_apaginate_prefetch_keeps_order():
+    fetch = _pages(5)
+
+    async def afetch(page):
+        await asyncio.sleep(0.01 * (5 - page))
+        return fetch(page=page)
+
+    async def collect():
+        return [item async for item in apaginate(afetch, concurrency=4)]
+
+    assert asyncio.run(collect()) == [f"tag-{page}-{i}" for page in range(1, 6) for i in range(3)]
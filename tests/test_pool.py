@@ -0,0 +1,94 @@
+import asyncio
+import copy
+import json
+import pickle
+from types import SimpleNamespace
+
+import pytest
+
+from shlink.client.client import AsyncShlink, Shlink
+from shlink.client.metrics import Metrics
+from shlink.client.pool import DecodePool
+from shlink.client.transport import AsyncTransport, Transport
+from shlink.client.utils.packing import get_packer
+from shlink.models.columnar import ColumnarVisitsView
+from shlink.models.domain import DomainsView
+from shlink.models.short import ShortUrlsView
+from shlink.models.visits import VisitsView
+from tests.fixtures import DOMAINS, SHORT_URLS, VISITS
+
+PAGES = 4
+
+
+def _visits_page(page):
+    body = copy.deepcopy(VISITS)
+    visits = body["visits"]["data"]
+    body["visits"]["data"] = [
+        {**visits[index % 2], "referer": f"https://ref.test/{page}/{index}"} for index in range(100)
+    ]
+    pagination = {"currentPage": page, "pagesCount": PAGES, "itemsPerPage": 100, "itemsInCurrentPage": 100}
+    body["visits"]["pagination"] = {**pagination, "totalItems": PAGES * 100}
+    return json.dumps(body).encode()
+
+
+def _respond(url, params):
+    return SimpleNamespace(status_code=200, headers={}, content=_visits_page(params.get("page", 1)))
+
+
+class PagesTransport(Transport):
+    def request(self, method, url, headers=None, data=None, params=None, stream=False):
+        return _respond(url, params)
+
+    def close(self):
+        pass
+
+
+class AsyncPagesTransport(AsyncTransport):
+    async def request(self, method, url, headers=None, data=None, params=None, stream=False):
+        return _respond(url, params)
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with DecodePool(workers=2, min_size=1024) as pool:
+        yield pool
+
+
+@pytest.mark.parametrize("view, payload", [(VisitsView, VISITS), (ShortUrlsView, SHORT_URLS), (DomainsView, DOMAINS)])
+def test_packed_models_round_trip(view, payload):
+    model = view.from_dict(copy.deepcopy(payload))
+    pack, unpack = get_packer(view)
+    assert unpack(pickle.loads(pickle.dumps(pack(model)))) == model
+
+
+def test_pool_decodes_like_the_client(pool):
+    metrics = Metrics()
+    with Shlink("https://s.test", "key", transport=PagesTransport()) as local:
+        expected = local.get_code_visits("abc", page=2)
+    with Shlink("https://s.test", "key", transport=PagesTransport(), decode_pool=pool, metrics=metrics) as client:
+        assert client.get_code_visits("abc", page=2) == expected
+        columns = client.get_code_visits("abc", page=2, columnar=True)
+        assert isinstance(columns, ColumnarVisitsView)
+        assert list(columns) == expected.data
+        visits = list(client.iter_code_visits("abc", concurrency=3))
+    assert len(visits) == PAGES * 100
+    assert visits[100].referer == "https://ref.test/2/0"
+    assert all(stats.bytes_in > 0 for stats in metrics.stats().values())
+
+
+def test_pool_skips_small_bodies(pool):
+    assert not pool.accepts(b"{}", VisitsView)
+    assert not pool.accepts(_visits_page(1), None)
+    assert pool.accepts(_visits_page(1), VisitsView)
+
+
+def test_async_client_awaits_the_pool(pool):
+    async def main():
+        async with AsyncShlink("https://s.test", "key", transport=AsyncPagesTransport(), decode_pool=pool) as client:
+            return [visit async for visit in client.iter_code_visits("abc", concurrency=2)]
+
+    visits = asyncio.run(main())
+    assert [visit.referer for visit in visits[::100]] == [f"https://ref.test/{page}/0" for page in range(1, 5)]
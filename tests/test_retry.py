@@ -0,0 +1,104 @@
+import json
+import threading
+from types import SimpleNamespace
+
+from shlink.client.client import Shlink
+from shlink.client.error import ShlinkError
+from shlink.client.retry import AdaptiveLimiter, RetryPolicy
+from shlink.client.transport import Transport
+from tests.fixtures import SHORT_URLS
+
+
+def _response(status, **headers):
+    return SimpleNamespace(status_code=status, headers=headers)
+
+
+def test_retry_policy_only_retries_idempotent_requests():
+    policy = RetryPolicy(max_attempts=3)
+    assert policy.should_retry("GET", 1, response=_response(503))
+    assert not policy.should_retry("POST", 1, response=_response(503))
+    assert policy.should_retry("POST", 1, response=_response(429))
+    assert not policy.should_retry("GET", 1, response=_response(400))
+    assert not policy.should_retry("GET", 3, response=_response(503))
+    assert policy.should_retry("GET", 1, error=ConnectionResetError())
+    assert not policy.should_retry("PATCH", 1, error=ConnectionResetError())
+    assert not policy.should_retry("GET", 1, error=ValueError())
+
+
+def test_retry_policy_delays():
+    policy = RetryPolicy(backoff=1.0, max_backoff=10.0)
+    assert policy.delay(1, _response(429, **{"Retry-After": "3"})) == 3.0
+    assert policy.delay(1, _response(429, **{"Retry-After": "120"})) == 10.0
+    assert policy.delay(1, _response(429, **{"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})) == 0.0
+    assert all(0 <= policy.delay(5) <= 10.0 for _ in range(100))
+
+
+def test_adaptive_limiter_aimd():
+    limiter = AdaptiveLimiter(initial=4, maximum=5, cooldown=60)
+    for _ in range(8):
+        limiter.acquire()
+        limiter.release()
+    assert limiter.limit == 5
+    limiter.acquire()
+    limiter.release(throttled=True)
+    limiter.acquire()
+    limiter.release(throttled=True)
+    assert limiter.limit == 2.5
+
+
+def test_adaptive_limiter_caps_in_flight():
+    limiter = AdaptiveLimiter(initial=2, maximum=2)
+    peak = []
+    lock = threading.Lock()
+
+    def work():
+        limiter.acquire()
+        with lock:
+            peak.append(limiter.in_flight)
+        limiter.release()
+
+    threads = [threading.Thread(target=work) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert max(peak) <= 2
+
+
+class ThrottlingTransport(Transport):
+    """Answers with a 429 asking to wait `Retry-After` seconds, then with a short URL."""
+
+    def __init__(self, retry_after):
+        self.retry_after = retry_after
+        self.attempts = 0
+
+    def request(self, method, url, headers=None, data=None, params=None, stream=False):
+        self.attempts += 1
+        if self.attempts == 1:
+            return SimpleNamespace(status_code=429, headers={"Retry-After": self.retry_after}, content=b"")
+        content = json.dumps(SHORT_URLS["shortUrls"]["data"][0]).encode()
+        return SimpleNamespace(status_code=200, headers={}, content=content)
+
+    def close(self):
+        pass
+
+
+def test_client_retries_throttled_requests(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("shlink.client.client.time.sleep", sleeps.append)
+    transport = ThrottlingTransport(retry_after="2")
+    limiter = AdaptiveLimiter(initial=4)
+    client = Shlink("https://s.test/", "key", transport=transport, retry=RetryPolicy(), limiter=limiter)
+    assert client.get_short_url("abc12").shortCode == "abc12"
+    assert transport.attempts == 2
+    assert sleeps == [2.0]
+    # Halved by the 429, then grown by the success
+    assert limiter.limit == 2.5
+    assert limiter.in_flight == 0
+
+
+def test_shlink_error_data():
+    error = ShlinkError(data={"type": "INVALID_SLUG", "title": "Invalid", "detail": "Nope", "status": 400, "extra": 1})
+    assert error.data.status == 400
+    assert str(error) == "Invalid: Nope"
+    assert ShlinkError().data is None
@@ -0,0 +1,149 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from shlink.client.client import AsyncShlink, Shlink
+from shlink.client.error import ShlinkError
+from shlink.client.transport import AsyncTransport, Transport
+from tests.fixtures import SHORT_URLS
+
+SHORT_URL = SHORT_URLS["shortUrls"]["data"][0]
+
+
+class ValidatingTransport(Transport):
+    """Serves one short URL, answering conditional requests like Shlink behind a caching proxy would."""
+
+    def __init__(self, etag='"v1"', last_modified="Tue, 01 Mar 2022 10:00:00 GMT"):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.title = "First"
+        self.requests = []
+        self.on_not_modified = None
+
+    def request(self, method, url, headers=None, data=None, params=None, stream=False):
+        self.requests.append(headers)
+        if self.etag:
+            fresh = headers.get("If-None-Match") == self.etag
+        else:
+            fresh = headers.get("If-Modified-Since") == self.last_modified
+        if fresh:
+            if self.on_not_modified is not None:
+                self.on_not_modified()
+            return SimpleNamespace(status_code=304, headers={}, content=b"", text="")
+        response_headers = {"Last-Modified": self.last_modified}
+        if self.etag:
+            response_headers["ETag"] = self.etag
+        content = json.dumps({**SHORT_URL, "title": self.title}).encode()
+        return SimpleNamespace(status_code=200, headers=response_headers, content=content)
+
+    def close(self):
+        pass
+
+
+class AsyncValidatingTransport(AsyncTransport):
+    def __init__(self):
+        self.transport = ValidatingTransport()
+
+    async def request(self, method, url, headers=None, data=None, params=None, stream=False):
+        return self.transport.request(method, url, headers, data, params, stream)
+
+    async def close(self):
+        pass
+
+
+def test_etag_round_trip():
+    transport = ValidatingTransport()
+    client = Shlink("https://s.test/", "key", transport=transport, revalidate=True)
+    first = client.get_short_url("abc12")
+    assert "If-None-Match" not in transport.requests[0]
+    # Not modified: the previously decoded model is returned as-is
+    assert client.get_short_url("abc12") is first
+    assert transport.requests[1]["If-None-Match"] == '"v1"'
+
+    transport.etag, transport.title = '"v2"', "Second"
+    assert client.get_short_url("abc12").title == "Second"
+    assert client.get_short_url("abc12").title == "Second"
+    assert transport.requests[3]["If-None-Match"] == '"v2"'
+
+
+def test_last_modified_round_trip():
+    transport = ValidatingTransport(etag=None)
+    client = Shlink("https://s.test/", "key", transport=transport, revalidate=True)
+    first = client.get_short_url("abc12")
+    assert client.get_short_url("abc12") is first
+    assert transport.requests[1]["If-Modified-Since"] == "Tue, 01 Mar 2022 10:00:00 GMT"
+    assert "If-None-Match" not in transport.requests[1]
+
+
+def test_no_validators_without_revalidate():
+    transport = ValidatingTransport()
+    client = Shlink("https://s.test/", "key", transport=transport)
+    client.get_short_url("abc12")
+    client.get_short_url("abc12")
+    assert all("If-None-Match" not in headers for headers in transport.requests)
+
+
+def test_not_modified_after_eviction_refetches():
+    transport = ValidatingTransport()
+    client = Shlink("https://s.test/", "key", transport=transport, revalidate=True)
+    client.get_short_url("abc12")
+    # Another request evicts the validators while this one is in flight
+    transport.on_not_modified = client._validators.clear
+    short_url = client.get_short_url("abc12")
+    assert short_url is not None and short_url.shortCode == "abc12"
+    assert len(transport.requests) == 3
+    assert "If-None-Match" not in transport.requests[2]
+
+
+def test_validators_are_looked_up_once_per_response():
+    transport = ValidatingTransport()
+    client = Shlink("https://s.test/", "key", transport=transport, revalidate=True)
+    first = client.get_short_url("abc12")
+    lookup, lookups = client._validators.get, []
+
+    def get_then_evict(key):
+        entry = lookup(key)
+        lookups.append(key)
+        if len(lookups) == 2:  # Evicted right after the 304 was matched with its model
+            client._validators.clear()
+        return entry
+
+    client._validators.get = get_then_evict
+    assert client.get_short_url("abc12") is first
+    assert len(lookups) == 2
+    assert len(transport.requests) == 2
+
+
+def test_not_modified_without_cached_model_raises():
+    transport = ValidatingTransport()
+    client = Shlink("https://s.test/", "key", transport=transport, revalidate=True)
+    client.get_short_url("abc12")
+    sent = []
+
+    def not_modified(method, url, headers=None, **kwargs):
+        # Evicted in flight, then a proxy answers 304 even without validators
+        sent.append(headers)
+        client._validators.clear()
+        return SimpleNamespace(status_code=304, headers={}, content=b"", text="")
+
+    transport.request = not_modified
+    with pytest.raises(ShlinkError) as error:
+        client.get_short_url("abc12")
+    assert error.value.data.status == 304
+    assert [headers.get("If-None-Match") for headers in sent] == ['"v1"', None]
+
+
+def test_async_not_modified_after_eviction_refetches():
+    transport = AsyncValidatingTransport()
+
+    async def main():
+        client = AsyncShlink("https://s.test/", "key", transport=transport, revalidate=True)
+        first = await client.get_short_url("abc12")
+        assert await client.get_short_url("abc12") is first
+        transport.transport.on_not_modified = client._validators.clear
+        return await client.get_short_url("abc12")
+
+    assert asyncio.run(main()).shortCode == "abc12"
+    assert [headers.get("If-None-Match") for headers in transport.transport.requests] == [None, '"v1"', '"v1"', None]
@@ -0,0 +1,109 @@
+import copy
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+
+from shlink.client.client import Shlink
+from shlink.client.metrics import Metrics
+from shlink.client.transport import Transport
+from shlink.client.utils.jsonstream import ArrayStreamParser
+from shlink.models.visits import VisitsView
+from tests.fixtures import VISITS
+
+
+def _visits_page(page, pages):
+    payload = copy.deepcopy(VISITS)
+    payload["visits"]["pagination"].update(currentPage=page, pagesCount=pages)
+    return json.dumps(payload).encode()
+
+
+class PagedTransport(Transport):
+    """Serves visits pages a few bytes at a time."""
+
+    def __init__(self, pages=2, chunk_size=7):
+        self.pages = pages
+        self.chunk_size = chunk_size
+        self.closed = 0
+
+    def request(self, method, url, headers=None, data=None, params=None, stream=False):
+        body = _visits_page(int(params["page"]), self.pages)
+        chunks = [body[i : i + self.chunk_size] for i in range(0, len(body), self.chunk_size)]
+        return SimpleNamespace(status_code=200, headers={}, iter_bytes=lambda: iter(chunks), close=self._close)
+
+    def _close(self):
+        self.closed += 1
+
+    def close(self):
+        pass
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 64, 4096])
+def test_parser_splits_array_from_rest(chunk_size):
+    body = json.dumps({"meta": [1, {"a": "é"}], **VISITS, "n": 123}, ensure_ascii=False).encode()
+    parser = ArrayStreamParser(("visits", "data"))
+    items = []
+    for start in range(0, len(body), chunk_size):
+        items += parser.feed(body[start : start + chunk_size])
+    items += parser.close()
+    assert items == VISITS["visits"]["data"]
+    assert parser.rest == {"meta": [1, {"a": "é"}], "visits": {"pagination": VISITS["visits"]["pagination"]}, "n": 123}
+
+
+def test_parser_rejects_truncated_documents():
+    parser = ArrayStreamParser(("visits", "data"))
+    assert parser.feed(b'{"visits": {"data": [{"a": 1}, {"a"') == [{"a": 1}]
+    with pytest.raises(ValueError):
+        parser.close()
+
+
+def test_streamed_page_matches_decoded_page():
+    transport = PagedTransport(pages=1)
+    metrics = Metrics()
+    client = Shlink("https://s.test/", "key", transport=transport, metrics=metrics)
+    page = client.get_code_visits("abc12", page=1, stream=True)
+    with pytest.raises(RuntimeError):
+        page.pagination
+    assert list(page) == VisitsView.from_dict(copy.deepcopy(VISITS)).data
+    assert page.pagination.pagesCount == 1
+    assert transport.closed == 1
+    stats = metrics.stats()[("GET", "/short-urls/{shortCode}/visits")]
+    assert stats.bytes_in == len(_visits_page(1, 1))
+
+
+def test_iter_streams_every_page():
+    client = Shlink("https://s.test/", "key", transport=PagedTransport(pages=3))
+    visits = list(client.iter_code_visits("abc12", stream=True))
+    assert len(visits) == 3 * len(VISITS["visits"]["data"])
+
+
+class GzipVisitsHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *_):
+        pass
+
+    def do_GET(self):
+        body = gzip.compress(_visits_page(1, 1))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def test_streamed_page_decompresses_body():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), GzipVisitsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        with Shlink(f"http://127.0.0.1:{server.server_port}/", "key") as client:
+            expected = client.get_code_visits("abc12").data
+            assert list(client.get_code_visits("abc12", stream=True)) == expected
+            assert len(list(client.get_code_visits("abc12", raw=True))) == len(expected)
+    finally:
+        server.shutdown()
+        server.server_close()
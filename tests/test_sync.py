@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from shlink.client.sync import Cursor, JSONCursorStore, MemoryCursorStore, SQLiteCursorStore, VisitSync
+from shlink.models.visits import Visit
+
+START = datetime(2022, 3, 1, tzinfo=timezone.utc)
+
+
+class FakeClient:
+    """Serves `visits` the way Shlink filters them: newest first, dates inclusive."""
+
+    def __init__(self):
+        self.visits = []
+        self.calls = []
+
+    def iter_tag_visits(self, tag, startDate=None, endDate=None, itemsPerPage=None, excludeBots=True):
+        self.calls.append(startDate)
+        matches = [v for v in self.visits if (startDate is None or v.date >= startDate) and v.date <= endDate]
+        return iter(sorted(matches, key=lambda v: v.date, reverse=True))
+
+
+def _visit(seconds, agent="ua"):
+    return Visit(referer="", date=START + timedelta(seconds=seconds), userAgent=agent)
+
+
+def test_visit_sync_only_emits_new_visits():
+    client = FakeClient()
+    sync = VisitSync(client, MemoryCursorStore())
+    client.visits = [_visit(1), _visit(2), _visit(2, "other")]
+    assert len(list(sync.tag_visits("a"))) == 3
+
+    client.visits += [_visit(2, "late"), _visit(3)]
+    assert [v.userAgent for v in sync.tag_visits("a")] == ["ua", "late"]
+    assert client.calls[-1] == START + timedelta(seconds=2)
+    assert list(sync.tag_visits("a")) == []
+
+
+def test_visit_sync_keeps_duplicate_visits_at_the_boundary():
+    client = FakeClient()
+    sync = VisitSync(client, MemoryCursorStore())
+    client.visits = [_visit(1)]
+    assert len(list(sync.tag_visits("a"))) == 1
+    client.visits.append(_visit(1))
+    assert len(list(sync.tag_visits("a"))) == 1
+
+
+def test_visit_sync_saves_cursor_only_when_exhausted():
+    client = FakeClient()
+    store = MemoryCursorStore()
+    client.visits = [_visit(1), _visit(2)]
+    next(VisitSync(client, store).tag_visits("a"))
+    assert store.get("tag:a") is None
+
+
+@pytest.mark.parametrize("make_store", [JSONCursorStore, SQLiteCursorStore])
+def test_cursor_stores_round_trip(tmp_path, make_store):
+    store = make_store(str(tmp_path / "cursors"))
+    assert store.get("orphan") is None
+    cursor = Cursor(date=START, keys={"abc": 2})
+    store.set("orphan", cursor)
+    store.set("tag:a", Cursor(date=START))
+    assert store.get("orphan") == cursor
@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+
+from shlink.client.transport import AsyncHttpxTransport, HttpxTransport, RequestsTransport
+
+
+def test_requests_transport_options():
+    transport = RequestsTransport(pool_maxsize=4, pool_block=True, connect_timeout=2.0, read_timeout=30.0)
+    assert transport.timeout == (2.0, 30.0)
+    assert transport.adapter._pool_maxsize == 4
+    assert transport.adapter._pool_block
+    assert transport.session.adapters["https://"] is transport.adapter
+    transport.close()
+    with pytest.raises(RuntimeError):
+        transport.request("GET", "https://s.test/")
+
+
+def _pool_options(session):
+    pool = session._transport._pool
+    return pool._max_connections, pool._max_keepalive_connections, pool._keepalive_expiry, pool._http2
+
+
+def test_httpx_transport_options():
+    pytest.importorskip("httpx")
+    transport = HttpxTransport(
+        max_connections=8, max_keepalive_connections=2, keepalive_expiry=1.0, connect_timeout=2.0, read_timeout=30.0
+    )
+    # HTTP/2 needs `h2`, which the `async` extra doesn't install
+    assert _pool_options(transport.session) == (8, 2, 1.0, False)
+    assert (transport.session.timeout.connect, transport.session.timeout.read) == (2.0, 30.0)
+    transport.close()
+
+
+def test_httpx_transport_http2_needs_h2():
+    pytest.importorskip("httpx")
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        with pytest.raises(ImportError, match="h2"):
+            HttpxTransport(http2=True)
+    else:
+        transport = HttpxTransport(http2=True)
+        assert _pool_options(transport.session)[3]
+        transport.close()
+
+
+def test_async_httpx_transport_options():
+    pytest.importorskip("httpx")
+    transport = AsyncHttpxTransport(max_connections=8, max_keepalive_connections=2, connect_timeout=2.0)
+    assert _pool_options(transport.session) == (8, 2, 5.0, False)
+    assert transport.session.timeout.connect == 2.0
+    asyncio.run(transport.close())